@@ -0,0 +1,2 @@
+"""Benchmarks for tgre. Run them from the repository root, for example
+with ``python -m benchmarks.pickling``."""
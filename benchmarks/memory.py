@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+"""Measure the memory used to read, build, and write TextGrids.
+
+Each case is run on synthetic TextGrids (see `synthetic.py`) of several
+sizes while `tracemalloc` traces every allocation. The peak is the most
+memory in use at once while the case ran, and retained is the memory
+still held by its result afterwards (such as the parsed TextGrid, or
+the text written by `to_praat()`). Both are reported in bytes per item.
+
+Run from the repository root with ``python -m benchmarks.memory``. With
+``--check``, the command exits with an error if any case uses more
+bytes per item than its budget in `BUDGETS` for the style of label
+text, so it can be run in CI to catch memory regressions.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+import tgre
+
+from .synthetic import STYLES, make_textgrid
+
+
+# Largest peak and retained bytes per item allowed for each case, for
+# each style of label, about half again the largest value measured on
+# CPython 3.11 at the default sizes.
+BUDGETS = {
+    'ascii': {
+        'from_file': (470, 375),
+        'from_file stream': (400, 255),
+        'construct': (170, 160),
+        'to_praat': (200, 85),
+        'to_dict': (270, 265),
+    },
+    'unicode': {
+        'from_file': (675, 500),
+        'from_file stream': (470, 300),
+        'construct': (170, 160),
+        'to_praat': (325, 165),
+        'to_dict': (270, 265),
+    },
+    'quotes': {
+        'from_file': (525, 420),
+        'from_file stream': (420, 295),
+        'construct': (170, 160),
+        'to_praat': (220, 100),
+        'to_dict': (270, 265),
+    },
+}
+
+
+def measure(func):
+    """Return the peak and retained bytes allocated by calling `func()`."""
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+        del result
+
+    finally:
+        tracemalloc.stop()
+
+    return peak - before, current - before
+
+
+def cases(tg, path):
+    """Yield the name, function, and number of items of each case.
+
+    Parameters
+    ----------
+    tg : TextGrid
+
+    path : str
+        Path to a file with `tg` written to it.
+
+    """
+
+    n_items = sum(len(tier) for tier in tg)
+    tier = tg[len(tg) - 1]
+
+    for candidate in tg:
+        if isinstance(candidate, tgre.IntervalTier):
+            tier = candidate
+
+    rows = [(item.xmin, item.xmax, item.text) for item in tier]
+
+    yield 'from_file', lambda: tgre.TextGrid.from_file(path), n_items
+
+    yield ('from_file stream',
+           lambda: tgre.TextGrid.from_file(path, keep_source=False), n_items)
+
+    yield ('construct',
+           lambda: tgre.IntervalTier(tier.name, tier.xmin, tier.xmax,
+                                     [tgre.Interval(*row) for row in rows]),
+           len(rows))
+
+    yield 'to_praat', tg.to_praat, n_items
+
+    yield 'to_dict', tg.to_dict, n_items
+
+
+def run(sizes, seed=0, **kwargs):
+    """Measure each case at each size, and return a list of results.
+
+    Parameters
+    ----------
+    sizes : list of int
+        Sizes of the TextGrids, passed to `make_textgrid()`.
+
+    seed : int
+        Seed for the TextGrids. Default is 0.
+
+    **kwargs
+        Passed to `make_textgrid()`.
+
+    Returns
+    -------
+    list of dict
+        The name, size, number of items, and the peak and retained
+        bytes (in total and per item) of each case at each size.
+
+    """
+
+    results = []
+    directory = tempfile.mkdtemp()
+
+    try:
+        for size in sizes:
+            tg = make_textgrid(size, seed=seed, **kwargs)
+            path = os.path.join(directory, '{}.TextGrid'.format(size))
+            tg.to_praat(path)
+
+            for name, func, n in cases(tg, path):
+                peak, retained = measure(func)
+                results.append({'name': name, 'size': size, 'items': n,
+                                'peak': peak, 'retained': retained,
+                                'peak_per_item': peak / n,
+                                'retained_per_item': retained / n})
+
+    finally:
+        shutil.rmtree(directory)
+
+    return results
+
+
+def check(results, budgets=BUDGETS['ascii']):
+    """Raise AssertionError if any result uses more memory than its budget.
+
+    Parameters
+    ----------
+    results : list of dict
+        Results from `run()`.
+
+    budgets : dict
+        Largest (peak, retained) bytes per item for each case. Cases
+        without a budget aren't checked. Default is the budgets in
+        `BUDGETS` for the 'ascii' style.
+
+    """
+
+    failures = []
+
+    for res in results:
+        if res['name'] not in budgets:
+            continue
+
+        peak, retained = budgets[res['name']]
+
+        for key, budget in (('peak', peak), ('retained', retained)):
+            value = res[key + '_per_item']
+
+            if value > budget:
+                failures.append('{} at size {}: {:.0f} {} bytes per item '
+                                '(budget {})'.format(res['name'], res['size'],
+                                                     value, key, budget))
+
+    if failures:
+        raise AssertionError('Memory budgets exceeded:\n'
+                             + '\n'.join(failures))
+
+
+def report(results):
+    """Print a table of memory results."""
+
+    print('{:<18} {:>8} {:>8} {:>12} {:>12} {:>10} {:>10}'
+          .format('case', 'size', 'items', 'peak', 'retained', 'peak/item',
+                  'kept/item'))
+
+    for res in sorted(results, key=lambda res: res['name']):
+        print('{:<18} {:>8} {:>8} {:>12} {:>12} {:>10.1f} {:>10.1f}'
+              .format(res['name'], res['size'], res['items'], res['peak'],
+                      res['retained'], res['peak_per_item'],
+                      res['retained_per_item']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.memory',
+        description='Measure the memory tgre uses on synthetic TextGrids.')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1000, 10000, 100000],
+                        help='intervals in the largest tier '
+                             '(default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--style', choices=sorted(STYLES), default='ascii',
+                        help='kind of label text (default: %(default)s)')
+    parser.add_argument('--labels', type=int, default=8,
+                        help='number of distinct labels '
+                             '(default: %(default)s)')
+    parser.add_argument('--check', action='store_true',
+                        help='exit with an error if a budget is exceeded')
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.seed, n_labels=args.labels,
+                  style=args.style)
+    report(results)
+
+    if args.check:
+        try:
+            check(results, BUDGETS[args.style])
+
+        except AssertionError as e:
+            print(e, file=sys.stderr)
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the compact pickling of TextGrids with default pickling.
+
+Default pickling is emulated with a pickler that stores every TextGrid,
+tier, and item with its instance `__dict__`, which is what `pickle` does
+for classes that don't define `__reduce__`.
+
+Run from the repository root with ``python -m benchmarks.pickling``.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import copyreg
+import io
+import pickle
+import timeit
+
+import tgre
+from tgre.tgre import Tier
+
+from .synthetic import make_textgrid
+
+
+class DefaultPickler(pickle.Pickler):
+    """Pickler that ignores the `__reduce__` methods defined by tgre."""
+
+    def reducer_override(self, obj):
+        if isinstance(obj, (tgre.TextGrid, Tier, tgre.Interval, tgre.Point)):
+            return copyreg.__newobj__, (type(obj),), vars(obj)
+
+        return NotImplemented
+
+
+def default_dumps(obj):
+    buf = io.BytesIO()
+    DefaultPickler(buf, pickle.HIGHEST_PROTOCOL).dump(obj)
+    return buf.getvalue()
+
+
+def compact_dumps(obj):
+    return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+
+def main(sizes=(1000, 10000, 100000), repeat=5):
+    print('{:>8} {:>8} {:>12} {:>12} {:>10} {:>10}'
+          .format('items', 'method', 'bytes', 'bytes/item', 'dumps ms',
+                  'loads ms'))
+
+    for size in sizes:
+        tg = make_textgrid(size)
+        n_items = sum(len(tier) for tier in tg)
+
+        for method, dumps in (('default', default_dumps),
+                              ('compact', compact_dumps)):
+            data = dumps(tg)
+            dump_time = min(timeit.repeat(lambda: dumps(tg), number=1,
+                                          repeat=repeat))
+            load_time = min(timeit.repeat(lambda: pickle.loads(data),
+                                          number=1, repeat=repeat))
+
+            print('{:>8} {:>8} {:>12} {:>12.1f} {:>10.2f} {:>10.2f}'
+                  .format(n_items, method, len(data), len(data) / n_items,
+                          dump_time * 1000, load_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+"""Time reading, writing, lookups, insertion, and export of TextGrids.
+
+Each benchmark is run on synthetic TextGrids (see `synthetic.py`) of
+several sizes, and the best of several runs is reported with the
+number of items (or queries) handled per second. The scaling column is
+the exponent k in time ~ size**k between each size and the one before
+it. For benchmarks that handle every item, 1 is linear, and values well
+above 1 show a superlinear slowdown. For lookups, which make the same
+number of queries at each size, values near 0 show that each query
+takes about the same time however large the tier is.
+
+Run from the repository root with ``python -m benchmarks.suite``, or
+see ``python -m benchmarks.suite --help`` for options such as the sizes
+and the kind of labels.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import collections
+import io
+import json
+import math
+import pickle
+import random
+import timeit
+
+import tgre
+from tgre import jsonl
+
+from .synthetic import STYLES, make_textgrid
+
+
+N_QUERIES = 1000
+
+
+def _consume(iterator):
+    collections.deque(iterator, maxlen=0)
+
+
+def cases(tg, seed=0):
+    """Yield the benchmarks for a TextGrid.
+
+    Parameters
+    ----------
+    tg : TextGrid
+        TextGrid with at least one interval tier and one point tier.
+
+    seed : int
+        Seed for the random query times. Default is 0.
+
+    Yields
+    ------
+    tuple of (str, function, function, int)
+        The name of each benchmark, a function that returns the
+        benchmark's input, a function that runs the benchmark on that
+        input, and the number of items or queries handled in each run.
+
+    """
+
+    rng = random.Random(seed)
+    n_items = sum(len(tier) for tier in tg)
+    text = tg.to_praat()
+    data = text.encode('utf_8')
+
+    intervals = [tier for tier in tg if isinstance(tier, tgre.IntervalTier)]
+    points = [tier for tier in tg if isinstance(tier, tgre.TextTier)]
+    tier = intervals[-1]
+    point_tier = points[0]
+
+    times = [rng.uniform(tg.xmin, tg.xmax) for i in range(N_QUERIES)]
+    labels = sorted(set(item.text for item in tier))
+    parsed = tgre.TextGrid.from_bytes(data)
+
+    def none():
+        return None
+
+    yield ('tokenize', none,
+           lambda state: _consume(tgre.praat_reader(text)), n_items)
+
+    yield ('parse', none,
+           lambda state: tgre.TextGrid.from_bytes(data), n_items)
+
+    yield ('parse stream', none,
+           lambda state: tgre.TextGrid.from_file(io.BytesIO(data),
+                                                 keep_source=False),
+           n_items)
+
+    yield ('construct', lambda: list(tier),
+           lambda items: tgre.IntervalTier(tier.name, tier.xmin, tier.xmax,
+                                           items),
+           len(tier))
+
+    yield ('to_praat', none, lambda state: tg.to_praat(), n_items)
+
+    yield ('to_praat source', none, lambda state: parsed.to_praat(), n_items)
+
+    yield ('where interval', none,
+           lambda state: [tier.where(time) for time in times], N_QUERIES)
+
+    yield ('where point', none,
+           lambda state: [point_tier.where(time) for time in times],
+           N_QUERIES)
+
+    tier.find('')
+    yield ('find', none,
+           lambda state: [tier.find(label) for label in labels], len(labels))
+
+    def point_copy():
+        return tgre.TextTier(point_tier.name, point_tier.xmin,
+                             point_tier.xmax,
+                             [tgre.Point(point.number, point.mark)
+                              for point in point_tier])
+
+    def insert(state):
+        for time in times:
+            state.insert(time, 'x')
+
+    yield ('insert', point_copy, insert, N_QUERIES)
+
+    yield ('to_dict', none, lambda state: tg.to_dict(), n_items)
+
+    yield ('jsonl', none, lambda state: _consume(jsonl.records(tg)), n_items)
+
+    yield ('pickle', none,
+           lambda state: pickle.dumps(tg, pickle.HIGHEST_PROTOCOL), n_items)
+
+    try:
+        import numpy  # noqa: F401
+
+    except ImportError:
+        return
+
+    yield ('to_numpy', none, lambda state: tg.to_numpy(), n_items)
+
+
+def best_time(setup, func, repeat=5):
+    """Return the shortest time in seconds to run `func(setup())`."""
+
+    best = None
+
+    for i in range(repeat):
+        state = setup()
+        start = timeit.default_timer()
+        func(state)
+        elapsed = timeit.default_timer() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def run(sizes, repeat=5, seed=0, only=None, **kwargs):
+    """Run the benchmarks for each size, and return a list of results.
+
+    Parameters
+    ----------
+    sizes : list of int
+        Sizes of the TextGrids, passed to `make_textgrid()`.
+
+    repeat : int
+        Number of runs of each benchmark. Default is 5.
+
+    seed : int
+        Seed for the TextGrids and queries. Default is 0.
+
+    only : list of str, optional
+        Names of the benchmarks to run. Default is None (all).
+
+    **kwargs
+        Passed to `make_textgrid()`.
+
+    Returns
+    -------
+    list of dict
+        The name, size, number of items, time in seconds, items per
+        second, and scaling exponent of each benchmark at each size.
+
+    """
+
+    results = []
+    previous = {}
+
+    for size in sizes:
+        tg = make_textgrid(size, seed=seed, **kwargs)
+
+        for name, setup, func, n in cases(tg, seed):
+            if only and name not in only:
+                continue
+
+            elapsed = best_time(setup, func, repeat)
+            scaling = None
+
+            if name in previous:
+                prev_size, prev_elapsed = previous[name]
+
+                if size != prev_size and prev_elapsed > 0 and elapsed > 0:
+                    scaling = (math.log(elapsed / prev_elapsed)
+                               / math.log(size / prev_size))
+
+            previous[name] = size, elapsed
+            results.append({'name': name, 'size': size, 'items': n,
+                            'seconds': elapsed,
+                            'per_second': n / elapsed if elapsed else None,
+                            'scaling': scaling})
+
+    return results
+
+
+def report(results):
+    """Print a table of benchmark results."""
+
+    print('{:<16} {:>8} {:>8} {:>10} {:>12} {:>8}'
+          .format('benchmark', 'size', 'items', 'ms', 'items/s', 'scaling'))
+
+    for res in sorted(results, key=lambda res: res['name']):
+        scaling = ('' if res['scaling'] is None
+                   else '{:.2f}'.format(res['scaling']))
+        per_second = ('' if res['per_second'] is None
+                      else '{:.0f}'.format(res['per_second']))
+
+        print('{:<16} {:>8} {:>8} {:>10.2f} {:>12} {:>8}'
+              .format(res['name'], res['size'], res['items'],
+                      res['seconds'] * 1000, per_second, scaling))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.suite',
+        description='Time tgre on synthetic TextGrids.')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1000, 10000, 100000],
+                        help='intervals in the largest tier '
+                             '(default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='runs of each benchmark (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--style', choices=sorted(STYLES), default='ascii',
+                        help='kind of label text (default: %(default)s)')
+    parser.add_argument('--labels', type=int, default=8,
+                        help='number of distinct labels '
+                             '(default: %(default)s)')
+    parser.add_argument('--interval-tiers', type=int, default=2)
+    parser.add_argument('--point-tiers', type=int, default=1)
+    parser.add_argument('--only', nargs='+', metavar='NAME',
+                        help='names of the benchmarks to run')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as JSON')
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, args.seed, args.only,
+                  interval_tiers=args.interval_tiers,
+                  point_tiers=max(1, args.point_tiers),
+                  n_labels=args.labels, style=args.style)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    else:
+        report(results)
+
+
+if __name__ == '__main__':
+    main()
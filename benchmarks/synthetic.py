@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""Make synthetic TextGrids of any size for benchmarks.
+
+Every TextGrid is made from a seed, so the same arguments always give
+the same TextGrid, and benchmarks can be compared between runs and
+between versions of tgre.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import random
+
+import tgre
+
+
+# Label styles: plain ASCII phone labels, labels with non-ASCII
+# characters from several scripts, and labels with quotes, which are
+# doubled when the TextGrid is written.
+STYLES = {
+    'ascii': ['AA1', 'B', 'K', 'IY0', 'S', 'T', 'sil', 'NG', 'ER0', 'DH'],
+    'unicode': ['ʃə', 'ŋ', 'naïve', 'ü', 'ʔa', 'ç', 'θ', '日本', 'ㄅ', 'ø'],
+    'quotes': ['"', 'say ""hi""', '"quoted"', "it's", 'a"b', '""', 'x "y" z',
+               '"""', 'q"', '"q'],
+}
+
+
+def make_labels(n_labels, style='ascii'):
+    """Return a list of distinct labels, including the empty label.
+
+    Parameters
+    ----------
+    n_labels : int
+        Number of labels.
+
+    style : {'ascii', 'unicode', 'quotes'}
+        Kind of text in the labels. Default is 'ascii'.
+
+    Returns
+    -------
+    list of str
+
+    """
+
+    bases = STYLES[style]
+    labels = ['']
+
+    for i in range(n_labels - 1):
+        base = bases[i % len(bases)]
+        labels.append(base if i < len(bases) else
+                      '{}{}'.format(base, i // len(bases)))
+
+    return labels
+
+
+def make_textgrid(size, seed=0, interval_tiers=2, point_tiers=1,
+                  n_labels=8, style='ascii'):
+    """Return a TextGrid with random intervals and points.
+
+    The last interval tier has `size` intervals, and each interval tier
+    before it has a quarter as many, like a phone tier below a word
+    tier. Intervals in each tier fill the whole TextGrid, which lasts
+    `size` seconds. Each point tier has a quarter as many points as
+    `size`.
+
+    Parameters
+    ----------
+    size : int
+        Number of intervals in the last interval tier.
+
+    seed : int
+        Seed for the random times and labels. Default is 0.
+
+    interval_tiers : int
+        Number of interval tiers. Default is 2.
+
+    point_tiers : int
+        Number of point tiers. Default is 1.
+
+    n_labels : int
+        Number of distinct labels. Default is 8.
+
+    style : {'ascii', 'unicode', 'quotes'}
+        Kind of text in the labels. Default is 'ascii'.
+
+    Returns
+    -------
+    TextGrid
+
+    """
+
+    rng = random.Random(seed)
+    labels = make_labels(n_labels, style)
+    tiers = []
+
+    for i in range(interval_tiers):
+        n = max(1, size // 4 ** (interval_tiers - 1 - i))
+        times = sorted(rng.uniform(0, size) for j in range(n - 1))
+        bounds = [0] + times + [size]
+        items = [tgre.Interval(a, b, rng.choice(labels))
+                 for a, b in zip(bounds, bounds[1:])]
+        tiers.append(tgre.IntervalTier('intervals{}'.format(i), 0, size,
+                                       items))
+
+    for i in range(point_tiers):
+        times = sorted(set(rng.uniform(0, size) for j in range(size // 4)))
+        points = [tgre.Point(t, rng.choice(labels)) for t in times]
+        tiers.append(tgre.TextTier('points{}'.format(i), 0, size, points))
+
+    return tgre.TextGrid(0, size, tiers)
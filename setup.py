@@ -28,6 +28,8 @@ setup(name='tgre',
       keywords='TextGrid Praat speech linguistics',
       packages=['tgre'],
       include_package_data=True,
+      extras_require={'numpy': ['numpy']},
+      entry_points={'console_scripts': ['tgre = tgre.cli:main']},
       test_suite='nose.collector',
       tests_require=['nose', 'mock']
       )
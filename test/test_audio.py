@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import shutil
+import tempfile
+import unittest
+import wave
+
+from nose.tools import *
+
+try:
+    import numpy as np
+
+except ImportError:
+    raise unittest.SkipTest('NumPy is not installed')
+
+from tgre import IntervalTier, Interval
+from tgre.audio import WavFile
+
+
+class TestWavFile(object):
+    @classmethod
+    def setup_class(cls):
+        cls.tmp = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.tmp, 'test.wav')
+
+        cls.samples = np.arange(2000, dtype='<i2').reshape(1000, 2)
+
+        writer = wave.open(cls.path, 'wb')
+        writer.setnchannels(2)
+        writer.setsampwidth(2)
+        writer.setframerate(1000)
+        writer.writeframes(cls.samples.tobytes())
+        writer.close()
+
+        cls.wav = WavFile(cls.path)
+        cls.tier = IntervalTier('abc', 0, 1, [Interval(0, 0.25, 'a'),
+                                              Interval(0.25, 0.5, 'b'),
+                                              Interval(0.75, 1, 'a')])
+
+    @classmethod
+    def teardown_class(cls):
+        del cls.wav
+        shutil.rmtree(cls.tmp)
+
+    def test_header(self):
+        assert_equal(self.wav.rate, 1000)
+        assert_equal(self.wav.n_channels, 2)
+        assert_equal(self.wav.n_samples, 1000)
+        assert_equal(self.wav.data.shape, (1000, 2))
+        assert_true(np.array_equal(self.wav.data, self.samples))
+
+    def test_sample_indices(self):
+        res = self.wav.sample_indices([[0, 0.0004], [0.0006, 2]])
+
+        assert_equal(res.dtype, np.int64)
+        assert_equal(res.tolist(), [[0, 0], [1, 1000]])
+        assert_equal(self.wav.sample_indices([500], rate=2000).tolist(),
+                     [250])
+
+    def test_segment(self):
+        res = self.wav.segment(0.25, 0.5)
+
+        assert_true(np.array_equal(res, self.samples[250:500]))
+        assert_true(np.shares_memory(res, self.wav.data))
+
+    def test_segment_ticks(self):
+        res = self.wav.segment(1000, 2000, rate=4000)
+
+        assert_true(np.array_equal(res, self.samples[250:500]))
+
+    def test_segments(self):
+        res = list(self.wav.segments(self.tier))
+
+        assert_equal([interval for interval, samples in res], self.tier[:])
+        assert_true(np.array_equal(res[2][1], self.samples[750:1000]))
+
+    def test_segments_label(self):
+        res = list(self.wav.segments(self.tier, label='a'))
+
+        assert_equal([interval.xmin for interval, samples in res], [0, 0.75])
+        assert_equal([samples.shape for interval, samples in res],
+                     [(250, 2), (250, 2)])
+
+        assert_equal(list(self.wav.segments(self.tier, label='z')), [])
+
+    def test_segments_ticks(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0, 0.25, 'a')])
+        tier.to_ticks(4000)
+        interval, samples = next(self.wav.segments(tier))
+
+        assert_equal(samples.shape, (250, 2))
+
+    def test_not_wav(self):
+        with assert_raises(ValueError):
+            WavFile('test/files/intervals.TextGrid')
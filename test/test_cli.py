@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import io
+import json
+import os
+import pickle
+import shutil
+import tempfile
+
+try:
+    import unittest.mock as mock
+except ImportError:
+    import mock
+
+from nose.tools import *
+
+from tgre import TextGrid
+from tgre.cli import find_files, main
+
+
+class TestCli(object):
+    def setup_method(self):
+        self.dir = tempfile.mkdtemp()
+        self.corpus = os.path.join(self.dir, 'corpus')
+        os.makedirs(os.path.join(self.corpus, 'b'))
+
+        shutil.copy('test/files/usage-example.TextGrid',
+                    os.path.join(self.corpus, 'a.TextGrid'))
+        shutil.copy('test/files/one-point.TextGrid',
+                    os.path.join(self.corpus, 'b', 'c.textgrid'))
+
+        with io.open(os.path.join(self.corpus, 'notes.txt'), 'w') as notes:
+            notes.write('not a TextGrid')
+
+        self.report = os.path.join(self.dir, 'report.json')
+        self.output = os.path.join(self.dir, 'output')
+
+    def teardown_method(self):
+        shutil.rmtree(self.dir)
+
+    def add_bad_file(self):
+        path = os.path.join(self.corpus, 'b', 'bad.TextGrid')
+
+        with io.open(path, 'w') as bad_file:
+            bad_file.write('"ooTextFile"\n"TextGrid"\n0 1 <exists> 1\n')
+
+        return path
+
+    def read_report(self):
+        with io.open(self.report, encoding='utf_8') as report_file:
+            return json.load(report_file)
+
+    def test_find_files(self):
+        files = list(find_files([self.corpus,
+                                 'test/files/one-point.TextGrid']))
+
+        assert_equal(files, [
+            (os.path.join(self.corpus, 'a.TextGrid'), 'a.TextGrid'),
+            (os.path.join(self.corpus, 'b', 'c.textgrid'),
+             os.path.join('b', 'c.textgrid')),
+            ('test/files/one-point.TextGrid', 'one-point.TextGrid')])
+
+    def test_validate(self):
+        assert_equal(main(['validate', '-q', '--report', self.report,
+                           self.corpus]), 0)
+
+        report = self.read_report()
+        assert_equal(report['files'], 2)
+        assert_equal(report['counts'], {'ok': 2})
+        assert_equal(report['errors'], [])
+
+    def test_validate_errors(self):
+        bad = self.add_bad_file()
+
+        assert_equal(main(['validate', '-q', '--report', self.report,
+                           self.corpus]), 1)
+
+        report = self.read_report()
+        assert_equal(report['counts'], {'ok': 2, 'error': 1})
+        assert_equal([error['path'] for error in report['errors']], [bad])
+
+    def test_validate_pool(self):
+        self.add_bad_file()
+
+        assert_equal(main(['validate', '-q', '--jobs', '2', '--report',
+                           self.report, self.corpus]), 1)
+        assert_equal(self.read_report()['counts'], {'ok': 2, 'error': 1})
+
+    def test_progress(self):
+        stderr = io.StringIO()
+
+        with mock.patch('sys.stderr', stderr):
+            main(['validate', self.corpus])
+
+        lines = stderr.getvalue().splitlines()
+        assert_equal(len(lines), 2)
+        assert_true(lines[0].startswith('[1/2] '))
+        assert_true(lines[1].endswith('c.textgrid: ok'))
+
+    def test_convert(self):
+        for fmt in ('text', 'json', 'pickle'):
+            main(['convert', '-q', '--to', fmt, '--output', self.output,
+                  self.corpus])
+
+        original = TextGrid.from_file(os.path.join(self.corpus, 'b',
+                                                   'c.textgrid'))
+        stem = os.path.join(self.output, 'b', 'c')
+
+        res = TextGrid.from_file(stem + '.TextGrid')
+        assert_equal(res.to_dict(), original.to_dict())
+
+        with io.open(stem + '.json', encoding='utf_8') as json_file:
+            assert_equal(json.load(json_file), original.to_dict())
+
+        with io.open(stem + '.pickle', 'rb') as pickle_file:
+            assert_equal(pickle.load(pickle_file).to_dict(),
+                         original.to_dict())
+
+    def test_convert_skips_unchanged(self):
+        args = ['convert', '-q', '--to', 'json', '--output', self.output,
+                '--report', self.report, self.corpus]
+
+        main(args)
+        assert_equal(self.read_report()['counts'], {'converted': 2})
+
+        main(args)
+        assert_equal(self.read_report()['counts'], {'skipped': 2})
+
+        path = os.path.join(self.corpus, 'a.TextGrid')
+        mtime = os.path.getmtime(path) + 10
+        os.utime(path, (mtime, mtime))
+
+        main(args)
+        assert_equal(self.read_report()['counts'],
+                     {'converted': 1, 'skipped': 1})
+
+        main(args + ['--force'])
+        assert_equal(self.read_report()['counts'], {'converted': 2})
+
+    def test_stats(self):
+        stdout = io.StringIO()
+
+        with mock.patch('sys.stdout', stdout):
+            assert_equal(main(['stats', '-q', self.corpus]), 0)
+
+        stats = json.loads(stdout.getvalue())
+
+        assert_equal(sorted(stats), ['Metronome', 'Pat', 'Sam', 'bell'])
+        assert_equal(stats['Sam']['labels']['ciao']['count'], 1)
+        assert_almost_equal(stats['Sam']['duration'], 0.325)
+        assert_equal(stats['Metronome']['count'], 3)
+
+    def test_stats_empty_directory(self):
+        empty = os.path.join(self.dir, 'empty')
+        os.makedirs(empty)
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+
+        with mock.patch('sys.stdout', stdout), mock.patch('sys.stderr',
+                                                          stderr):
+            assert_equal(main(['stats', empty]), 0)
+
+        assert_equal(json.loads(stdout.getvalue()), {})
+        assert_equal(stderr.getvalue(), 'No files found\n')
+
+    def test_stats_all_errors(self):
+        bad = self.add_bad_file()
+        stdout = io.StringIO()
+
+        with mock.patch('sys.stdout', stdout):
+            assert_equal(main(['stats', '-q', bad]), 1)
+
+        assert_equal(json.loads(stdout.getvalue()), {})
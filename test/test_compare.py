@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from nose.tools import *
+
+from tgre import TextGrid, IntervalTier, Interval
+from tgre.compare import compare_tiers, compare_textgrids, _match_boundaries
+
+
+def tier(*items):
+    return IntervalTier('words', 0, 4, [Interval(*item) for item in items])
+
+
+class TestMatchBoundaries(object):
+    def test_match(self):
+        assert_equal(_match_boundaries([0, 1, 2], [0, 1.25, 2.125], 0.25),
+                     [(0, 0), (1, 1.25), (2, 2.125)])
+
+    def test_unmatched(self):
+        assert_equal(_match_boundaries([0, 1, 3], [0, 2, 3.5], 0.25),
+                     [(0, 0)])
+
+    def test_nearest(self):
+        assert_equal(_match_boundaries([1], [0.875, 1, 1.125], 0.25),
+                     [(1, 1)])
+        assert_equal(_match_boundaries([0.875, 1], [1], 0.25), [(1, 1)])
+
+
+class TestCompareTiers(object):
+    def test_identical(self):
+        ref = tier((0, 1, 'a'), (1, 2, 'b'))
+        res = compare_tiers(ref, ref)
+
+        assert_equal(res.matches, [(ref[0], ref[0]), (ref[1], ref[1])])
+        assert_equal(res.offsets, [0, 0, 0])
+        assert_equal(res.mismatches, [])
+        assert_equal(res.agreement, 1)
+
+    def test_offsets_and_mismatches(self):
+        ref = tier((0, 1, 'a'), (1, 2, 'b'))
+        other = tier((0, 1.0625, 'a'), (1.0625, 2, 'c'))
+        res = compare_tiers(ref, other, tolerance=0.125)
+
+        assert_equal(res.offsets, [0, 0.0625, 0])
+        assert_equal(res.mismatches, [(ref[1], other[1])])
+        assert_equal(res.deletions, [])
+        assert_equal(res.insertions, [])
+        assert_equal(res.overlap, 1)
+        assert_equal(res.union, 2)
+        assert_equal(res.agreement, 0.5)
+
+    def test_insertions_and_deletions(self):
+        ref = tier((0, 1, 'a'), (1, 2, 'b'), (3, 4, 'd'))
+        other = tier((0, 1, 'a'), (1, 1.5, 'b'), (1.5, 2, 'c'), (3, 4, 'd'))
+        res = compare_tiers(ref, other)
+
+        assert_equal(res.matches, [(ref[0], other[0]), (ref[2], other[3])])
+        assert_equal(res.deletions, [ref[1]])
+        assert_equal(res.insertions, [other[1], other[2]])
+        assert_equal(res.agreement, 2.5 / 3)
+
+    def test_ignore_empty(self):
+        ref = tier((0, 1, ''), (1, 2, 'b'))
+        other = tier((0, 1.5, ''), (1.5, 2, 'b'))
+
+        assert_equal(compare_tiers(ref, other).agreement, 0.5)
+        assert_equal(len(compare_tiers(ref, other).matches), 0)
+        assert_equal(compare_tiers(ref, other, ignore_empty=False).agreement,
+                     0.75)
+
+    def test_ticks(self):
+        ref = tier((0, 1, 'a'), (1, 2, 'b'))
+        other = tier((0, 1.01, 'a'), (1.01, 2, 'b'))
+        ref.to_ticks(16000)
+        other.to_ticks(16000)
+        res = compare_tiers(ref, other)
+
+        assert_equal(res.offsets, [0, 160, 0])
+        assert_equal(res.overlap, 31840)
+        assert_equal(len(compare_tiers(ref, other, tolerance=100).matches), 0)
+
+    def test_different_rates(self):
+        ref = tier((0, 1, 'a'))
+        other = tier((0, 1, 'a'))
+        ref.to_ticks(16000)
+
+        with assert_raises(ValueError):
+            compare_tiers(ref, other)
+
+    def test_empty_tiers(self):
+        res = compare_tiers(tier(), tier())
+
+        assert_equal(res.matches, [])
+        assert_equal(res.agreement, 1)
+
+
+class TestCompareTextGrids(object):
+    def test_compare(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        other = TextGrid(0, 2.5, [tier((0, 1, 'x')), tg[1], tg[2]])
+
+        res = compare_textgrids(tg, other)
+
+        assert_equal(sorted(res), ['Sam'])
+        assert_equal(res['Sam'].agreement, 1)
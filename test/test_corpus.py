@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+
+from nose.tools import *
+
+from tgre import TextGrid
+from tgre.corpus import iter_archive
+
+
+class TestIterArchive(object):
+    names = ['intervals.TextGrid', 'one-point.TextGrid',
+             'usage-example.TextGrid']
+
+    @classmethod
+    def setup_class(cls):
+        cls.tmp = tempfile.mkdtemp()
+
+        cls.zip_path = os.path.join(cls.tmp, 'corpus.zip')
+
+        with zipfile.ZipFile(cls.zip_path, 'w') as archive:
+            for name in cls.names:
+                archive.write(os.path.join('test/files', name),
+                              'corpus/' + name)
+
+            archive.writestr('corpus/README.txt', 'not a TextGrid')
+
+        cls.tar_path = os.path.join(cls.tmp, 'corpus.tar.gz')
+
+        with tarfile.open(cls.tar_path, 'w:gz') as archive:
+            for name in cls.names:
+                archive.add(os.path.join('test/files', name),
+                            'corpus/' + name)
+
+    @classmethod
+    def teardown_class(cls):
+        shutil.rmtree(cls.tmp)
+
+    def check(self, path):
+        res = list(iter_archive(path))
+
+        assert_equal([name for name, tg in res],
+                     ['corpus/' + name for name in self.names])
+
+        for name, tg in res:
+            expected = TextGrid.from_file('test/files/' + name.split('/')[1])
+            assert_equal(tg.to_dict(), expected.to_dict())
+            assert_equal(tg.to_praat(), expected.to_praat())
+
+    def test_zip(self):
+        self.check(self.zip_path)
+
+    def test_tar(self):
+        self.check(self.tar_path)
+
+    def test_pattern(self):
+        res = list(iter_archive(self.zip_path, pattern='*/one-*.textgrid',
+                                keep_source=False))
+
+        assert_equal(len(res), 1)
+        assert_equal(res[0][0], 'corpus/one-point.TextGrid')
+        assert_equal(res[0][1][0][0].mark, 'asdf')
+
+    def test_not_an_archive(self):
+        with assert_raises(ValueError):
+            list(iter_archive('test/files/one-point.TextGrid'))
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import shutil
+import tempfile
+
+from nose.tools import *
+
+from tgre import TextGrid, IntervalTier, Interval, Point
+from tgre.index import CorpusIndex
+
+
+class TestCorpusIndex(object):
+    names = ['intervals.TextGrid', 'one-point.TextGrid',
+             'usage-example.TextGrid']
+
+    def setup_method(self):
+        self.tmp = tempfile.mkdtemp()
+        self.paths = []
+
+        for name in self.names:
+            path = os.path.join(self.tmp, name)
+            shutil.copy(os.path.join('test/files', name), path)
+            self.paths.append(path)
+
+        self.index = CorpusIndex(os.path.join(self.tmp, 'corpus.sqlite'))
+        self.index.update(self.paths)
+
+    def teardown_method(self):
+        self.index.close()
+        shutil.rmtree(self.tmp)
+
+    def test_files(self):
+        assert_equal(self.index.files(), sorted(self.paths))
+
+    def test_intervals(self):
+        res = self.index.intervals(text='ciao')
+
+        assert_equal(len(res), 2)
+        assert_is_instance(res[0], Interval)
+        assert_equal((res[0].xmin, res[0].xmax, res[0].text),
+                     (1.125, 1.45, 'ciao'))
+
+    def test_intervals_rows(self):
+        path = os.path.join(self.tmp, 'usage-example.TextGrid')
+        row, = self.index.intervals(text='ciao', file=path, rows=True)
+
+        assert_equal(row['file'], path)
+        assert_equal(row['tier'], 'Sam')
+        assert_equal(row['position'], 1)
+        assert_equal(row['xmax'], 1.45)
+
+    def test_intervals_match_textgrid(self):
+        path = os.path.join(self.tmp, 'usage-example.TextGrid')
+        tg = TextGrid.from_file(path)
+
+        for tier in tg.tiers[:2]:
+            res = self.index.intervals(tier=tier.name, file=path)
+            assert_equal([vars(item) for item in res],
+                         [vars(item) for item in tier])
+
+    def test_intervals_pattern(self):
+        res = self.index.intervals(pattern='^(hel|cia)',
+                                   file=self.paths[2])
+
+        assert_equal([item.text for item in res], ['hello', 'ciao'])
+
+    def test_intervals_within(self):
+        res = self.index.intervals(file=self.paths[2], start=0, end=1.45)
+
+        assert_equal([(item.xmin, item.xmax) for item in res],
+                     [(0, 0.65), (0, 1.125), (1.125, 1.45)])
+
+    def test_points(self):
+        res = self.index.points(tier='bell')
+
+        assert_equal(len(res), 1)
+        assert_is_instance(res[0], Point)
+        assert_equal((res[0].number, res[0].mark), (0.5, 'asdf'))
+
+        assert_equal(len(self.index.points(start=0.75, end=1.5)), 2)
+
+    def test_update_unchanged(self):
+        assert_equal(self.index.update(self.paths), 0)
+
+    def test_update_changed(self):
+        path = self.paths[1]
+        tg = TextGrid.from_file(path)
+        tg.tiers.append(IntervalTier('new', 0, 1, [Interval(0, 1, 'xyz')]))
+        tg.to_praat(path)
+
+        assert_equal(self.index.update(self.paths), 1)
+        assert_equal(len(self.index.intervals(text='xyz')), 1)
+        assert_equal(len(self.index.points(file=path)), 1)
+
+    def test_update_commits_once(self):
+        paths = [os.path.join('test/files', name) for name in self.names]
+        statements = []
+        self.index.connection.set_trace_callback(statements.append)
+
+        assert_equal(self.index.update(paths), 3)
+        assert_equal(statements.count('COMMIT'), 1)
+
+    def test_update_relative_path(self):
+        cwd = os.getcwd()
+        os.chdir(self.tmp)
+
+        try:
+            assert_equal(self.index.update(self.names), 0)
+            assert_equal(len(self.index.points(file=self.names[1])), 1)
+
+        finally:
+            os.chdir(cwd)
+
+        assert_equal(self.index.files(), sorted(self.paths))
+
+    def test_update_error_keeps_earlier_files(self):
+        path = os.path.join(self.tmp, 'bad.TextGrid')
+
+        with open(path, 'w') as bad_file:
+            bad_file.write('File type = "ooTextFile"\n'
+                           'Object class = "Pitch"\n')
+
+        index = CorpusIndex(':memory:')
+
+        with assert_raises(ValueError):
+            index.update([self.paths[0], path, self.paths[1]])
+
+        assert_equal(index.files(), [self.paths[0]])
+        index.close()
+
+    def test_prune(self):
+        os.remove(self.paths[0])
+
+        assert_equal(self.index.prune(), 1)
+        assert_equal(self.index.files(), sorted(self.paths[1:]))
+        assert_equal(self.index.intervals(file=self.paths[0]), [])
+        assert_equal(
+            self.index.connection.execute(
+                'SELECT COUNT(*) FROM intervals').fetchone()[0],
+            len(self.index.intervals()))
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import io
+
+from nose.tools import *
+
+from tgre import TextGrid, IntervalTier, TextTier, Interval, Point
+from tgre import jsonl
+from tgre.packed import PackedIntervalTier
+
+
+class TestRecords(object):
+    def test_records(self):
+        tg = TextGrid(0, 1, [IntervalTier('words', 0, 1,
+                                          [Interval(0, 0.5, 'a')]),
+                             TextTier('bells', 0, 1, [Point(0.5, 'b')])])
+
+        res = list(jsonl.records(tg, file='tg'))
+
+        assert_equal(res, [
+            {'class': 'TextGrid', 'file': 'tg', 'xmin': 0, 'xmax': 1},
+            {'class': 'IntervalTier', 'file': 'tg', 'tier': 0,
+             'name': 'words', 'xmin': 0, 'xmax': 1},
+            {'class': 'Interval', 'file': 'tg', 'tier': 0,
+             'tier_name': 'words', 'xmin': 0, 'xmax': 0.5, 'text': 'a'},
+            {'class': 'TextTier', 'file': 'tg', 'tier': 1,
+             'name': 'bells', 'xmin': 0, 'xmax': 1},
+            {'class': 'Point', 'file': 'tg', 'tier': 1,
+             'tier_name': 'bells', 'number': 0.5, 'mark': 'b'}])
+
+
+class TestFromRecords(object):
+    def test_item_before_tier(self):
+        records = [{'class': 'TextGrid', 'file': None, 'xmin': 0, 'xmax': 1},
+                   {'class': 'Point', 'tier': 0, 'number': 0.5, 'mark': ''}]
+
+        with assert_raises(ValueError):
+            list(jsonl.from_records(records))
+
+    def test_tier_before_textgrid(self):
+        records = [{'class': 'TextTier', 'tier': 0, 'name': 'a',
+                    'xmin': 0, 'xmax': 1}]
+
+        with assert_raises(ValueError):
+            list(jsonl.from_records(records))
+
+    def test_bad_class(self):
+        records = [{'class': 'TextGrid', 'file': None, 'xmin': 0, 'xmax': 1},
+                   {'class': 'Sound'}]
+
+        with assert_raises(ValueError):
+            list(jsonl.from_records(records))
+
+    def test_empty(self):
+        assert_equal(list(jsonl.from_records([])), [])
+
+
+class TestDumpLoad(object):
+    def test_round_trip(self):
+        paths = ['test/files/usage-example.TextGrid',
+                 'test/files/doubled-quotes-in-text-and-mark.TextGrid',
+                 'test/files/interval-tiers-with-empty-tier-and-empty-text.TextGrid']
+        grids = [(path, TextGrid.from_file(path)) for path in paths]
+        grids.append(('numbers', TextGrid.from_file(
+            'test/files/numbers.TextGrid', encoding='utf_16')))
+
+        fp = io.StringIO()
+        jsonl.dump(grids, fp)
+
+        assert_equal(len(fp.getvalue().splitlines()),
+                     sum(len(list(jsonl.records(tg))) for _, tg in grids))
+
+        fp.seek(0)
+        res = list(jsonl.load(fp))
+
+        assert_equal([file for file, _ in res], [file for file, _ in grids])
+
+        for (_, tg), (_, expected) in zip(res, grids):
+            assert_equal(tg.to_dict(), expected.to_dict())
+
+    def test_window_round_trip(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        window = tg.window(1, 1.25)
+        records = list(jsonl.records(window))
+
+        assert_equal(records[1]['class'], 'IntervalTier')
+        assert_equal([(record['xmin'], record['xmax']) for record in records
+                      if record['class'] == 'Interval'],
+                     [(1, 1.25), (1, 1.125), (1.125, 1.25)])
+
+        (file, res), = jsonl.from_records(records)
+
+        assert_equal(res.to_dict(), window.to_dict())
+
+    def test_packed_round_trip(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        packed = TextGrid(tg.xmin, tg.xmax,
+                          [PackedIntervalTier.from_tier(tg[1])])
+        records = list(jsonl.records(packed))
+
+        assert_equal(records[1]['class'], 'IntervalTier')
+
+        (file, res), = jsonl.from_records(records)
+
+        assert_equal(res.to_dict(), packed.to_dict())
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import unittest
+
+from nose.tools import *
+
+try:
+    import numpy as np
+
+except ImportError:
+    raise unittest.SkipTest('NumPy is not installed')
+
+from tgre import TextGrid, IntervalTier, TextTier, Interval, Point
+from tgre.packed import PackedIntervalTier, PackedTextTier
+from tgre.shared import share_tier
+
+
+class TestToNumpy(object):
+    def test_interval_tier(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0, 0.5, 'a'),
+                                          Interval(0.5, 0.6, 'b'),
+                                          Interval(0.75, 1, 'a')])
+        xmin, xmax, codes, vocabulary = tier.to_numpy()
+
+        assert_equal(xmin.dtype, np.float64)
+        assert_equal(codes.dtype, np.int32)
+        assert_equal(xmin.tolist(), [0, 0.5, 0.75])
+        assert_equal(xmax.tolist(), [0.5, 0.6, 1])
+        assert_equal(codes.tolist(), [0, 1, 0])
+        assert_equal(vocabulary, ['a', 'b'])
+
+    def test_text_tier(self):
+        tier = TextTier('abc', 0, 1, [Point(0.5, 'a'), Point(0.75, 'c')])
+        number, codes, vocabulary = tier.to_numpy()
+
+        assert_equal(number.tolist(), [0.5, 0.75])
+        assert_equal(codes.tolist(), [0, 1])
+        assert_equal(vocabulary, ['a', 'c'])
+
+    def test_empty_tier(self):
+        xmin, xmax, codes, vocabulary = IntervalTier('abc', 0, 1).to_numpy()
+
+        assert_equal(len(xmin), 0)
+        assert_equal(len(codes), 0)
+        assert_equal(vocabulary, [])
+
+    def test_textgrid(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        res = tg.to_numpy()
+
+        assert_equal(len(res), 3)
+        assert_equal(res[1][3], ['', 'ciao'])
+        assert_equal(res[2][0].tolist(), [0.75, 1.5, 2.25])
+
+
+class TestPackedNumpy(object):
+    def test_from_numpy(self):
+        xmin = np.array([0, 0.5])
+        xmax = np.array([0.5, 1])
+        codes = np.array([1, 0], dtype=np.int32)
+
+        tier = PackedIntervalTier.from_numpy('abc', 0, 1, xmin, xmax, codes,
+                                             ['a', 'b'])
+
+        assert_equal(tier.where(0.25).text, 'b')
+        assert_equal(tier[1].text, 'a')
+        assert_equal(repr(tier[1]), "Interval(0.5, 1.0, 'a')")
+
+        res = tier.to_numpy()
+
+        assert_true(np.shares_memory(res[0], xmin))
+        assert_true(np.shares_memory(res[2], codes))
+
+    def test_from_numpy_wrong_arrays(self):
+        with assert_raises(TypeError):
+            PackedTextTier.from_numpy('abc', 0, 1, np.array([0.5]),
+                                      np.array([0.6]), np.array([0]), ['a'])
+
+    def test_round_trip(self):
+        tier = TextTier('abc', 0, 1, [Point(0.5, 'a'), Point(0.75, 'c')])
+        packed = PackedTextTier.from_numpy('abc', 0, 1, *tier.to_numpy())
+
+        assert_equal(packed.to_dict()['points'], tier.to_dict()['points'])
+
+    def test_round_trip_ticks(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0, 0.5, 'a'),
+                                          Interval(0.5, 1, 'b')])
+        tier.to_ticks(16000)
+        arrays = tier.to_numpy()
+        packed = PackedIntervalTier.from_numpy('abc', 0, 16000, *arrays,
+                                               rate=16000)
+
+        assert_equal(packed.rate, 16000)
+        assert_equal(repr(packed[1]), "Interval(8000, 16000, 'b')")
+        assert_is_instance(packed[1].xmin, int)
+
+        res = packed.to_numpy()
+
+        assert_equal(res[0].dtype, np.int64)
+        assert_true(np.shares_memory(res[0], arrays[0]))
+        assert_equal(res[1].tolist(), [8000, 16000])
+        assert_equal(packed.to_dict()['intervals'][1],
+                     {'xmin': 0.5, 'xmax': 1, 'text': 'b'})
+
+    def test_from_numpy_unexpected_keyword(self):
+        with assert_raises(TypeError):
+            PackedTextTier.from_numpy('abc', 0, 1, np.array([0.5]),
+                                      np.array([0]), ['a'], ticks=True)
+
+    def test_shared_memory_is_not_copied(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0, 0.5, 'a'),
+                                          Interval(0.5, 1, 'b')])
+        handle = share_tier(tier)
+        attached = handle.attach()
+
+        xmin, xmax, codes, vocabulary = attached.to_numpy()
+
+        assert_true(np.shares_memory(xmin, attached._items.columns[0]))
+        assert_false(xmin.flags.writeable)
+        assert_equal(codes.tolist(), [0, 1])
+
+        del xmin, xmax, codes
+        attached.close()
+        handle.unlink()
+
+
+class TestNearestPositions(object):
+    def test_matches_nearest(self):
+        tier = TextTier('abc', 0, 1, [Point(0.5, 'a'), Point(0.75, 'c'),
+                                      Point(0.8, 'a')])
+        times = np.linspace(-0.5, 1.5, 81)
+        positions = tier.nearest_positions(times)
+
+        assert_equal(positions.dtype, np.int64)
+
+        for time, position in zip(times.tolist(), positions.tolist()):
+            assert_is(tier[position], tier.nearest(time))
+
+    def test_shape(self):
+        tier = TextTier('abc', 0, 1, [Point(0.5, 'a')])
+
+        assert_equal(tier.nearest_positions([[0, 1], [2, 3]]).shape, (2, 2))
+        assert_equal(tier.nearest_positions(0.1).tolist(), 0)
+
+    def test_empty_tier(self):
+        tier = TextTier('abc', 0, 1)
+
+        assert_equal(tier.nearest_positions([0, 1]).tolist(), [-1, -1])
+
+    def test_packed(self):
+        tier = TextTier('abc', 0, 1, [Point(0.5, 'a'), Point(0.75, 'c')])
+        packed = PackedTextTier.from_tier(tier)
+
+        assert_equal(packed.nearest_positions([0.6, 0.7]).tolist(), [0, 1])
+        assert_equal(repr(packed.nearest(0.7)), repr(tier[1]))
+
+
+class TestFrameLabels(object):
+    @classmethod
+    def setup_class(cls):
+        cls.tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+
+    def test_matches_where(self):
+        for hop, offset in ((0.01, None), (0.25, None), (0.03, 0.005),
+                            (0.125, 1)):
+            codes, positions, vocabularies = self.tg.frame_labels(
+                hop, offset, indices=True)
+            start = self.tg.xmin if offset is None else offset
+
+            for frame in range(len(codes)):
+                time = start + frame * hop
+
+                for column in (0, 1):
+                    tier = self.tg[column]
+                    interval = tier.where(time)
+
+                    assert_is(tier[positions[frame, column]], interval)
+                    assert_equal(vocabularies[column][codes[frame, column]],
+                                 interval.text)
+
+    def test_shape(self):
+        codes, vocabularies = self.tg.frame_labels(0.01)
+
+        assert_equal(codes.shape, (250, 3))
+        assert_equal(codes.dtype, np.int32)
+        assert_equal(len(vocabularies), 3)
+
+    def test_points(self):
+        codes, positions, vocabularies = self.tg.frame_labels(
+            0.1, indices=True)
+
+        assert_equal(np.flatnonzero(positions[:, 2] >= 0).tolist(),
+                     [7, 15, 22])
+        assert_equal(positions[[7, 15, 22], 2].tolist(), [0, 1, 2])
+        assert_equal(vocabularies[2][codes[7, 2]], 'click')
+
+    def test_gaps_and_bounds(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0.25, 0.5, 'a')])
+        tg = TextGrid(0, 1, [tier])
+
+        codes, vocabularies = tg.frame_labels(0.25, offset=-0.25,
+                                              n_frames=7)
+
+        assert_equal(codes[:, 0].tolist(), [-1, -1, 0, -1, -1, -1, -1])
+
+    def test_ticks(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        tg.to_ticks(1000)
+
+        res = tg.frame_labels(10, indices=True)
+        expected = self.tg.frame_labels(0.01, indices=True)
+
+        for array, expected_array in zip(res[:2], expected[:2]):
+            assert_true(np.array_equal(array, expected_array))
+
+    def test_no_frames(self):
+        codes, vocabularies = self.tg.frame_labels(0.1, n_frames=0)
+        assert_equal(codes.shape, (0, 3))
+
+    def test_bad_hop(self):
+        with assert_raises(ValueError):
+            self.tg.frame_labels(0)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from nose.tools import *
+
+from tgre import IntervalTier, TextTier, Interval
+from tgre.overlay import union, intersection, flatten
+
+
+def spans(tier):
+    return [(item.xmin, item.xmax, item.text) for item in tier]
+
+
+class TestOverlay(object):
+    @classmethod
+    def setup_class(cls):
+        cls.words = IntervalTier('words', 0, 3, [Interval(0, 1, 'hi'),
+                                                 Interval(1, 1.5, ''),
+                                                 Interval(1.5, 3, 'there')])
+        cls.phones = IntervalTier('phones', 0, 4, [Interval(0, 0.5, 'h'),
+                                                   Interval(0.5, 1, 'ai'),
+                                                   Interval(1.5, 2, 'dh'),
+                                                   Interval(2, 3, 'er'),
+                                                   Interval(3, 4, 'x')])
+
+    def test_union(self):
+        res = union([self.words, self.phones], name='both')
+
+        assert_equal((res.name, res.xmin, res.xmax), ('both', 0, 4))
+        assert_equal(spans(res), [(0, 1, 'hi h ai'),
+                                  (1.5, 4, 'there dh er x')])
+
+    def test_union_overlapping_speakers(self):
+        pat = IntervalTier('Pat', 0, 5, [Interval(0, 2, 'a'),
+                                         Interval(4, 5, 'c')])
+        sam = IntervalTier('Sam', 0, 5, [Interval(1, 3, 'b')])
+
+        assert_equal(spans(union([pat, sam], combine='|'.join)),
+                     [(0, 3, 'a|b'), (4, 5, 'c')])
+
+    def test_intersection(self):
+        res = intersection([self.words, self.phones])
+
+        assert_equal(res.name, 'words')
+        assert_equal(spans(res), [(0, 0.5, 'hi h'), (0.5, 1, 'hi ai'),
+                                  (1.5, 2, 'there dh'), (2, 3, 'there er')])
+
+    def test_intersection_combine(self):
+        res = intersection([self.words, self.phones], combine=tuple)
+        assert_equal(res[0].text, ('hi', 'h'))
+
+    def test_flatten(self):
+        res = flatten([self.words, self.phones], combine='+'.join)
+
+        assert_equal(spans(res), [(0, 0.5, 'hi+h'), (0.5, 1, 'hi+ai'),
+                                  (1.5, 2, 'there+dh'), (2, 3, 'there+er'),
+                                  (3, 4, 'x')])
+        res.check_items()
+
+    def test_single_tier(self):
+        assert_equal(spans(flatten([self.phones])), spans(self.phones))
+        assert_equal(spans(intersection([self.phones])), spans(self.phones))
+
+    def test_bad_tiers(self):
+        with assert_raises(ValueError):
+            union([])
+
+        with assert_raises(TypeError):
+            union([self.words, TextTier('points', 0, 1)])
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import array
+import pickle
+
+from nose.tools import *
+
+from tgre import TextGrid, IntervalTier, TextTier, Interval, Point
+from tgre import praat_reader, tier_from_dict, tier_from_reader
+from tgre.packed import PackedItems, PackedIntervalTier, PackedTextTier
+
+
+class TestPackedItems(object):
+    @classmethod
+    def setup_class(cls):
+        cls.items = PackedItems(Interval, [[0, 0.5, 0.75], [0.5, 0.6, 1]],
+                                ['a', 'b'], [0, 1, 0])
+
+    def test_len(self):
+        assert_equal(len(self.items), 3)
+
+    def test_get(self):
+        assert_equal(repr(self.items[1]), "Interval(0.5, 0.6, 'b')")
+        assert_equal(repr(self.items[-1]), "Interval(0.75, 1, 'a')")
+
+    def test_slice(self):
+        assert_equal(repr(self.items[1:]), "[Interval(0.5, 0.6, 'b'), "
+                                           "Interval(0.75, 1, 'a')]")
+
+    def test_iter(self):
+        assert_equal([item.text for item in self.items], ['a', 'b', 'a'])
+
+    def test_reversed(self):
+        assert_equal([item.xmin for item in reversed(self.items)],
+                     [0.75, 0.5, 0])
+
+    def test_out_of_range(self):
+        with assert_raises(IndexError):
+            self.items[3]
+
+
+class TestPackedIntervalTier(object):
+    @classmethod
+    def setup_class(cls):
+        cls.tier = IntervalTier('abc', 0, 1, [Interval(0, 0.5, 'a'),
+                                              Interval(0.5, 0.6, 'b'),
+                                              Interval(0.75, 1, 'a')])
+        cls.packed = PackedIntervalTier.from_tier(cls.tier)
+
+    def test_from_tier(self):
+        assert_equal(self.packed.name, 'abc')
+        assert_equal(self.packed._items.vocabulary, ['a', 'b'])
+        assert_equal(list(self.packed._items.codes), [0, 1, 0])
+        assert_equal(self.packed.to_dict(), self.tier.to_dict())
+
+    def test_where(self):
+        for time in (0, 0.25, 0.5, 0.55, 0.6, 0.65, 0.75, 0.8, 1, 1.5, -1):
+            res = self.packed.where(time)
+            expected = self.tier.where(time)
+
+            if expected is None:
+                assert_is_none(res)
+
+            else:
+                assert_equal(vars(res), vars(expected))
+
+    def test_find(self):
+        assert_equal([vars(item) for item in self.packed.find('a')],
+                     [vars(item) for item in self.tier.find('a')])
+        assert_equal([vars(item) for item in self.packed.search('b')],
+                     [vars(item) for item in self.tier.search('b')])
+
+    def test_to_praat(self):
+        assert_equal(self.packed.to_praat(), self.tier.to_praat())
+
+    def test_round_trip(self):
+        from_dict = tier_from_dict(self.packed.to_dict())
+        from_praat = tier_from_reader(praat_reader(self.packed.to_praat()))
+
+        assert_is(from_dict.__class__, IntervalTier)
+        assert_equal(from_dict.to_dict(), self.tier.to_dict())
+        assert_is(from_praat.__class__, IntervalTier)
+        assert_equal(from_praat.to_praat(), self.tier.to_praat())
+
+    def test_crop(self):
+        res = self.packed.crop(0.25, 0.875)
+
+        assert_is(res.__class__, PackedIntervalTier)
+        assert_equal(repr(res._items),
+                     repr(self.tier.crop(0.25, 0.875)._items))
+
+    def test_read_only(self):
+        with assert_raises(TypeError):
+            self.packed.insert(1, 2, 'c')
+
+        with assert_raises(TypeError):
+            self.packed.shift(1)
+
+        with assert_raises(TypeError):
+            self.packed.split(0.25)
+
+        with assert_raises(TypeError):
+            self.packed.move_boundary(0.5, 0.55)
+
+        with assert_raises(TypeError):
+            self.packed.relabel({'a': 'b'})
+
+        with assert_raises(TypeError):
+            del self.packed[0]
+
+    def test_pickle(self):
+        res = pickle.loads(pickle.dumps(self.packed))
+
+        assert_is(res.__class__, PackedIntervalTier)
+        assert_equal(repr(res), repr(self.packed))
+
+    def test_ticks(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0, 0.5, 'a'),
+                                          Interval(0.5, 1, 'b')])
+        tier.to_ticks(16000)
+        packed = PackedIntervalTier.from_tier(tier)
+
+        assert_equal(packed.rate, 16000)
+        assert_equal(packed.where(8000).text, 'b')
+        assert_is(type(packed[1].xmin), int)
+        assert_equal(packed.to_praat(), tier.to_praat())
+        assert_equal(packed.to_dict(), tier.to_dict())
+        assert_equal(packed.crop(4000, 12000).rate, 16000)
+
+        res = pickle.loads(pickle.dumps(packed))
+
+        assert_equal(res.rate, 16000)
+        assert_equal(res.to_praat(), tier.to_praat())
+
+    def test_textgrid_unchanged_when_read_only(self):
+        tg = TextGrid(0, 1, [self.tier.crop(0, 1), self.packed])
+        expected = tg.to_dict()
+
+        for method, args in (('shift', (1,)), ('scale', (2,)),
+                             ('to_ticks', (16000,))):
+            with assert_raises(TypeError):
+                getattr(tg, method)(*args)
+
+            assert_equal(tg.to_dict(), expected)
+            assert_is_none(tg.rate)
+            assert_is_none(tg[0].rate)
+
+        tier = self.tier.crop(0, 1)
+        tier.to_ticks(16000)
+        tg = TextGrid(0, 16000, [self.tier.crop(0, 1), tier])
+        tg.rate = 16000
+        tg[0].to_ticks(16000)
+        tg.tiers[1] = PackedIntervalTier.from_tier(tier)
+
+        with assert_raises(TypeError):
+            tg.to_seconds()
+
+        assert_equal((tg.xmax, tg.rate, tg[0].rate), (16000, 16000, 16000))
+        assert_equal(tg[0][1].xmin, 8000)
+
+    def test_empty(self):
+        packed = PackedIntervalTier.from_tier(IntervalTier('abc', 0, 1))
+
+        assert_equal(len(packed), 0)
+        assert_is_none(packed.where(0.5))
+
+
+class TestPackedTextTier(object):
+    @classmethod
+    def setup_class(cls):
+        cls.tier = TextTier('abc', 0, 1, [Point(0.5, 'a'), Point(0.75, 'c')])
+        cls.packed = PackedTextTier.from_tier(cls.tier)
+
+    def test_where_left(self):
+        for time in (0.25, 0.5, 0.75, 0.8, 1.5):
+            assert_equal(repr(self.packed.where(time)),
+                         repr(self.tier.where(time)))
+
+    def test_where_range(self):
+        for left, right in ((0, 0.25), (0.25, 0.5), (0.5, 0.75), (0, 1),
+                            (0.6, 0.7), (0.8, 1.5)):
+            assert_equal(repr(self.packed.where(left, right)),
+                         repr(self.tier.where(left, right)))
+
+    def test_columns_from_arrays(self):
+        packed = PackedTextTier('abc', 0, 1, [array.array('d', [0.25, 0.5])],
+                                ['x'], array.array('i', [0, 0]))
+
+        assert_equal(repr(packed.where(0.25)), "Point(0.25, 'x')")
+        assert_equal(len(packed.check_items()), 2)
+
+    def test_to_dict_and_praat(self):
+        assert_equal(self.packed.to_dict(), self.tier.to_dict())
+        assert_equal(self.packed.to_praat(), self.tier.to_praat())
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import multiprocessing
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from nose.tools import *
+
+from tgre import TextGrid, IntervalTier, Interval
+from tgre.packed import PackedIntervalTier
+from tgre.shared import share_tier, SharedIntervalTier, SharedTextTier
+
+
+def where_in_worker(args):
+    handle, time = args
+    tier = handle.attach()
+
+    try:
+        return tier.where(time).text, len(tier)
+
+    finally:
+        tier.close()
+
+
+POOL_SCRIPT = """
+import multiprocessing
+import tgre
+from tgre.shared import share_tier
+
+def label_at(args):
+    handle, time = args
+    tier = handle.attach()
+    interval = tier.where(time)
+    tier.close()
+    return interval.text
+
+if __name__ == '__main__':
+    tg = tgre.TextGrid.from_file('test/files/usage-example.TextGrid')
+    handle = share_tier(tg[1])
+    with multiprocessing.Pool(2) as pool:
+        print(pool.map(label_at, [(handle, 0.5), (handle, 1.2)]))
+    tier = handle.attach()
+    tier.close()
+    handle.unlink()
+"""
+
+
+def run_script(script, stdin=None):
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'script.py')
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+
+    try:
+        with open(path, 'w') as script_file:
+            script_file.write(script)
+
+        process = subprocess.Popen([sys.executable, path],
+                                   stdin=subprocess.PIPE,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE, env=env)
+        stdout, stderr = process.communicate(stdin)
+
+    finally:
+        shutil.rmtree(directory)
+
+    return process.returncode, stdout.decode(), stderr.decode()
+
+
+class TestShareTier(object):
+    @classmethod
+    def setup_class(cls):
+        cls.tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        cls.tg[1][1].text = u'çiao'
+        cls.handles = [share_tier(tier) for tier in cls.tg]
+
+    @classmethod
+    def teardown_class(cls):
+        for handle in cls.handles:
+            handle.unlink()
+
+    def test_attach(self):
+        for handle, tier in zip(self.handles, self.tg):
+            attached = handle.attach()
+
+            assert_equal(attached.name, tier.name)
+            assert_equal(attached.to_dict()[tier.item.plural],
+                         tier.to_dict()[tier.item.plural])
+
+            attached.close()
+
+    def test_attached_classes(self):
+        tiers = [handle.attach() for handle in self.handles]
+
+        assert_equal([tier.__class__ for tier in tiers],
+                     [SharedIntervalTier, SharedIntervalTier, SharedTextTier])
+
+        for tier in tiers:
+            tier.close()
+
+    def test_where_and_index(self):
+        tier = self.handles[1].attach()
+
+        assert_equal(tier.where(1.2).text, u'çiao')
+        assert_equal(tier[-1].xmin, 1.45)
+        assert_is_none(tier.where(3))
+
+        tier.close()
+
+    def test_read_only(self):
+        tier = self.handles[0].attach()
+
+        with assert_raises(TypeError):
+            tier.insert(3, 4, 'a')
+
+        with assert_raises(TypeError):
+            tier._items.columns[0][0] = 1.0
+
+        tier.close()
+
+    def test_handle_pickle(self):
+        handle = pickle.loads(pickle.dumps(self.handles[1]))
+        tier = handle.attach()
+
+        assert_equal(len(tier), 3)
+        tier.close()
+
+    def test_attached_pickle(self):
+        tier = self.handles[1].attach()
+        res = pickle.loads(pickle.dumps(tier))
+        tier.close()
+
+        assert_is(res.__class__, PackedIntervalTier)
+        assert_equal(res.where(1.2).text, u'çiao')
+
+    def test_workers(self):
+        args = [(self.handles[1], 0.5), (self.handles[1], 1.2)]
+        pool = multiprocessing.Pool(2)
+
+        try:
+            res = pool.map(where_in_worker, args)
+
+        finally:
+            pool.close()
+            pool.join()
+
+        assert_equal(res, [('', 3), (u'çiao', 3)])
+
+    def test_ticks(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0, 0.5, 'a'),
+                                          Interval(0.5, 1, 'b')])
+        tier.to_ticks(16000)
+        handle = pickle.loads(pickle.dumps(share_tier(tier)))
+        attached = handle.attach()
+
+        try:
+            assert_equal(attached.rate, 16000)
+            assert_equal(attached.where(8000).text, 'b')
+            assert_is(type(attached[1].xmin), int)
+            assert_equal(attached.to_praat(), tier.to_praat())
+            assert_equal(pickle.loads(pickle.dumps(attached)).rate, 16000)
+
+        finally:
+            attached.close()
+            handle.unlink()
+
+    def test_pool_example(self):
+        returncode, stdout, stderr = run_script(POOL_SCRIPT)
+
+        assert_equal(stderr, '')
+        assert_equal(returncode, 0)
+        assert_equal(stdout.strip(), "['', 'ciao']")
+
+    def test_attach_in_other_process(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0, 1, 'a')])
+        handle = share_tier(tier)
+        script = ('import pickle, sys\n'
+                  'tier = pickle.loads(sys.stdin.buffer.read()).attach()\n'
+                  'print(tier.where(0.5).text)\n'
+                  'tier.close()\n')
+
+        try:
+            returncode, stdout, stderr = run_script(script,
+                                                    pickle.dumps(handle))
+            assert_equal((returncode, stdout.strip(), stderr), (0, 'a', ''))
+
+            # The other process's tracker didn't free the block.
+            attached = handle.attach()
+            assert_equal(attached.where(0.5).text, 'a')
+            attached.close()
+
+        finally:
+            handle.unlink()
+
+    def test_empty_tier(self):
+        handle = share_tier(IntervalTier('empty', 0, 1))
+        tier = handle.attach()
+
+        assert_equal(len(tier), 0)
+        assert_is_none(tier.where(0.5))
+
+        tier.close()
+        handle.unlink()
+
+    def test_bad_tier(self):
+        with assert_raises(TypeError):
+            share_tier([Interval(0, 1, 'a')])
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pickle
+
+from nose.tools import *
+
+from tgre import TextGrid, IntervalTier, TextTier, Interval, Point
+from tgre.packed import PackedTextTier
+from tgre.stats import TierStats, merge_stats
+
+
+def recount(tier):
+    """Return stats counted from the items of a copy of a tier."""
+
+    return tier._like(tier.xmin, tier.xmax, list(tier)).stats()
+
+
+class TestTierStats(object):
+    def test_add_and_remove(self):
+        stats = TierStats()
+        stats.add('a', 0.5)
+        stats.add('a', 0.25)
+        stats.add('', 1)
+
+        assert_equal(stats.counts, {'a': 2, '': 1})
+        assert_equal(stats.count, 3)
+        assert_equal(stats.duration, 0.75)
+        assert_equal(stats.mean_durations(), {'a': 0.375, '': 1})
+
+        stats.remove('a', 0.5)
+        stats.remove('', 1)
+
+        assert_equal(stats.counts, {'a': 1})
+        assert_equal(stats.durations, {'a': 0.25})
+
+    def test_repr(self):
+        assert_equal(repr(TierStats({'a': 2, 'b': 1}, {'a': 1, 'b': 1})),
+                     '<TierStats with 3 items and 2 labels>')
+
+    def test_pickle(self):
+        stats = TierStats({'a': 2}, {'a': 0.5})
+        res = pickle.loads(pickle.dumps(stats))
+
+        assert_equal((res.counts, res.durations), ({'a': 2}, {'a': 0.5}))
+
+    def test_merge_stats(self):
+        first = TierStats({'a': 2}, {'a': 0.5})
+        second = TierStats({'a': 1, 'b': 1}, {'a': 0.25, 'b': 1})
+
+        res = merge_stats([first, second])
+
+        assert_equal(res.counts, {'a': 3, 'b': 1})
+        assert_equal(res.durations, {'a': 0.75, 'b': 1})
+        assert_equal(first.counts, {'a': 2})
+
+        res = merge_stats([{'x': first}, {'x': second, 'y': first}])
+
+        assert_equal(res['x'].counts, {'a': 3, 'b': 1})
+        assert_equal(res['y'].counts, {'a': 2})
+
+        assert_equal(merge_stats([]).counts, {})
+
+
+class TestStats(object):
+    def setup_method(self):
+        self.tier = IntervalTier('abc', 0, 2, [Interval(0, 0.5, 'a'),
+                                               Interval(0.5, 1, 'b'),
+                                               Interval(1, 1.5, 'a')])
+
+    def test_interval_tier(self):
+        stats = self.tier.stats()
+
+        assert_equal(stats.counts, {'a': 2, 'b': 1})
+        assert_equal(stats.durations, {'a': 1, 'b': 0.5})
+
+    def test_text_tier(self):
+        tier = TextTier('abc', 0, 1, [Point(0.25, 'a'), Point(0.5, 'a')])
+        stats = tier.stats()
+
+        assert_equal(stats.counts, {'a': 2})
+        assert_equal(stats.duration, 0)
+
+    def test_returns_copy(self):
+        self.tier.stats().add('c', 1)
+
+        assert_equal(self.tier.stats().counts, {'a': 2, 'b': 1})
+
+    def test_insert_and_delete(self):
+        self.tier.stats()
+
+        self.tier.insert(1.5, 2, 'c')
+        del self.tier[0]
+        del self.tier[-2:]
+
+        assert_is_not_none(self.tier._stats)
+        assert_equal(self.tier.stats().counts, recount(self.tier).counts)
+        assert_equal(self.tier.stats().counts, {'b': 1})
+
+    def test_edits(self):
+        self.tier.stats()
+
+        self.tier.move_boundary(0.5, 0.75)
+        self.tier.split(1.25, right_text='c')
+        self.tier.merge(0, 1, text='a')
+
+        assert_is_not_none(self.tier._stats)
+        assert_equal(self.tier.stats().counts, recount(self.tier).counts)
+        assert_equal(self.tier.stats().durations,
+                     recount(self.tier).durations)
+        assert_equal(self.tier.stats().durations, {'a': 1.25, 'c': 0.25})
+
+    def test_replace_items(self):
+        self.tier.stats()
+
+        self.tier.relabel({'a': 'x'})
+        assert_equal(self.tier.stats().counts, {'x': 2, 'b': 1})
+
+        self.tier.scale(2)
+        assert_equal(self.tier.stats().durations, {'x': 2, 'b': 1})
+
+    def test_ticks(self):
+        self.tier.stats()
+        self.tier.to_ticks(100)
+        self.tier.insert(150, 200, 'a')
+
+        assert_equal(self.tier.stats().durations, {'a': 1.5, 'b': 0.5})
+
+    def test_window(self):
+        stats = self.tier.window(0.25, 1.25).stats()
+
+        assert_equal(stats.durations, {'a': 0.5, 'b': 0.5})
+
+    def test_packed(self):
+        tier = TextTier('abc', 0, 1, [Point(0.25, 'a'), Point(0.5, 'b')])
+        stats = PackedTextTier.from_tier(tier).stats()
+
+        assert_equal(stats.counts, {'a': 1, 'b': 1})
+
+    def test_textgrid(self):
+        other = IntervalTier('abc', 0, 2, [Interval(0, 2, 'a')])
+        points = TextTier('def', 0, 2, [Point(1, 'p')])
+        tg = TextGrid(0, 2, [self.tier, other, points])
+
+        stats = tg.stats()
+
+        assert_equal(sorted(stats), ['abc', 'def'])
+        assert_equal(stats['abc'].counts, {'a': 3, 'b': 1})
+        assert_equal(stats['abc'].durations, {'a': 3, 'b': 0.5})
+        assert_equal(stats['def'].counts, {'p': 1})
@@ -4,8 +4,15 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import glob
+import gzip
 import io
 import os
+import pickle
+import random
+import re
+import shutil
+import tempfile
 import unittest
 
 try:
@@ -15,9 +22,9 @@ except ImportError:
 
 from nose.tools import *
 
-from tgre import praat_reader, praat_string, tier_from_reader
+from tgre import praat_reader, praat_string, tier_from_reader, tier_from_dict
 from tgre import TextGrid, IntervalTier, TextTier, Interval, Point
-from tgre.tgre import Tier
+from tgre.tgre import Tier, _SourceReader, _stream_matches
 
 
 class TestPraatReader(object):
@@ -104,6 +111,45 @@ class TestPraatReader(object):
 
         assert_equal(elements, self.whitespace_sep_expected)
 
+    def test_file_object(self):
+        tg_file = 'test/files/doubled-quotes-in-text-and-mark.TextGrid'
+
+        with io.open(tg_file) as textgrid:
+            elements = list(praat_reader(textgrid))
+
+        assert_equal(elements, self.quotes_expected)
+
+
+class TestStreamMatches(object):
+    def read(self, stream, size):
+        for match in _stream_matches(stream, size):
+            if match.group('string') is not None:
+                yield match.group('string').replace('""', '"')
+
+            elif match.group('int') is not None:
+                yield int(match.group('int'))
+
+            elif match.group('real') is not None:
+                yield float(match.group('real'))
+
+    def check(self, text):
+        expected = list(praat_reader(text))
+
+        for size in range(1, 24):
+            res = list(self.read(io.StringIO(text), size))
+            assert_equal(res, expected)
+
+    def test_files_in_small_blocks(self):
+        for tg_file in glob.glob('test/files/*.TextGrid'):
+            encoding = 'utf_16' if tg_file.endswith('numbers.TextGrid') else 'utf_8'
+
+            with io.open(tg_file, encoding=encoding) as textgrid:
+                self.check(textgrid.read())
+
+    def test_multiline_strings(self):
+        self.check('"a" 1 "line one\n"" 2 \n ! not a comment\n" 3.5\n'
+                   '"" ! comment "\n"x y" \n')
+
 
 class TestPraatString(object):
     def test_praat_string(self):
@@ -130,6 +176,32 @@ class TestTierFromReader(object):
         assert_in(mock.call.from_reader(stream),
                   TextTierMock.method_calls)
 
+    def test_source_span(self):
+        text = '"IntervalTier" "abc" 0 1 1 0 1 "x" ! comment\n"TextTier"'
+        stream = _SourceReader(text)
+        tier = tier_from_reader(stream)
+
+        assert_equal(tier._source[0], '"IntervalTier" "abc" 0 1 1 0 1 "x"')
+        assert_equal(tier._source[1:], (0, ['abc', 0, 1, [0], [1], ['x']]))
+
+    def test_invalid_source_not_kept(self):
+        texts = ['"IntervalTier" "abc" 0 2 2 0 1 "a" 0.5 2 "b"',
+                 '"IntervalTier" "abc" 0 2 2 1 2 "b" 0 1 "a"',
+                 '"IntervalTier" "abc" 0 2 1 0 1 "a"',
+                 '"TextTier" "abc" 0 2 2 1 "a" 1 "b"',
+                 '"TextTier" "abc" 0 2 2 1.5 "b" 0.5 "a"']
+
+        for text in texts:
+            tier = tier_from_reader(_SourceReader(text))
+
+            assert_is_none(tier._source)
+
+    def test_no_source_span(self):
+        stream = iter(['IntervalTier', 'abc', 0, 1, 1, 0, 1, 'x'])
+        tier = tier_from_reader(stream)
+
+        assert_is_none(tier._source)
+
     def test_bad_tier(self):
         stream = iter(['BadTierName'])
 
@@ -137,6 +209,28 @@ class TestTierFromReader(object):
             tier_from_reader(stream)
 
 
+class TestTierFromDict(object):
+    @mock.patch('tgre.tgre.IntervalTier')
+    def test_interval_tier(self, IntervalTierMock):
+        tier_dict = {'class': 'IntervalTier'}
+        tier = tier_from_dict(tier_dict)
+
+        assert_in(mock.call.from_dict(tier_dict),
+                  IntervalTierMock.method_calls)
+
+    @mock.patch('tgre.tgre.TextTier')
+    def test_text_tier(self, TextTierMock):
+        tier_dict = {'class': 'TextTier'}
+        tier = tier_from_dict(tier_dict)
+
+        assert_in(mock.call.from_dict(tier_dict),
+                  TextTierMock.method_calls)
+
+    def test_bad_tier(self):
+        with assert_raises(ValueError):
+            tier_from_dict({'class': 'BadTierName'})
+
+
 class TestTextGrid(object):
     def test_init(self):
         tg = TextGrid(0, 1, [])
@@ -183,6 +277,24 @@ class TestTextGrid(object):
                            'xmax': 1,
                            'tiers': [{'a tier': 'data'}]})
 
+    @mock.patch('tgre.tgre.tier_from_dict')
+    def test_from_dict(self, TierFromDictMock):
+        TierFromDictMock.return_value = 'tier'
+
+        tg = TextGrid.from_dict({'xmin': 0, 'xmax': 1,
+                                 'tiers': [{'a tier': 'data'}]})
+
+        assert_equal(tg.xmin, 0)
+        assert_equal(tg.xmax, 1)
+        assert_equal(tg.tiers, ['tier'])
+        TierFromDictMock.assert_called_once_with({'a tier': 'data'})
+
+    def test_from_dict_round_trip(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        res = TextGrid.from_dict(tg.to_dict())
+
+        assert_equal(res.to_dict(), tg.to_dict())
+
     def test_to_praat(self):
         mock_tier = mock.Mock()
         mock_tier.xmin = 0
@@ -240,6 +352,106 @@ class TestTextGrid(object):
         tg = TextGrid(0, 1, ['tier 0', 'tier 1'])
         assert_equal(tg[1], 'tier 1')
 
+    def test_join(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+
+        assert_equal(tg.join('Pat', 'Sam'), ((0, 0), (1, 3)))
+        assert_equal(tg.join(0, 'Sam', 'overlap'), ((0, 1), (0, 3)))
+
+        with assert_raises(KeyError):
+            tg.join('Pat', 'Kim')
+
+    def test_crop(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        res = tg.crop(0.5, 1.25)
+
+        assert_equal((res.xmin, res.xmax), (0.5, 1.25))
+        assert_equal(repr(res[0]._items), "[Interval(0.5, 0.65, 'hello'), "
+                                          "Interval(0.65, 1.25, '')]")
+        assert_equal(repr(res[1]._items), "[Interval(0.5, 1.125, ''), "
+                                          "Interval(1.125, 1.25, 'ciao')]")
+        assert_equal(repr(res[2]._items), "[Point(0.75, 'click')]")
+
+        assert_equal(tg[0][0].xmin, 0)
+        assert_equal(tg[1][2].xmin, 1.45)
+
+    def test_crop_relative(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        res = tg.crop(0.5, 1.25, preserve_times=False)
+
+        assert_equal((res.xmin, res.xmax), (0, 0.75))
+        assert_equal(repr(res[1]._items), "[Interval(0.0, 0.625, ''), "
+                                          "Interval(0.625, 0.75, 'ciao')]")
+        assert_equal(repr(res[2]._items), "[Point(0.25, 'click')]")
+
+    def test_shift(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        tg.shift(0.5)
+
+        assert_equal((tg.xmin, tg.xmax), (0.5, 3))
+        assert_equal((tg[1].xmin, tg[1].xmax), (0.5, 3))
+        assert_equal(repr(tg[1]._items), "[Interval(0.5, 1.625, ''), "
+                                         "Interval(1.625, 1.95, 'ciao'), "
+                                         "Interval(1.95, 3.0, '')]")
+        assert_equal([point.number for point in tg[2]], [1.25, 2, 2.75])
+
+    def test_scale(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        tg.scale(2)
+
+        assert_equal((tg.xmin, tg.xmax), (0, 5))
+        assert_equal([(item.xmin, item.xmax) for item in tg[1]],
+                     [(0, 2.25), (2.25, 2.9), (2.9, 5)])
+        assert_equal([point.number for point in tg[2]], [1.5, 3, 4.5])
+
+        with assert_raises(ValueError):
+            tg.scale(0)
+
+    def test_concatenate(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        part = tg.crop(1, 2)
+        res = TextGrid.concatenate([tg, part, tg])
+
+        assert_equal((res.xmin, res.xmax), (0, 6))
+        assert_equal([tier.name for tier in res], ['Pat', 'Sam', 'Metronome'])
+        assert_equal([(item.xmin, item.xmax, item.text) for item in res[1]],
+                     [(0, 1.125, ''), (1.125, 1.45, 'ciao'), (1.45, 2.5, ''),
+                      (2.5, 2.625, ''), (2.625, 2.95, 'ciao'),
+                      (2.95, 3.5, ''), (3.5, 4.625, ''),
+                      (4.625, 4.95, 'ciao'), (4.95, 6, '')])
+        assert_equal([point.number for point in res[2]],
+                     [0.75, 1.5, 2.25, 3, 4.25, 5, 5.75])
+
+        res[1].check_items()
+        assert_is_not(res[1][0], tg[1][0])
+
+    def test_concatenate_mismatched(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+
+        with assert_raises(ValueError):
+            TextGrid.concatenate([tg, TextGrid(0, 1, tg.tiers[:2])])
+
+        with assert_raises(ValueError):
+            TextGrid.concatenate([])
+
+    def test_remove_where_and_relabel(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+
+        tg.remove_where(lambda item: not item.text, tiers=['Sam'])
+        tg.relabel({'click': 'tick', 'hello': 'hi'})
+
+        assert_equal(len(tg[0]), 2)
+        assert_equal([item.text for item in tg[1]], ['ciao'])
+        assert_equal([item.mark for item in tg[2]], ['tick'] * 3)
+        assert_equal(tg[0][0].text, 'hi')
+
+    def test_merge_runs(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        tg.relabel(lambda label: '')
+        tg.merge_runs()
+
+        assert_equal([len(tier) for tier in tg], [1, 1, 3])
+
     def test_set(self):
         tg = TextGrid(0, 1, ['tier 0', 'tier 1'])
         tg[1] = 'new tier'
@@ -263,6 +475,57 @@ class TestTextGrid(object):
         assert_equal(list(iter(tg)), ['tier 0', 'tier 1'])
 
 
+class TestTicks(object):
+    def setup_method(self):
+        self.tg = TextGrid.from_file('test/files/usage-example.TextGrid',
+                                     keep_source=False)
+        self.expected = self.tg.to_praat()
+
+    def test_to_ticks(self):
+        self.tg.to_ticks(16000)
+
+        assert_equal(self.tg.rate, 16000)
+        assert_equal((self.tg.xmin, self.tg.xmax), (0, 40000))
+        assert_equal([(item.xmin, item.xmax) for item in self.tg[1]],
+                     [(0, 18000), (18000, 23200), (23200, 40000)])
+        assert_equal([point.number for point in self.tg[2]],
+                     [12000, 24000, 36000])
+        assert_is(type(self.tg[1][1].xmax), int)
+        assert_equal(self.tg[1].where(20000).text, 'ciao')
+
+    def test_output_in_seconds(self):
+        tg_dict = self.tg.to_dict()
+        self.tg.to_ticks(16000)
+
+        assert_equal(self.tg.to_praat(), self.expected)
+        assert_equal(self.tg.to_dict(), tg_dict)
+        assert_equal(self.tg.crop(16000, 24000).to_praat(),
+                     TextGrid.from_string(self.expected).crop(1, 1.5)
+                     .to_praat())
+
+    def test_to_seconds(self):
+        self.tg.to_ticks(16000)
+        self.tg.to_seconds()
+
+        assert_is_none(self.tg.rate)
+        assert_equal(self.tg.to_praat(), self.expected)
+
+    def test_change_rate(self):
+        self.tg.to_ticks(16000)
+        self.tg.to_ticks(8000)
+
+        assert_equal(self.tg.xmax, 20000)
+        assert_equal(self.tg[1][1].xmin, 9000)
+
+    def test_pickle(self):
+        self.tg.to_ticks(16000)
+        res = pickle.loads(pickle.dumps(self.tg))
+
+        assert_equal(res.rate, 16000)
+        assert_equal(res[1].rate, 16000)
+        assert_equal(repr(res), repr(self.tg))
+
+
 class TestTextGridIO(object):
     def test_from_file(self):
         tg_file = 'test/files/doubled-quotes-in-text-and-mark.TextGrid'
@@ -316,6 +579,60 @@ class TestTextGridIO(object):
         with assert_raises(ValueError):
             TextGrid.from_file('test/files/intervals-no-object-class.TextGrid')
 
+    def test_to_praat_unchanged_tiers_are_copied(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        res = tg.to_praat()
+
+        assert_in('"IntervalTier" \n        name = "Pat" \n', res)
+        assert_in('            mark = "click"', res)
+        assert_not_in('named', res)
+
+    def test_to_praat_modified_tier_is_formatted(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        tg[1][1].text = 'hola'
+        res = tg.to_praat()
+
+        assert_in('"IntervalTier" \n        name = "Pat" \n', res)
+        assert_in('"IntervalTier" named "Sam" \n', res)
+        assert_in('"hola"', res)
+        assert_not_in('"ciao"', res)
+
+    def test_to_praat_invalid_source_raises(self):
+        text = ('File type = "ooTextFile"\nObject class = "TextGrid"\n'
+                '0\n2\n<exists>\n1\n"IntervalTier"\n"abc"\n0\n2\n2\n'
+                '0\n1\n"a"\n0.5\n2\n"b"\n')
+        tg = TextGrid.from_string(text)
+
+        with assert_raises(ValueError):
+            tg.to_praat()
+
+    def test_to_praat_item_times_edited(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        tg[1][1].xmin = 1.2
+        tg[1][0].xmax = 1.2
+        tg[2][0].number = 0.5
+        res = tg.to_praat()
+
+        assert_in('"IntervalTier" \n        name = "Pat" \n', res)
+        assert_in('"IntervalTier" named "Sam" \n', res)
+        assert_in('"TextTier" named "Metronome" \n', res)
+        assert_equal(TextGrid.from_string(res).to_dict(), tg.to_dict())
+
+    def test_to_praat_renamed_tier_is_formatted(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        tg[0].name = 'Pam'
+
+        assert_in('"IntervalTier" named "Pam" \n', tg.to_praat())
+
+    def test_to_praat_round_trip_after_insert(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        tg[2].insert(2.4, 'clack')
+
+        res = TextGrid.from_reader(iter(list(praat_reader(tg.to_praat()))[2:]))
+
+        assert_equal(res.to_dict(), tg.to_dict())
+        assert_equal(res[2][3].mark, 'clack')
+
     def test_to_praat_with_path(self):
         mock_tier = mock.Mock()
         mock_tier.xmin = 0
@@ -332,9 +649,160 @@ class TestTextGridIO(object):
                            '0 to 1 seconds <exists>\n'
                            '2 tiers\n\na tier\n\na tier'))
 
+    def test_compressed_round_trip(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        tg[0][0].text = 'hi'
+        expected = tg.to_dict()
+
+        for ext in ('.gz', '.bz2', '.xz'):
+            path = os.path.join(self.tmp, 'compressed.TextGrid' + ext)
+            tg.to_praat(path)
+
+            with io.open(path, 'rb') as raw_file:
+                assert_not_in(b'ooTextFile', raw_file.read())
+
+            res = TextGrid.from_file(path)
+            assert_equal(res.to_dict(), expected)
+
+    def test_compressed_utf_16_round_trip(self):
+        tg = TextGrid.from_file('test/files/numbers.TextGrid',
+                                encoding='utf_16')
+        tg[0][0].text = u'մեկ'
+        expected = tg.to_dict()
+
+        for ext in ('', '.gz', '.bz2', '.xz'):
+            path = os.path.join(self.tmp, 'utf-16.TextGrid' + ext)
+            tg.to_praat(path, encoding='utf_16')
+
+            res = TextGrid.from_file(path, encoding='utf_16')
+            assert_equal(res.to_dict(), expected)
+
+    def test_compressed_detected_by_magic(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        path = os.path.join(self.tmp, 'compressed.TextGrid.gz')
+        renamed = os.path.join(self.tmp, 'compressed.TextGrid')
+
+        tg.to_praat(path)
+        os.rename(path, renamed)
+
+        res = TextGrid.from_file(renamed, keep_source=False)
+        assert_equal(res.to_dict(), tg.to_dict())
+
+    def test_from_file_object(self):
+        tg_file = 'test/files/usage-example.TextGrid'
+        expected = TextGrid.from_file(tg_file)
+
+        for mode in ('r', 'rb'):
+            for keep_source in (True, False):
+                with io.open(tg_file, mode) as textgrid_file:
+                    tg = TextGrid.from_file(textgrid_file,
+                                            keep_source=keep_source)
+                    assert_false(textgrid_file.closed)
+
+                assert_equal(tg.to_dict(), expected.to_dict())
+
+    def test_from_file_object_compressed(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        path = os.path.join(self.tmp, 'object.TextGrid.bz2')
+        tg.to_praat(path)
+
+        for keep_source in (True, False):
+            with io.open(path, 'rb') as textgrid_file:
+                res = TextGrid.from_file(textgrid_file,
+                                         keep_source=keep_source)
+
+            assert_equal(res.to_dict(), tg.to_dict())
+
+    def test_from_bytes(self):
+        with io.open('test/files/numbers.TextGrid', 'rb') as textgrid_file:
+            data = textgrid_file.read()
+
+        tg = TextGrid.from_bytes(data, encoding='utf_16')
+        assert_equal(tg.tiers[0][3].text, u'չորս')
+
+        tg = TextGrid.from_bytes(gzip.compress(data), encoding='utf_16')
+        assert_equal(tg.tiers[0][3].text, u'չորս')
+
+    def test_from_string(self):
+        with io.open('test/files/usage-example.TextGrid') as textgrid_file:
+            text = textgrid_file.read()
+
+        tg = TextGrid.from_string(text)
+
+        assert_equal(tg[1][1].text, 'ciao')
+        assert_in(tg[0]._source[0], text)
+
+    def test_from_file_without_source(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid',
+                                keep_source=False)
+
+        assert_is_none(tg[0]._source)
+        assert_in('"IntervalTier" named "Pat"', tg.to_praat())
+
+    @classmethod
+    def setup_class(cls):
+        cls.tmp = tempfile.mkdtemp()
+
     @classmethod
     def teardown_class(cls):
         os.remove('test/files/output.TextGrid')
+        shutil.rmtree(cls.tmp)
+
+
+class TestPickle(object):
+    def test_textgrid(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        res = pickle.loads(pickle.dumps(tg, pickle.HIGHEST_PROTOCOL))
+
+        assert_is_not(res, tg)
+        assert_equal(repr(res), repr(tg))
+        assert_is_none(res[0]._source)
+        assert_equal(res.to_praat().split('\n')[:4],
+                     tg.to_praat().split('\n')[:4])
+
+    def test_int_times_preserved(self):
+        tier = IntervalTier('abc', 0, 2, [Interval(0, 0.5, 'a'),
+                                          Interval(0.5, 2, 'a'),
+                                          Interval(2.5, 3.0, 'b')])
+        res = pickle.loads(pickle.dumps(tier))
+
+        assert_equal(repr(res), repr(tier))
+        assert_is(type(res[1].xmax), int)
+        assert_is(type(res[2].xmax), float)
+        assert_is(res[0].text, res[1].text)
+
+    def test_other_number_types(self):
+        from fractions import Fraction
+
+        tier = TextTier('abc', 0, 1, [Point(Fraction(1, 3), 'a'),
+                                      Point(0.5, 'b')])
+        res = pickle.loads(pickle.dumps(tier))
+
+        assert_equal(res[0].number, Fraction(1, 3))
+        assert_equal(repr(res), repr(tier))
+
+    def test_order_preserved(self):
+        int1 = Interval(0, 0.5, 'a')
+        int2 = Interval(0.5, 1, 'b')
+        tier = IntervalTier('abc', 0, 1, [int1, int2])
+        int1.xmin = 0.75
+
+        res = pickle.loads(pickle.dumps(tier))
+
+        assert_equal(repr(res), repr(tier))
+
+    def test_empty_tier(self):
+        tier = IntervalTier('abc', 0, 1)
+        res = pickle.loads(pickle.dumps(tier))
+
+        assert_equal(repr(res), repr(tier))
+
+    def test_items(self):
+        interval = pickle.loads(pickle.dumps(Interval(0, 0.5, 'a')))
+        point = pickle.loads(pickle.dumps(Point(0.5, 'b')))
+
+        assert_equal(repr(interval), "Interval(0, 0.5, 'a')")
+        assert_equal(repr(point), "Point(0.5, 'b')")
 
 
 class TestInterval(object):
@@ -531,6 +999,338 @@ class TestIntervalTier(object):
 
         assert_is_none(tier.where(1))
 
+    def words_and_phones(self):
+        words = IntervalTier('words', 0, 2, [Interval(0, 0.5, 'ab'),
+                                             Interval(0.75, 1.5, 'cd'),
+                                             Interval(1.5, 2, 'e')])
+        phones = IntervalTier('phones', 0, 2, [Interval(0, 0.2, 'a'),
+                                               Interval(0.2, 0.51, 'b'),
+                                               Interval(0.75, 1, 'c'),
+                                               Interval(1, 1.5, 'd'),
+                                               Interval(1.6, 1.8, 'e')])
+        return words, phones
+
+    def test_join_contain(self):
+        words, phones = self.words_and_phones()
+
+        assert_equal(words.join(phones), ((0, 1), (2, 4), (4, 5)))
+
+    def test_join_contain_tolerance(self):
+        words, phones = self.words_and_phones()
+
+        assert_equal(words.join(phones, tolerance=0.02),
+                     ((0, 2), (2, 4), (4, 5)))
+
+    def test_join_overlap(self):
+        words, phones = self.words_and_phones()
+
+        assert_equal(words.join(phones, 'overlap'),
+                     ((0, 2), (2, 4), (4, 5)))
+        assert_equal(words.join(phones, 'overlap', tolerance=0.02),
+                     ((0, 2), (2, 4), (4, 5)))
+        assert_equal(phones.join(words, 'overlap'),
+                     ((0, 1), (0, 1), (1, 2), (1, 2), (2, 3)))
+
+    def test_join_matches_nested_scan(self):
+        words, phones = self.words_and_phones()
+        words.insert(0.5, 0.6, 'x')
+        phones.insert(1.9, 2, 'y')
+
+        for mode in ('contain', 'overlap'):
+            for tolerance in (0, 0.005, 0.15):
+                expected = []
+
+                for word in words:
+                    if mode == 'contain':
+                        match = [i for i, phone in enumerate(phones)
+                                 if phone.xmin >= word.xmin - tolerance and
+                                 phone.xmax <= word.xmax + tolerance]
+
+                    else:
+                        match = self.overlapping(word, phones, tolerance)
+
+                    res = words.join(phones, mode, tolerance)[len(expected)]
+                    assert_equal(list(range(*res)), match)
+                    expected.append(res)
+
+    def overlapping(self, parent, children, tolerance):
+        return [i for i, child in enumerate(children)
+                if child.xmin >= parent.xmin and child.xmax <= parent.xmax or
+                min(child.xmax, parent.xmax) -
+                max(child.xmin, parent.xmin) > tolerance]
+
+    def random_tier(self, rng, size):
+        times = sorted(rng.sample(range(1, 400), 2 * size))
+        intervals = [Interval(times[i] / 200, times[i + 1] / 200, str(i))
+                     for i in range(0, len(times), 2)
+                     if rng.random() < 0.8]
+        return IntervalTier('random', 0, 2, intervals)
+
+    def test_join_overlap_short_intervals(self):
+        rng = random.Random(0)
+
+        for _ in range(200):
+            parents = self.random_tier(rng, rng.randint(1, 20))
+            children = self.random_tier(rng, rng.randint(1, 40))
+
+            for tolerance in (0, 0.01, 0.025, 0.05, 0.2):
+                res = parents.join(children, 'overlap', tolerance)
+
+                for parent, (start, stop) in zip(parents, res):
+                    assert_equal(list(range(start, stop)),
+                                 self.overlapping(parent, children,
+                                                  tolerance))
+
+    def test_join_overlap_tolerance(self):
+        parents = IntervalTier('parents', 0, 1, [Interval(0, 0.5, 'a'),
+                                                 Interval(0.5, 0.53, 'b'),
+                                                 Interval(0.53, 1, 'c')])
+        children = IntervalTier('children', 0, 1, [Interval(0, 0.3, 'x'),
+                                                   Interval(0.3, 0.6, 'y'),
+                                                   Interval(0.6, 0.61, 'z'),
+                                                   Interval(0.61, 1, 'w')])
+
+        assert_equal(parents.join(children, 'overlap', 0.05),
+                     ((0, 2), (1, 1), (1, 4)))
+        assert_equal(parents.join(children, 'overlap', 0.2),
+                     ((0, 1), (2, 2), (2, 4)))
+
+    def test_join_cached(self):
+        words, phones = self.words_and_phones()
+        res = words.join(phones)
+
+        assert_is(words.join(phones), res)
+
+        phones.insert(1.8, 2, 'f')
+        res = words.join(phones)
+
+        assert_equal(res, ((0, 1), (2, 4), (4, 6)))
+        assert_is(words.join(phones), res)
+
+        del words[0]
+        assert_equal(words.join(phones), ((2, 4), (4, 6)))
+
+    def test_join_bad_mode(self):
+        words, phones = self.words_and_phones()
+
+        with assert_raises(ValueError):
+            words.join(phones, 'within')
+
+    def test_crop(self):
+        int1 = Interval(0, 0.5, 'a')
+        int2 = Interval(0.5, 0.625, 'b')
+        int3 = Interval(0.75, 1, 'c')
+        tier = IntervalTier('abc', 0, 1, [int1, int2, int3])
+
+        assert_equal(repr(tier.crop(0.25, 0.75)._items),
+                     "[Interval(0.25, 0.5, 'a'), Interval(0.5, 0.625, 'b')]")
+        assert_equal(repr(tier.crop(0.5, 0.875)._items),
+                     "[Interval(0.5, 0.625, 'b'), Interval(0.75, 0.875, 'c')]")
+        assert_equal(repr(tier.crop(0.625, 0.75)._items), '[]')
+        assert_equal(repr(tier.crop(-1, 2)._items), repr(tier._items))
+
+        res = tier.crop(0.25, 0.75)
+        assert_equal((res.name, res.xmin, res.xmax), ('abc', 0.25, 0.75))
+        assert_is_not(res[1], int2)
+
+    def test_remove_where(self):
+        int1 = Interval(0, 0.5, 'a')
+        int2 = Interval(0.5, 0.625, 'sil')
+        int3 = Interval(0.75, 1, 'sil')
+        tier = IntervalTier('abc', 0, 1, [int1, int2, int3])
+        tier.find('sil')
+
+        tier.remove_where(lambda item: item.text == 'sil'
+                          and item.xmax - item.xmin < 0.25)
+
+        assert_equal(tier[:], [int1, int3])
+        assert_equal(tier.find('sil'), [int3])
+
+    def test_relabel(self):
+        int1 = Interval(0, 0.5, 'AA1')
+        int2 = Interval(0.5, 0.625, 'B')
+        int3 = Interval(0.75, 1, 'AA0')
+        tier = IntervalTier('abc', 0, 1, [int1, int2, int3])
+        tier.find('AA')
+
+        tier.relabel({'AA1': 'AA', 'AA0': 'AA'})
+
+        assert_equal([item.text for item in tier], ['AA', 'B', 'AA'])
+        assert_is(tier[1], int2)
+        assert_equal(int1.text, 'AA1')
+        assert_equal(tier.find('AA'), [tier[0], tier[2]])
+
+        calls = []
+        tier.relabel(lambda label: calls.append(label) or label.lower())
+
+        assert_equal([item.text for item in tier], ['aa', 'b', 'aa'])
+        assert_equal(sorted(calls), ['AA', 'B'])
+
+    def test_merge_runs(self):
+        tier = IntervalTier('abc', 0, 2, [Interval(0, 0.5, 'a'),
+                                          Interval(0.5, 0.75, 'a'),
+                                          Interval(0.75, 1, 'a'),
+                                          Interval(1, 1.25, 'b'),
+                                          Interval(1.5, 2, 'b')])
+        tier.merge_runs()
+
+        assert_equal([(item.xmin, item.xmax, item.text) for item in tier],
+                     [(0, 1, 'a'), (1, 1.25, 'b'), (1.5, 2, 'b')])
+
+    def test_move_boundary(self):
+        tier = IntervalTier('abc', 0, 2, [Interval(0, 0.5, 'a'),
+                                          Interval(0.5, 1, 'b'),
+                                          Interval(1.5, 2, 'c')])
+        tier.move_boundary(0.5, 0.75)
+        tier.move_boundary(1, 1.5)
+        tier.move_boundary(0, 0.25)
+
+        assert_equal([(item.xmin, item.xmax) for item in tier],
+                     [(0.25, 0.75), (0.75, 1.5), (1.5, 2)])
+
+    def test_move_boundary_bad_times(self):
+        tier = IntervalTier('abc', 0, 2, [Interval(0, 0.5, 'a'),
+                                          Interval(0.5, 1, 'b'),
+                                          Interval(1.5, 2, 'c')])
+
+        for time, new_time in [(0.25, 0.3), (0.5, 1), (0.5, 0),
+                               (1, 1.75), (2, 2.5)]:
+            with assert_raises(ValueError):
+                tier.move_boundary(time, new_time)
+
+        assert_equal([(item.xmin, item.xmax) for item in tier],
+                     [(0, 0.5), (0.5, 1), (1.5, 2)])
+
+    def test_split(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0, 0.5, 'a'),
+                                          Interval(0.5, 1, 'b')])
+        tier.find('b')
+
+        left, right = tier.split(0.25, right_text='c')
+
+        assert_equal([(item.xmin, item.xmax, item.text) for item in tier],
+                     [(0, 0.25, 'a'), (0.25, 0.5, 'c'), (0.5, 1, 'b')])
+        assert_is(tier[0], left)
+        assert_is(tier[1], right)
+        assert_equal(tier.find('b'), [tier[2]])
+        assert_equal(tier.find('c'), [right])
+
+        with assert_raises(ValueError):
+            tier.split(0.5)
+
+        with assert_raises(ValueError):
+            tier.split(1.5)
+
+    def test_merge(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0, 0.25, 'a'),
+                                          Interval(0.25, 0.5, 'b'),
+                                          Interval(0.5, 0.75, 'c'),
+                                          Interval(0.75, 1, 'b')])
+        tier.find('b')
+
+        merged = tier.merge(0, 2)
+
+        assert_equal([(item.xmin, item.xmax, item.text) for item in tier],
+                     [(0, 0.75, 'a b c'), (0.75, 1, 'b')])
+        assert_is(tier[0], merged)
+        assert_equal(tier.find('b'), [tier[1]])
+        assert_equal(tier.find('c'), [])
+
+        tier.merge(0, -1, text='x')
+        assert_equal(tier.find('x'), [tier[0]])
+        assert_equal(len(tier), 1)
+
+        with assert_raises(ValueError):
+            tier.merge(0, 0)
+
+        with assert_raises(IndexError):
+            tier.merge(0, 1)
+
+    def test_merge_separator(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0, 0.25, 'a'),
+                                          Interval(0.25, 0.5, ''),
+                                          Interval(0.5, 0.75, 'c')])
+
+        assert_equal(tier.merge(0, 1).text, 'a')
+        assert_equal(tier.merge(0, 1, separator='+').text, 'a+c')
+
+    def test_label_index_after_edits(self):
+        rng = random.Random(0)
+        tier = IntervalTier('abc', 0, 100, [Interval(i, i + 1, 'abc'[i % 3])
+                                            for i in range(100)])
+        tier.find('a')
+
+        for _ in range(200):
+            action = rng.randrange(4)
+
+            if action == 0 and len(tier) > 1:
+                i = rng.randrange(len(tier) - 1)
+                tier.merge(i, rng.randrange(i + 1, min(i + 4, len(tier))),
+                           text=rng.choice('abcd'))
+
+            elif action == 1:
+                item = tier[rng.randrange(len(tier))]
+                tier.split((item.xmin + item.xmax) / 2,
+                           right_text=rng.choice('abcd'))
+
+            elif action == 2 and len(tier) > 1:
+                del tier[rng.randrange(-len(tier), len(tier))]
+
+            else:
+                tier.insert(100 + len(tier), 101 + len(tier), 'e')
+
+            labels = tier._labels
+            tier._labels = None
+
+            assert_equal(labels, tier._label_index())
+
+    def test_crop_bad_times(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0, 0.5, 'a')])
+
+        with assert_raises(ValueError):
+            tier.crop(0.5, 0.5)
+
+    def test_find(self):
+        int1 = Interval(0, 0.5, 'a')
+        int2 = Interval(0.5, 0.6, 'b')
+        int3 = Interval(0.75, 1, 'a')
+        tier = IntervalTier('abc', 0, 1, [int1, int2, int3])
+
+        assert_equal(tier.find('a'), [int1, int3])
+        assert_equal(tier.find('b'), [int2])
+        assert_equal(tier.find('c'), [])
+
+    def test_search(self):
+        int1 = Interval(0, 0.5, 'AA1')
+        int2 = Interval(0.5, 0.6, 'B')
+        int3 = Interval(0.75, 1, 'AE0')
+        tier = IntervalTier('abc', 0, 1, [int1, int2, int3])
+
+        assert_equal(tier.search(r'^A.\d$'), [int1, int3])
+        assert_equal(tier.search('b'), [])
+        assert_equal(tier.search('b', re.IGNORECASE), [int2])
+
+    def test_find_after_insert_and_del(self):
+        tier = IntervalTier('abc', 0, 10, [Interval(i, i + 1, 'ab'[i % 2])
+                                           for i in range(0, 10, 2)])
+        tier.find('a')
+
+        tier.insert(1, 2, 'b')
+        tier.insert(9, 10, 'c')
+        del tier[0]
+        del tier[-2]
+        tier.insert(0, 1, 'a')
+
+        for label in 'abc':
+            assert_equal(tier.find(label),
+                         [item for item in tier if item.text == label])
+
+        del tier[1:3]
+
+        for label in 'abc':
+            assert_equal(tier.find(label),
+                         [item for item in tier if item.text == label])
+
     def test_where_out_of_bounds(self):
         interval = Interval(0.35, 0.5, 'a')
         tier = IntervalTier('abc', 0.25, 1, [interval])
@@ -550,6 +1350,24 @@ class TestIntervalTier(object):
                                                      'xmax': 0.5,
                                                      'text': 'a'}]})
 
+    def test_from_dict(self):
+        tier = IntervalTier.from_dict({'xmin': 0.25,
+                                       'xmax': 1,
+                                       'name': 'abc',
+                                       'class': 'IntervalTier',
+                                       'intervals': [{'xmin': 0.5,
+                                                      'xmax': 0.6,
+                                                      'text': 'b'},
+                                                     {'xmin': 0.35,
+                                                      'xmax': 0.5,
+                                                      'text': 'a'}]})
+
+        assert_equal(tier.name, 'abc')
+        assert_equal(tier.xmin, 0.25)
+        assert_equal(tier.xmax, 1)
+        assert_equal(repr(tier._items), "[Interval(0.35, 0.5, 'a'), "
+                                        "Interval(0.5, 0.6, 'b')]")
+
     def test_to_praat(self):
         interval = Interval(0.35, 0.5, 'a')
         tier = IntervalTier('abc', 0.25, 1, [interval])
@@ -672,6 +1490,51 @@ class TestTextTier(object):
         assert_equal(tier.where(0.25, 1), [point1, point2])
         assert_equal(tier.where(0.5, 0.75), [point1, point2])
 
+    def test_crop(self):
+        point1 = Point(0.5, 'a')
+        point2 = Point(0.75, 'c')
+        tier = TextTier('abc', 0.25, 1, [point1, point2])
+
+        assert_equal(repr(tier.crop(0.5, 0.75)._items),
+                     "[Point(0.5, 'a'), Point(0.75, 'c')]")
+        assert_equal(repr(tier.crop(0.5, 0.7, False)._items),
+                     "[Point(0.0, 'a')]")
+        assert_equal(repr(tier.crop(0.8, 2)._items), '[]')
+
+    def test_find(self):
+        point1 = Point(0.5, 'a')
+        point2 = Point(0.75, 'c')
+        point3 = Point(0.8, 'a')
+        tier = TextTier('abc', 0.25, 1, [point1, point2, point3])
+
+        assert_equal(tier.find('a'), [point1, point3])
+        assert_equal(tier.search('[ac]'), [point1, point2, point3])
+
+    def test_nearest(self):
+        point1 = Point(0.5, 'a')
+        point2 = Point(0.75, 'c')
+        point3 = Point(0.8, 'a')
+        tier = TextTier('abc', 0, 1, [point1, point2, point3])
+
+        assert_is(tier.nearest(0), point1)
+        assert_is(tier.nearest(0.6), point1)
+        assert_is(tier.nearest(0.625), point1)
+        assert_is(tier.nearest(0.7), point2)
+        assert_is(tier.nearest(0.75), point2)
+        assert_is(tier.nearest(2), point3)
+        assert_is_none(TextTier('abc', 0, 1).nearest(0.5))
+
+    def test_nearest_k(self):
+        point1 = Point(0.5, 'a')
+        point2 = Point(0.75, 'c')
+        point3 = Point(0.8, 'a')
+        tier = TextTier('abc', 0, 1, [point1, point2, point3])
+
+        assert_equal(tier.nearest_k(0.7, 2), [point2, point3])
+        assert_equal(tier.nearest_k(0.7, 3), [point2, point3, point1])
+        assert_equal(tier.nearest_k(0, 5), [point1, point2, point3])
+        assert_equal(tier.nearest_k(1, 0), [])
+
     def test_where_range_out_of_bounds(self):
         point1 = Point(0.5, 'a')
         point2 = Point(0.75, 'c')
@@ -698,6 +1561,17 @@ class TestTextTier(object):
                                       'points': [{'number': 0.35,
                                                   'mark': 'a'}]})
 
+    def test_from_dict(self):
+        tier = TextTier.from_dict({'xmin': 0.25,
+                                   'xmax': 1,
+                                   'name': 'abc',
+                                   'class': 'TextTier',
+                                   'points': [{'number': 0.35,
+                                               'mark': 'a'}]})
+
+        assert_equal(tier.name, 'abc')
+        assert_equal(repr(tier._items), "[Point(0.35, 'a')]")
+
     def test_to_praat(self):
         point = Point(0.35, 'a')
         tier = TextTier('abc', 0.25, 1, [point])
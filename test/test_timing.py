@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import io
+import os
+import shutil
+import tempfile
+
+try:
+    import unittest.mock as mock
+except ImportError:
+    import mock
+
+from nose.tools import *
+
+import tgre.tgre
+from tgre import TextGrid, IntervalTier, Interval
+from tgre.cli import main
+from tgre.timing import PhaseTimer
+
+
+PATH = 'test/files/usage-example.TextGrid'
+
+
+class TestPhaseTimer(object):
+    def test_read(self):
+        with PhaseTimer() as timer:
+            tg = TextGrid.from_file(PATH)
+
+        totals = timer.totals()
+
+        assert_equal(sorted(totals),
+                     ['construct', 'decode', 'sort', 'tokenize'])
+        assert_equal(totals['decode']['size'], totals['tokenize']['size'])
+        assert_equal(totals['construct']['items'], 8)
+        assert_equal(totals['sort']['calls'], 3)
+        assert_equal(set(record.file for record in timer.records), {PATH})
+
+        assert_equal(tg.to_praat(), TextGrid.from_file(PATH).to_praat())
+        assert_is_not_none(tg[0]._source)
+
+    def test_read_stream(self):
+        with PhaseTimer() as timer:
+            tg = TextGrid.from_file(PATH, keep_source=False)
+
+        assert_equal(sorted(timer.totals()),
+                     ['construct', 'sort', 'tokenize'])
+        assert_is_none(tg[0]._source)
+        assert_equal(len(tg[1]), 3)
+
+    def test_from_bytes(self):
+        with io.open(PATH, 'rb') as textgrid_file:
+            data = textgrid_file.read()
+
+        with PhaseTimer() as timer:
+            TextGrid.from_bytes(data)
+
+        assert_equal(timer.totals()['decode']['size'],
+                     len(data.decode('utf_8')))
+        assert_is_none(timer.records[0].file)
+
+    def test_decode_size_is_characters(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0.25, 0.5, u'ñandú')])
+        text = TextGrid(0, 1, [tier]).to_praat()
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'utf16.TextGrid.gz')
+
+        try:
+            TextGrid(0, 1, [tier]).to_praat(path, encoding='utf_16')
+
+            with io.open(path, 'rb') as textgrid_file:
+                data = textgrid_file.read()
+
+            for read in (lambda: TextGrid.from_file(path, 'utf_16'),
+                         lambda: TextGrid.from_bytes(data, 'utf_16')):
+                with PhaseTimer() as timer:
+                    read()
+
+                totals = timer.totals()
+
+                assert_equal(totals['decode']['size'], len(text))
+                assert_equal(totals['tokenize']['size'], len(text))
+
+        finally:
+            shutil.rmtree(directory)
+
+    def test_write(self):
+        tier = IntervalTier('abc', 0, 1, [Interval(0.25, 0.5, 'a')])
+        tg = TextGrid(0, 1, [tier])
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'out.TextGrid')
+
+        try:
+            with PhaseTimer() as timer:
+                tg.to_praat(path)
+
+        finally:
+            shutil.rmtree(directory)
+
+        totals = timer.totals()
+
+        assert_equal(sorted(totals), ['check_items', 'format', 'write'])
+        assert_equal(totals['check_items']['items'], 3)
+        assert_equal(totals['format']['size'], totals['write']['size'])
+        assert_equal(timer.files()[path]['format'],
+                     totals['format']['seconds'])
+
+    def test_exclusive_times(self):
+        timer = PhaseTimer()
+
+        with mock.patch('timeit.default_timer', side_effect=[0, 1, 3, 10]):
+            timer._start('construct')
+            timer._start('sort')
+            timer._stop(5)
+            timer._stop(5)
+
+        assert_equal([(record.phase, record.seconds)
+                       for record in timer.records],
+                     [('sort', 2), ('construct', 8)])
+
+    def test_inactive(self):
+        with PhaseTimer() as timer:
+            with PhaseTimer() as inner:
+                assert_is(tgre.tgre._timer, inner)
+
+            assert_is(tgre.tgre._timer, timer)
+
+        assert_is_none(tgre.tgre._timer)
+
+        TextGrid.from_file(PATH)
+        assert_equal(timer.records, [])
+
+    def test_callback(self):
+        records = []
+
+        with PhaseTimer(callback=records.append) as timer:
+            TextGrid.from_file(PATH)
+
+        assert_equal(records, timer.records)
+
+    def test_error(self):
+        with PhaseTimer() as timer:
+            with assert_raises(ValueError):
+                TextGrid.from_string('"ooTextFile"\n"NotATextGrid"\n')
+
+            TextGrid.from_file(PATH)
+
+        assert_equal(timer._stack, [])
+        assert_equal(timer.totals()['construct']['items'], 8)
+
+    def test_report(self):
+        with PhaseTimer() as timer:
+            TextGrid.from_file(PATH)
+
+        lines = timer.report().splitlines()
+
+        assert_equal(lines[0].split()[0], 'phase')
+        assert_equal([line.split()[0] for line in lines[1:]],
+                     ['decode', 'tokenize', 'construct', 'sort'])
+
+    def test_cli(self):
+        stderr = io.StringIO()
+
+        with mock.patch('sys.stderr', stderr):
+            assert_equal(main(['validate', '-q', '--timing', PATH]), 0)
+
+        lines = stderr.getvalue().splitlines()
+        assert_equal(lines[0].split()[0], 'phase')
+        assert_in('construct', stderr.getvalue())
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import pickle
+
+from nose.tools import *
+
+from tgre import TextGrid, IntervalTier, TextTier, Interval, Point
+from tgre.packed import PackedIntervalTier
+from tgre.window import ItemRange, IntervalTierWindow, TextTierWindow
+
+
+class TestItemRange(object):
+    @classmethod
+    def setup_class(cls):
+        cls.items = ItemRange(['a', 'b', 'c', 'd', 'e'], 1, 4)
+
+    def test_len(self):
+        assert_equal(len(self.items), 3)
+
+    def test_get(self):
+        assert_equal(self.items[0], 'b')
+        assert_equal(self.items[-1], 'd')
+
+        with assert_raises(IndexError):
+            self.items[3]
+
+    def test_slice(self):
+        assert_equal(self.items[1:], ['c', 'd'])
+
+    def test_iter(self):
+        assert_equal(list(self.items), ['b', 'c', 'd'])
+        assert_equal(list(reversed(self.items)), ['d', 'c', 'b'])
+
+
+class TestIntervalTierWindow(object):
+    @classmethod
+    def setup_class(cls):
+        cls.tier = IntervalTier('abc', 0, 2, [Interval(0, 0.5, 'a'),
+                                              Interval(0.5, 0.625, 'b'),
+                                              Interval(0.75, 1, 'c'),
+                                              Interval(1, 2, 'd')])
+        cls.window = cls.tier.window(0.25, 0.875)
+
+    def test_init(self):
+        assert_is_instance(self.window, IntervalTierWindow)
+        assert_is_instance(self.window, IntervalTier)
+        assert_equal((self.window.name, self.window.xmin, self.window.xmax),
+                     ('abc', 0.25, 0.875))
+
+    def test_items(self):
+        assert_equal(len(self.window), 3)
+        assert_equal(list(self.window), self.tier[0:3])
+        assert_is(self.window[0], self.tier[0])
+
+    def test_where(self):
+        assert_is(self.window.where(0.3), self.tier[0])
+        assert_is(self.window.where(0.8), self.tier[2])
+        assert_is_none(self.window.where(0.7))
+        assert_is_none(self.window.where(0.1))
+        assert_is_none(self.window.where(0.9))
+
+    def test_find(self):
+        assert_equal(self.window.find('c'), [self.tier[2]])
+        assert_equal(self.window.find('d'), [])
+
+    def test_to_praat(self):
+        assert_equal(self.window.to_praat(),
+                     self.tier.crop(0.25, 0.875).to_praat())
+        assert_equal(self.tier[0].xmin, 0)
+
+    def test_to_dict(self):
+        assert_equal(self.window.to_dict(),
+                     self.tier.crop(0.25, 0.875).to_dict())
+
+    def test_nested(self):
+        window = self.window.window(0.5, 2)
+
+        assert_is(window.tier, self.tier)
+        assert_equal((window.xmin, window.xmax), (0.5, 0.875))
+        assert_equal(list(window), self.tier[1:3])
+
+    def test_pickle(self):
+        res = pickle.loads(pickle.dumps(self.window))
+
+        assert_is(res.__class__, IntervalTier)
+        assert_equal(res.to_dict(), self.window.to_dict())
+
+    def test_read_only(self):
+        with assert_raises(TypeError):
+            self.window.insert(0.625, 0.75, 'x')
+
+        with assert_raises(TypeError):
+            del self.window[0]
+
+        with assert_raises(TypeError):
+            self.window.shift(1)
+
+        with assert_raises(TypeError):
+            self.window.split(0.8125)
+
+        with assert_raises(TypeError):
+            self.window.move_boundary(0.75, 0.7)
+
+        with assert_raises(TypeError):
+            self.window.relabel({'a': 'x'})
+
+        assert_equal(self.tier[0].text, 'a')
+
+    def test_bad_times(self):
+        with assert_raises(ValueError):
+            self.tier.window(1, 0.5)
+
+    def test_packed(self):
+        packed = PackedIntervalTier.from_tier(self.tier)
+        window = packed.window(0.25, 0.875)
+
+        assert_equal(window.to_praat(), self.window.to_praat())
+        assert_equal(window.where(0.8).text, 'c')
+
+
+class TestTextTierWindow(object):
+    @classmethod
+    def setup_class(cls):
+        cls.tier = TextTier('abc', 0, 1, [Point(0.25, 'a'), Point(0.5, 'b'),
+                                          Point(0.75, 'c')])
+        cls.window = cls.tier.window(0.5, 1)
+
+    def test_items(self):
+        assert_is_instance(self.window, TextTierWindow)
+        assert_equal(list(self.window), self.tier[1:])
+
+    def test_where(self):
+        assert_is(self.window.where(0.5), self.tier[1])
+        assert_is_none(self.window.where(0.25))
+        assert_equal(self.window.where(0, 0.6), [self.tier[1]])
+
+    def test_to_praat(self):
+        assert_equal(self.window.to_praat(),
+                     self.tier.crop(0.5, 1).to_praat())
+
+
+class TestTextGridWindow(object):
+    def test_window(self):
+        tg = TextGrid.from_file('test/files/usage-example.TextGrid')
+        window = tg.window(1, 1.25)
+
+        assert_equal((window.xmin, window.xmax), (1, 1.25))
+        assert_equal(window.to_praat(), tg.crop(1, 1.25).to_praat())
+        assert_equal(len(window[2]), 0)
@@ -1,2 +1,2 @@
-from .tgre import praat_reader, praat_string, tier_from_reader
+from .tgre import praat_reader, praat_string, tier_from_reader, tier_from_dict
 from .tgre import TextGrid, IntervalTier, TextTier, Interval, Point
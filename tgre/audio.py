@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+"""Cut segments of a WAV file for the intervals in a tier.
+
+`WavFile` reads the header of a WAV file with the `wave` module, and
+then memory-maps the audio data with `numpy.memmap`, so the file is
+never read into memory as a whole. The segments for the intervals of a
+tier are views of the memory map: samples are only read from disk when
+a segment is used. Interval times are converted to sample positions for
+all of the intervals at once. Requires NumPy.
+
+>>> import tgre
+>>> from tgre.audio import WavFile
+>>> tg = tgre.TextGrid.from_file('utterance.TextGrid')
+>>> wav = WavFile('utterance.wav')
+>>> for interval, samples in wav.segments(tg[1], label='ciao'):
+...     print(interval.text, samples.shape)
+ciao (5200, 1)
+
+Only uncompressed PCM WAV files with 8, 16, or 32-bit samples can be
+memory-mapped.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import wave
+
+import numpy as np
+
+
+SAMPLE_TYPES = {1: np.uint8, 2: np.dtype('<i2'), 4: np.dtype('<i4')}
+
+
+class WavFile(object):
+    """Memory-mapped samples of a WAV file.
+
+    Parameters
+    ----------
+    path : str
+        Path to a WAV file.
+
+    Attributes
+    ----------
+    path
+    rate : int
+        Number of samples per second.
+
+    n_channels : int
+
+    n_samples : int
+        Number of samples in each channel.
+
+    data : numpy.memmap, shape (n_samples, n_channels)
+        Read-only samples of the file.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a WAV file, or if its samples can't be
+        memory-mapped.
+
+    """
+
+    def __init__(self, path):
+        with io.open(path, 'rb') as wav_file:
+            try:
+                reader = wave.open(wav_file)
+
+            except (wave.Error, EOFError) as e:
+                raise ValueError('Could not read WAV file {}: {}'
+                                 .format(path, e))
+
+            # The wave module stops reading at the start of the data
+            # chunk, so this is where the samples begin.
+            offset = wav_file.tell()
+            sample_width = reader.getsampwidth()
+
+            self.path = path
+            self.rate = reader.getframerate()
+            self.n_channels = reader.getnchannels()
+            self.n_samples = reader.getnframes()
+
+        if sample_width not in SAMPLE_TYPES:
+            raise ValueError('Cannot memory-map {}-bit samples'
+                             .format(8 * sample_width))
+
+        dtype = SAMPLE_TYPES[sample_width]
+        shape = (self.n_samples, self.n_channels)
+
+        if self.n_samples:
+            self.data = np.memmap(path, dtype=dtype, mode='r', offset=offset,
+                                  shape=shape)
+
+        else:
+            self.data = np.empty(shape, dtype=dtype)
+
+    def __repr__(self):
+        return ('<WavFile "{0.path}" with {0.n_channels} channels of '
+                '{0.n_samples} samples at {0.rate} Hz>'.format(self))
+
+    def sample_indices(self, times, rate=None):
+        """Return the positions of the samples nearest to some times.
+
+        Positions are limited to the range of samples in the file.
+
+        Parameters
+        ----------
+        times : array_like of int or float
+            Times in seconds, or in ticks at `rate`.
+
+        rate : int, optional
+            Number of ticks per second, for times stored as ticks (see
+            `tgre.TextGrid.to_ticks()`). Default is None (seconds).
+
+        Returns
+        -------
+        array of int64
+
+        """
+
+        times = np.asarray(times, dtype=np.float64)
+
+        if rate is None:
+            samples = times * self.rate
+
+        else:
+            samples = times * (self.rate / rate)
+
+        samples = np.rint(samples).astype(np.int64)
+
+        return np.clip(samples, 0, self.n_samples, out=samples)
+
+    def segment(self, xmin, xmax, rate=None):
+        """Return a view of the samples between two times.
+
+        Parameters
+        ----------
+        xmin : int or float
+            Start time, in seconds, or in ticks at `rate`.
+
+        xmax : int or float
+            End time, in seconds, or in ticks at `rate`.
+
+        rate : int, optional
+            Number of ticks per second, for times stored as ticks (see
+            `tgre.TextGrid.to_ticks()`), such as `tier.rate`. Default
+            is None (seconds).
+
+        Returns
+        -------
+        numpy.memmap, shape (n, n_channels)
+
+        """
+
+        start, stop = self.sample_indices([xmin, xmax], rate)
+        return self.data[start:stop]
+
+    def segments(self, tier, label=None):
+        """Yield a view of the samples for each interval in a tier.
+
+        Parameters
+        ----------
+        tier : IntervalTier
+
+        label : str, optional
+            If given, only intervals with this text are used, found
+            with `tier.find()`. Default is None (every interval).
+
+        Yields
+        ------
+        tuple of (Interval, numpy.memmap)
+            Each interval, and the samples from its `xmin` to its
+            `xmax`, with shape (n, n_channels).
+
+        """
+
+        intervals = list(tier) if label is None else tier.find(label)
+        times = [(interval.xmin, interval.xmax) for interval in intervals]
+
+        if not times:
+            return
+
+        bounds = self.sample_indices(times, tier.rate).tolist()
+
+        for interval, (start, stop) in zip(intervals, bounds):
+            yield interval, self.data[start:stop]
@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+
+"""Validate, convert, and summarize directories of TextGrids.
+
+This module is run by the `tgre` command (or `python -m tgre`), which
+has three subcommands. Each takes any number of TextGrid files and
+directories, and directories are searched recursively for files that
+match `--pattern`. Files are processed in a pool of `--jobs` worker
+processes, with a line written to stderr as each file is finished.
+
+- `tgre validate` reads each file and checks that it could be written
+  out again with `TextGrid.to_praat()`.
+- `tgre convert` writes each file to `--output` in another format:
+  'text' (the Praat text format of `TextGrid.to_praat()`), 'json' (the
+  dict of `TextGrid.to_dict()`), or 'pickle' (the compact binary
+  pickle of `TextGrid`). Files whose output is newer than the input are
+  skipped, unless `--force` is used.
+- `tgre stats` writes the combined `TextGrid.stats()` of every file as
+  JSON to stdout.
+
+Use `--timing` to write a table of the time spent in each phase of
+reading and writing the files to stderr (see `tgre.timing`).
+
+Errors don't stop the other files from being processed. Use `--report`
+to write a JSON file with the path and error message of each file that
+failed. The command exits with status 1 if any file failed.
+
+    $ tgre validate --jobs 4 --report errors.json corpus/
+    $ tgre convert --to json --output corpus-json/ corpus/
+    $ tgre stats corpus/ > stats.json
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import fnmatch
+import io
+import json
+import multiprocessing
+import os
+import pickle
+import sys
+
+from .stats import merge_stats
+from .tgre import TextGrid
+from .timing import PhaseTimer
+
+
+EXTENSIONS = {'text': '.TextGrid', 'json': '.json', 'pickle': '.pickle'}
+
+
+def find_files(paths, pattern='*.TextGrid'):
+    """Yield the TextGrid files in a list of files and directories.
+
+    Parameters
+    ----------
+    paths : list of str
+        Paths to files, which are always included, and to directories,
+        which are searched recursively.
+
+    pattern : str
+        Shell-style pattern for the names of files in directories,
+        matched without regard to case. Default is '*.TextGrid'.
+
+    Yields
+    ------
+    tuple of (str, str)
+        The path to each file, and its path relative to the directory
+        it was found in (or its name, for paths to files).
+
+    """
+
+    pattern = pattern.lower()
+
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path, os.path.basename(path)
+            continue
+
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+
+            for name in sorted(files):
+                if fnmatch.fnmatch(name.lower(), pattern):
+                    file_path = os.path.join(root, name)
+                    yield file_path, os.path.relpath(file_path, path)
+
+
+def _read(path, encoding):
+    try:
+        return TextGrid.from_file(path, encoding=encoding, keep_source=False)
+
+    except StopIteration:
+        raise ValueError('File ends before the TextGrid is complete')
+
+
+def _validate(task):
+    path, relpath, options = task
+    textgrid = _read(path, options['encoding'])
+    textgrid.to_praat()
+
+    return 'ok', None
+
+
+def _convert(task):
+    path, relpath, options = task
+    fmt = options['to']
+    stem = os.path.splitext(relpath)[0]
+    output = os.path.join(options['output'], stem + EXTENSIONS[fmt])
+
+    if (not options['force'] and os.path.exists(output)
+            and os.path.getmtime(output) >= os.path.getmtime(path)):
+        return 'skipped', None
+
+    textgrid = _read(path, options['encoding'])
+
+    directory = os.path.dirname(output)
+
+    if directory and not os.path.isdir(directory):
+        try:
+            os.makedirs(directory)
+
+        except OSError:
+            # Another worker may have made the directory first.
+            if not os.path.isdir(directory):
+                raise
+
+    if fmt == 'text':
+        textgrid.to_praat(output, encoding=options['encoding'])
+
+    elif fmt == 'json':
+        with io.open(output, 'w', encoding='utf_8') as json_file:
+            json_file.write(json.dumps(textgrid.to_dict(),
+                                       ensure_ascii=False))
+
+    else:
+        with io.open(output, 'wb') as pickle_file:
+            pickle.dump(textgrid, pickle_file, pickle.HIGHEST_PROTOCOL)
+
+    return 'converted', None
+
+
+def _stats(task):
+    path, relpath, options = task
+
+    return 'ok', _read(path, options['encoding']).stats()
+
+
+def _run(task):
+    """Run a task in a worker, and return its result or error message."""
+
+    func, path, relpath, options = task
+    timer = PhaseTimer()
+
+    try:
+        if options.get('timing'):
+            with timer:
+                status, result = func((path, relpath, options))
+
+        else:
+            status, result = func((path, relpath, options))
+
+    # Any error in one file is reported, rather than stopping the run.
+    except Exception as e:
+        return (path, 'error', None, '{}: {}'.format(e.__class__.__name__, e),
+                timer.records)
+
+    return path, status, result, None, timer.records
+
+
+def run(func, files, options, jobs=1, progress=None):
+    """Yield the results of running a function on files in a process pool.
+
+    Parameters
+    ----------
+    func : function
+        Module-level function that takes a tuple of (path, relative
+        path, options) and returns a tuple of (status, result).
+
+    files : list of tuple of (str, str)
+        Paths and relative paths, as yielded by `find_files()`.
+
+    options : dict
+        Options passed to `func`. If `options['timing']` is true, the
+        phases of reading and writing each file are timed (see
+        `tgre.timing`).
+
+    jobs : int
+        Number of worker processes. If 1, files are processed in this
+        process. Default is 1.
+
+    progress : file object, optional
+        If given, a line is written here as each file is finished.
+
+    Yields
+    ------
+    tuple of (str, str, object, str, list)
+        The path, status, result, error message (or None), and list of
+        `tgre.timing.PhaseRecord` for each file, in the order that they
+        are finished.
+
+    """
+
+    tasks = [(func, path, relpath, options) for path, relpath in files]
+
+    if jobs == 1:
+        results = map(_run, tasks)
+        pool = None
+
+    else:
+        pool = multiprocessing.Pool(jobs)
+        results = pool.imap_unordered(_run, tasks)
+
+    try:
+        for i, res in enumerate(results, 1):
+            path, status, result, error, records = res
+
+            if progress is not None:
+                print('[{}/{}] {}: {}'.format(i, len(tasks), path,
+                                              error or status),
+                      file=progress)
+
+            yield res
+
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+def _stats_dict(stats):
+    """Return a JSON-serializable dict of the stats for each tier name."""
+
+    res = {}
+
+    for name, tier_stats in stats.items():
+        means = tier_stats.mean_durations()
+        labels = dict((label, {'count': count,
+                               'duration': tier_stats.durations[label],
+                               'mean_duration': means[label]})
+                      for label, count in tier_stats.counts.items())
+
+        res[name] = {'count': tier_stats.count,
+                     'duration': tier_stats.duration,
+                     'labels': labels}
+
+    return res
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog='tgre', description='Validate, convert, and summarize '
+                                 'Praat TextGrid files.')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('paths', nargs='+', metavar='path',
+                        help='TextGrid file, or directory to search')
+    common.add_argument('--pattern', default='*.TextGrid',
+                        help='pattern for file names in directories '
+                             '(default: %(default)s)')
+    common.add_argument('--encoding', default='utf_8',
+                        choices=['utf_8', 'utf_16'],
+                        help='text encoding (default: %(default)s)')
+    common.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of worker processes, or 0 for one '
+                             'per CPU (default: %(default)s)')
+    common.add_argument('--report', metavar='PATH',
+                        help='write a JSON report of errors to this file')
+    common.add_argument('-q', '--quiet', action='store_true',
+                        help="don't write progress to stderr")
+    common.add_argument('--timing', action='store_true',
+                        help='write the time spent in each phase of '
+                             'reading and writing to stderr')
+
+    commands.add_parser('validate', parents=[common],
+                        help='check that files can be read and written')
+
+    convert = commands.add_parser('convert', parents=[common],
+                                  help='write files in another format')
+    convert.add_argument('--to', choices=sorted(EXTENSIONS), default='text',
+                         help='output format (default: %(default)s)')
+    convert.add_argument('-o', '--output', required=True, metavar='DIR',
+                         help='directory for the converted files')
+    convert.add_argument('-f', '--force', action='store_true',
+                         help='convert files even if the output is newer')
+
+    commands.add_parser('stats', parents=[common],
+                        help='write label counts and durations as JSON')
+
+    return parser
+
+
+def main(argv=None):
+    """Run the `tgre` command, and return its exit status.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Command-line arguments. Default is None (`sys.argv[1:]`).
+
+    Returns
+    -------
+    int
+        0 if every file was processed (including when no files were
+        found), or 1 if there were errors.
+
+    """
+
+    args = _parser().parse_args(argv)
+
+    options = {'encoding': args.encoding, 'timing': args.timing}
+    func = {'validate': _validate, 'convert': _convert,
+            'stats': _stats}[args.command]
+
+    if args.command == 'convert':
+        options.update(to=args.to, output=args.output, force=args.force)
+
+    jobs = args.jobs or multiprocessing.cpu_count()
+    progress = None if args.quiet else sys.stderr
+    files = list(find_files(args.paths, args.pattern))
+
+    if not files and progress is not None:
+        print('No files found', file=progress)
+
+    counts = {}
+    errors = []
+    stats = []
+    timer = PhaseTimer()
+
+    for path, status, result, error, records in run(func, files, options,
+                                                    jobs, progress):
+        counts[status] = counts.get(status, 0) + 1
+        timer.records.extend(records)
+
+        if error is not None:
+            errors.append({'path': path, 'error': error})
+
+        elif result is not None:
+            stats.append(result)
+
+    if args.command == 'stats':
+        # With no files (or no files that could be read), there are no
+        # tiers to merge, so the result is empty.
+        res = _stats_dict(merge_stats(stats)) if stats else {}
+        print(json.dumps(res, indent=2, sort_keys=True, ensure_ascii=False))
+
+    if args.timing:
+        print(timer.report(), file=sys.stderr)
+
+    if args.report is not None:
+        errors.sort(key=lambda error: error['path'])
+        report = {'command': args.command, 'files': len(files),
+                  'counts': counts, 'errors': errors}
+
+        with io.open(args.report, 'w', encoding='utf_8') as report_file:
+            report_file.write(json.dumps(report, indent=2,
+                                         ensure_ascii=False))
+
+    return 1 if errors else 0
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+
+"""Compare interval tiers, such as the output of two annotators.
+
+`compare_tiers()` compares a reference tier with another tier, and
+`compare_textgrids()` compares the interval tiers of two TextGrids that
+have the same names. Boundaries are matched with a single merge of the
+two tiers' sorted boundary times, and agreement is measured with a
+single sweep over both tiers' intervals, so the time taken grows
+linearly with the size of the tiers.
+
+>>> import tgre
+>>> from tgre.compare import compare_tiers
+>>> ref = tgre.IntervalTier('words', 0, 1, [tgre.Interval(0, 0.5, 'a'),
+...                                         tgre.Interval(0.5, 1, 'b')])
+>>> hyp = tgre.IntervalTier('words', 0, 1, [tgre.Interval(0, 0.51, 'a'),
+...                                         tgre.Interval(0.51, 1, 'c')])
+>>> res = compare_tiers(ref, hyp, tolerance=0.02)
+>>> print(res)
+<TierComparison with 2 matches, 1 mismatches, 0 deletions, 0 insertions>
+>>> res.mismatches
+[(Interval(0.5, 1, 'b'), Interval(0.51, 1, 'c'))]
+>>> round(res.agreement, 2)
+0.5
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from .tgre import IntervalTier
+
+
+# Default largest difference in seconds between matched boundaries.
+TOLERANCE = 0.02
+
+
+class TierComparison(object):
+    """Result of comparing a reference tier with another interval tier.
+
+    Intervals in the two tiers are matched when both of their
+    boundaries are matched.
+
+    Attributes
+    ----------
+    boundaries : list of tuple of (int or float, int or float)
+        Each pair of matched boundary times, from the reference tier
+        and from the other tier, in order.
+
+    matches : list of tuple of (Interval, Interval)
+        Each pair of matched intervals, from the reference tier and
+        from the other tier, in order.
+
+    deletions : list of Interval
+        Intervals in the reference tier with no match.
+
+    insertions : list of Interval
+        Intervals in the other tier with no match.
+
+    overlap : int or float
+        Total time, in seconds (or ticks, for tiers with times stored
+        as ticks), where both tiers have intervals with the same label.
+
+    union : int or float
+        Total time, in seconds (or ticks, for tiers with times stored
+        as ticks), where either tier has an interval.
+
+    """
+
+    def __init__(self, boundaries, matches, deletions, insertions, overlap,
+                 union):
+        self.boundaries = boundaries
+        self.matches = matches
+        self.deletions = deletions
+        self.insertions = insertions
+        self.overlap = overlap
+        self.union = union
+
+    def __repr__(self):
+        return ('<TierComparison with {} matches, {} mismatches, '
+                '{} deletions, {} insertions>'
+                .format(len(self.matches), len(self.mismatches),
+                        len(self.deletions), len(self.insertions)))
+
+    @property
+    def offsets(self):
+        """List of the differences between matched boundary times."""
+
+        return [other - ref for ref, other in self.boundaries]
+
+    @property
+    def mismatches(self):
+        """List of the matched pairs of intervals with different labels."""
+
+        return [(ref, other) for ref, other in self.matches
+                if ref.text != other.text]
+
+    @property
+    def agreement(self):
+        """Proportion of `union` where the tiers have the same label."""
+
+        if not self.union:
+            return 1.0
+
+        return self.overlap / self.union
+
+
+def compare_tiers(reference, other, tolerance=None, ignore_empty=True):
+    """Compare the boundaries and labels of two interval tiers.
+
+    Intervals in each tier should not overlap. If the tiers' times are
+    stored as ticks (see `TextGrid.to_ticks()`), they must have the
+    same rate, and all times, including `tolerance`, are in ticks.
+
+    Parameters
+    ----------
+    reference : IntervalTier
+
+    other : IntervalTier
+
+    tolerance : int or float, optional
+        Largest difference between the times of two boundaries that are
+        matched, in seconds (or ticks). Default is None (0.02 seconds,
+        converted to ticks at the tiers' rate).
+
+    ignore_empty : bool
+        If True, intervals with no text are left out of the comparison.
+        Default is True.
+
+    Returns
+    -------
+    TierComparison
+
+    Raises
+    ------
+    ValueError
+        If the tiers have different tick rates.
+
+    """
+
+    if reference.rate != other.rate:
+        raise ValueError('Tiers have different tick rates')
+
+    if tolerance is None:
+        tolerance = TOLERANCE
+
+        if reference.rate is not None:
+            tolerance *= reference.rate
+
+    ref_items = _intervals(reference, ignore_empty)
+    other_items = _intervals(other, ignore_empty)
+
+    boundaries = _match_boundaries(_boundaries(ref_items),
+                                   _boundaries(other_items), tolerance)
+
+    matched = dict(boundaries)
+    other_spans = dict(((item.xmin, item.xmax), item) for item in other_items)
+
+    matches = []
+    deletions = []
+
+    for item in ref_items:
+        span = (matched.get(item.xmin), matched.get(item.xmax))
+        match = other_spans.pop(span, None)
+
+        if match is None:
+            deletions.append(item)
+
+        else:
+            matches.append((item, match))
+
+    insertions = [item for item in other_items
+                  if (item.xmin, item.xmax) in other_spans]
+
+    overlap, both = _overlap(ref_items, other_items)
+    union = sum(item.xmax - item.xmin for item in ref_items)
+    union += sum(item.xmax - item.xmin for item in other_items) - both
+
+    return TierComparison(boundaries, matches, deletions, insertions,
+                          overlap, union)
+
+
+def compare_textgrids(reference, other, tolerance=None, ignore_empty=True):
+    """Compare the interval tiers with the same names in two TextGrids.
+
+    Parameters
+    ----------
+    reference : TextGrid
+
+    other : TextGrid
+
+    tolerance : int or float
+        See `compare_tiers()`.
+
+    ignore_empty : bool
+        See `compare_tiers()`.
+
+    Returns
+    -------
+    dict
+        The `TierComparison` for each name that belongs to an interval
+        tier in both TextGrids. If there are several tiers with the
+        same name, only the first is compared.
+
+    """
+
+    others = {}
+
+    for tier in reversed(other.tiers):
+        if isinstance(tier, IntervalTier):
+            others[tier.name] = tier
+
+    res = {}
+
+    for tier in reference.tiers:
+        if (isinstance(tier, IntervalTier) and tier.name in others
+                and tier.name not in res):
+            res[tier.name] = compare_tiers(tier, others[tier.name],
+                                           tolerance, ignore_empty)
+
+    return res
+
+
+def _intervals(tier, ignore_empty):
+    if ignore_empty:
+        return [item for item in tier if item.text]
+
+    return list(tier)
+
+
+def _boundaries(intervals):
+    """Return the sorted, distinct boundary times of a list of intervals."""
+
+    times = []
+
+    for item in intervals:
+        if not times or times[-1] != item.xmin:
+            times.append(item.xmin)
+
+        times.append(item.xmax)
+
+    return times
+
+
+def _match_boundaries(ref_times, other_times, tolerance):
+    """Return pairs of boundary times that are within the tolerance.
+
+    Each time is matched at most once. If a time could be matched with
+    either of two times, it is matched with the nearer one.
+
+    """
+
+    pairs = []
+    i = j = 0
+
+    while i < len(ref_times) and j < len(other_times):
+        ref = ref_times[i]
+        other = other_times[j]
+
+        if abs(other - ref) <= tolerance:
+            if (j + 1 < len(other_times)
+                    and abs(other_times[j + 1] - ref) < abs(other - ref)):
+                j += 1
+                continue
+
+            if (i + 1 < len(ref_times)
+                    and abs(ref_times[i + 1] - other) < abs(other - ref)):
+                i += 1
+                continue
+
+            pairs.append((ref, other))
+            i += 1
+            j += 1
+
+        elif other < ref:
+            j += 1
+
+        else:
+            i += 1
+
+    return pairs
+
+
+def _overlap(ref_items, other_items):
+    """Return how long intervals overlap with the same label, and at all."""
+
+    same = both = 0
+    i = j = 0
+
+    while i < len(ref_items) and j < len(other_items):
+        ref = ref_items[i]
+        other = other_items[j]
+
+        duration = min(ref.xmax, other.xmax) - max(ref.xmin, other.xmin)
+
+        if duration > 0:
+            both += duration
+
+            if ref.text == other.text:
+                same += duration
+
+        if ref.xmax <= other.xmax:
+            i += 1
+
+        else:
+            j += 1
+
+    return same, both
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""Read collections of TextGrids.
+
+Examples
+--------
+Read every TextGrid in a zip or tar archive, without extracting the
+archive to disk first.
+
+>>> from tgre.corpus import iter_archive
+>>> for name, tg in iter_archive('corpus.zip'):
+...     print(name, tg)
+speaker1/utterance1.TextGrid <TextGrid from 0 to 2.5 seconds with 3 tiers>
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import fnmatch
+import tarfile
+import zipfile
+
+from .tgre import TextGrid
+
+
+def _matches(name, pattern):
+    return fnmatch.fnmatch(name.lower(), pattern.lower())
+
+
+def iter_archive(path, pattern='*.TextGrid', encoding='utf_8',
+                 keep_source=True):
+    """Yield the TextGrids stored in a zip or tar archive.
+
+    Members are parsed directly from the archive. Tar archives are read
+    as a stream, so compressed tar files (such as .tar.gz) are only
+    decompressed once, from start to finish.
+
+    Parameters
+    ----------
+    path : str
+        Path to a zip file, or to a (possibly compressed) tar file.
+
+    pattern : str
+        Shell-style pattern for the names of the members to read,
+        matched without regard to case. Default is '*.TextGrid'.
+
+    encoding : {'utf_8', 'utf_16'}
+        Text encoding of the TextGrid files. Default is 'utf_8'.
+
+    keep_source : bool
+        Passed to `TextGrid.from_file()`. Default is True.
+
+    Yields
+    ------
+    tuple of (str, TextGrid)
+        The name of each archive member, and the TextGrid it contains.
+
+    Raises
+    ------
+    ValueError
+        If `path` is not a zip or tar file, or if one of the TextGrids
+        can't be parsed.
+
+    """
+
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if info.filename.endswith('/'):
+                    continue
+
+                if not _matches(info.filename, pattern):
+                    continue
+
+                with archive.open(info) as member:
+                    yield info.filename, TextGrid.from_file(
+                        member, encoding=encoding, keep_source=keep_source)
+
+        return
+
+    try:
+        archive = tarfile.open(path, 'r|*')
+
+    except tarfile.TarError:
+        raise ValueError('{} is not a zip or tar file'.format(path))
+
+    with archive:
+        for info in archive:
+            if not info.isfile() or not _matches(info.name, pattern):
+                continue
+
+            member = archive.extractfile(info)
+            yield info.name, TextGrid.from_file(
+                member, encoding=encoding, keep_source=keep_source)
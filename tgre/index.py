@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+
+"""Index the contents of many TextGrids in an SQLite database.
+
+A `CorpusIndex` parses TextGrid files once and stores their tiers,
+intervals, and points in an SQLite file, so that questions about a
+whole corpus can be answered without reading the TextGrids again.
+Calling `update()` again later only reads files that are new, or that
+have a different modification time or size than when they were indexed.
+
+>>> import os
+>>> from tgre.index import CorpusIndex
+>>> index = CorpusIndex('corpus.sqlite')
+>>> index.update(['test/files/one-point.TextGrid',
+...               'test/files/usage-example.TextGrid'])
+2
+>>> for row in index.intervals(text='ciao', rows=True):
+...     print(os.path.relpath(row['file']), row['tier'], row['xmin'],
+...           row['xmax'])
+test/files/usage-example.TextGrid Sam 1.125 1.45
+
+Rows can be used to look up other intervals, such as the phones within
+each word.
+
+>>> for word in index.intervals(text='hello', tier='words', rows=True):
+...     phones = index.intervals(tier='phones', file=word['file'],
+...                              start=word['xmin'], end=word['xmax'])
+
+Times are stored as floats. The tables are named `files`, `tiers`,
+`intervals`, and `points`, and can also be queried directly with
+`CorpusIndex.connection`, which is an `sqlite3.Connection`.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import operator
+import os
+import re
+import sqlite3
+
+from .tgre import TextGrid, IntervalTier, TextTier
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    xmin REAL,
+    xmax REAL
+);
+
+CREATE TABLE IF NOT EXISTS tiers (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT,
+    class TEXT NOT NULL,
+    xmin REAL,
+    xmax REAL
+);
+
+CREATE TABLE IF NOT EXISTS intervals (
+    tier_id INTEGER NOT NULL REFERENCES tiers (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    xmin REAL NOT NULL,
+    xmax REAL NOT NULL,
+    text TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS points (
+    tier_id INTEGER NOT NULL REFERENCES tiers (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    number REAL NOT NULL,
+    mark TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS tiers_file ON tiers (file_id);
+CREATE INDEX IF NOT EXISTS tiers_name ON tiers (name);
+CREATE INDEX IF NOT EXISTS intervals_time ON intervals (tier_id, xmin);
+CREATE INDEX IF NOT EXISTS intervals_text ON intervals (text);
+CREATE INDEX IF NOT EXISTS points_time ON points (tier_id, number);
+CREATE INDEX IF NOT EXISTS points_mark ON points (mark);
+"""
+
+ITEM_TABLES = {IntervalTier: 'intervals', TextTier: 'points'}
+
+
+class CorpusIndex(object):
+    """SQLite index of the tiers, intervals, and points in TextGrid files.
+
+    Parameters
+    ----------
+    path : str
+        Path to the database file, which is created if it doesn't
+        exist. Use ':memory:' for a temporary in-memory index.
+
+    Attributes
+    ----------
+    connection : sqlite3.Connection
+
+    """
+
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA foreign_keys = ON')
+        self.connection.executescript(SCHEMA)
+        self.connection.create_function('REGEXP', 2, _regexp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+
+        self.connection.close()
+
+    def update(self, paths, encoding='utf_8'):
+        """Add TextGrid files to the index, or refresh files that changed.
+
+        Files that are already indexed with the same modification time
+        and size are skipped without being read. Paths are stored as
+        absolute paths, so a file is only indexed once however it is
+        named. The files are added in a single transaction, which is
+        committed once, when all of them have been indexed. If writing
+        to the database fails, none of the files are added.
+
+        Parameters
+        ----------
+        paths : iterable of str
+            Paths to TextGrid files.
+
+        encoding : {'utf_8', 'utf_16'}
+            Text encoding of the TextGrid files. Default is 'utf_8'.
+
+        Returns
+        -------
+        int
+            Number of files that were read and indexed.
+
+        Raises
+        ------
+        ValueError
+            If one of the TextGrids can't be parsed. Files indexed
+            before the error are kept.
+
+        """
+
+        count = 0
+
+        try:
+            for path in paths:
+                path = os.path.abspath(path)
+                stat = os.stat(path)
+
+                row = self.connection.execute(
+                    'SELECT mtime, size FROM files WHERE path = ?',
+                    (path,)).fetchone()
+
+                if row == (stat.st_mtime, stat.st_size):
+                    continue
+
+                textgrid = TextGrid.from_file(path, encoding=encoding,
+                                              keep_source=False)
+
+                try:
+                    self.connection.execute(
+                        'DELETE FROM files WHERE path = ?', (path,))
+                    self._insert(path, stat, textgrid)
+
+                except Exception:
+                    # Don't commit part of a file.
+                    self.connection.rollback()
+                    raise
+
+                count += 1
+
+        finally:
+            self.connection.commit()
+
+        return count
+
+    def _insert(self, path, stat, textgrid):
+        cursor = self.connection.execute(
+            'INSERT INTO files (path, mtime, size, xmin, xmax) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (path, stat.st_mtime, stat.st_size, textgrid.xmin, textgrid.xmax))
+
+        file_id = cursor.lastrowid
+
+        for position, tier in enumerate(textgrid):
+            cursor = self.connection.execute(
+                'INSERT INTO tiers (file_id, position, name, class, '
+                'xmin, xmax) VALUES (?, ?, ?, ?, ?, ?)',
+                (file_id, position, tier.name, tier.__class__.__name__,
+                 tier.xmin, tier.xmax))
+
+            table = _item_table(tier)
+            fields = tier.item.fields
+            values = operator.attrgetter(*fields)
+            tier_id = cursor.lastrowid
+
+            self.connection.executemany(
+                'INSERT INTO {} (tier_id, position, {}) VALUES (?, ?, {})'
+                .format(table, ', '.join(fields),
+                        ', '.join('?' * len(fields))),
+                [(tier_id, i) + values(item) for i, item in enumerate(tier)])
+
+    def prune(self):
+        """Remove files that no longer exist from the index.
+
+        Returns
+        -------
+        int
+            Number of files that were removed.
+
+        """
+
+        paths = [path for path, in
+                 self.connection.execute('SELECT path FROM files')
+                 if not os.path.exists(path)]
+
+        with self.connection:
+            self.connection.executemany('DELETE FROM files WHERE path = ?',
+                                        [(path,) for path in paths])
+
+        return len(paths)
+
+    def files(self):
+        """Return the absolute paths of the indexed files, in sorted order.
+
+        Returns
+        -------
+        list of str
+
+        """
+
+        return [path for path, in self.connection.execute(
+            'SELECT path FROM files ORDER BY path')]
+
+    def intervals(self, text=None, pattern=None, tier=None, file=None,
+                  start=None, end=None, rows=False):
+        """Return indexed intervals that match all of the given criteria.
+
+        Parameters
+        ----------
+        text : str, optional
+            Text of the intervals.
+
+        pattern : str, optional
+            Regex to search for in the text of the intervals.
+
+        tier : str, optional
+            Name of the tier that the intervals are on.
+
+        file : str, optional
+            Path of the file that the intervals are in, which can be
+            relative to the current directory.
+
+        start, end : int or float, optional
+            Only return intervals that are within these times.
+
+        rows : bool
+            If True, return `sqlite3.Row` objects with the keys 'file',
+            'tier', 'position', 'xmin', 'xmax', and 'text', where
+            'position' is the interval's position in its tier. If False,
+            return `Interval` objects. Default is False.
+
+        Returns
+        -------
+        list of Interval or list of sqlite3.Row
+            Matching intervals, sorted by file, tier, and time.
+
+        """
+
+        return self._select(IntervalTier, text, pattern, tier, file,
+                            start, end, rows)
+
+    def points(self, mark=None, pattern=None, tier=None, file=None,
+               start=None, end=None, rows=False):
+        """Return indexed points that match all of the given criteria.
+
+        Parameters
+        ----------
+        mark : str, optional
+            Mark of the points.
+
+        pattern : str, optional
+            Regex to search for in the mark of the points.
+
+        tier : str, optional
+            Name of the tier that the points are on.
+
+        file : str, optional
+            Path of the file that the points are in, which can be
+            relative to the current directory.
+
+        start, end : int or float, optional
+            Only return points between these times (inclusive).
+
+        rows : bool
+            If True, return `sqlite3.Row` objects with the keys 'file',
+            'tier', 'position', 'number', and 'mark'. If False, return
+            `Point` objects. Default is False.
+
+        Returns
+        -------
+        list of Point or list of sqlite3.Row
+            Matching points, sorted by file, tier, and time.
+
+        """
+
+        return self._select(TextTier, mark, pattern, tier, file,
+                            start, end, rows)
+
+    def _select(self, tier_class, label, pattern, tier, file, start, end,
+                rows):
+        table = ITEM_TABLES[tier_class]
+        fields = tier_class.item.fields
+        first, last, label_field = fields[0], fields[-2], fields[-1]
+
+        conditions = []
+        params = []
+
+        if file is not None:
+            file = os.path.abspath(file)
+
+        for condition, value in (('i.{} = ?'.format(label_field), label),
+                                 ('i.{} REGEXP ?'.format(label_field),
+                                  pattern),
+                                 ('t.name = ?', tier),
+                                 ('f.path = ?', file),
+                                 ('i.{} >= ?'.format(first), start),
+                                 ('i.{} <= ?'.format(last), end)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+
+        query = ('SELECT f.path AS file, t.name AS tier, i.position, {} '
+                 'FROM {} AS i '
+                 'JOIN tiers AS t ON t.id = i.tier_id '
+                 'JOIN files AS f ON f.id = t.file_id '
+                 '{} ORDER BY f.path, t.position, i.position'
+                 .format(', '.join('i.' + field for field in fields), table,
+                         'WHERE ' + ' AND '.join(conditions)
+                         if conditions else ''))
+
+        cursor = self.connection.cursor()
+
+        if rows:
+            cursor.row_factory = sqlite3.Row
+            return cursor.execute(query, params).fetchall()
+
+        return [tier_class.item(*row[3:])
+                for row in cursor.execute(query, params)]
+
+
+def _item_table(tier):
+    for tier_class, table in ITEM_TABLES.items():
+        if isinstance(tier, tier_class):
+            return table
+
+    raise TypeError('Cannot index a {}'.format(tier.__class__.__name__))
+
+
+_regexes = {}
+
+
+def _regexp(pattern, value):
+    """Implement the SQL REGEXP operator with `re.search()`."""
+
+    regex = _regexes.get(pattern)
+
+    if regex is None:
+        regex = _regexes[pattern] = re.compile(pattern)
+
+    return regex.search(value) is not None
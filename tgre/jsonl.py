@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+"""Convert TextGrids to and from JSON Lines records.
+
+Each TextGrid is written as one record for the TextGrid, one record for
+each tier, and one record for each interval or point, so that large
+collections of TextGrids can be streamed one line at a time. Every
+record has a 'class' key and a 'file' key that identifies the TextGrid
+it belongs to. Tier, interval, and point records also have a 'tier'
+key, giving the position of the tier in the TextGrid.
+
+>>> import io
+>>> import tgre
+>>> from tgre import jsonl
+>>> tg = tgre.TextGrid.from_file('test/files/one-point.TextGrid')
+>>> for record in jsonl.records(tg, file='one-point'):
+...     print(record)
+{'class': 'TextGrid', 'file': 'one-point', 'xmin': 0, 'xmax': 1}
+{'class': 'TextTier', 'file': 'one-point', 'tier': 0, 'name': 'bell', 'xmin': 0, 'xmax': 1}
+{'class': 'Point', 'file': 'one-point', 'tier': 0, 'tier_name': 'bell', 'number': 0.5, 'mark': 'asdf'}
+
+Write TextGrids to a JSON Lines file with `dump()`, and read them back
+with `load()`.
+
+>>> with io.open('corpus.jsonl', 'w', encoding='utf_8') as fp:
+...     jsonl.dump([('one-point', tg)], fp)
+>>> with io.open('corpus.jsonl', encoding='utf_8') as fp:
+...     for file, tg in jsonl.load(fp):
+...         print(file, tg)
+one-point <TextGrid from 0 to 1 seconds with 1 tiers>
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import operator
+
+from .tgre import TextGrid, IntervalTier, TextTier, _seconds
+from .packed import PackedTier
+from .window import TierWindow
+
+
+TIER_CLASSES = {'IntervalTier': IntervalTier, 'TextTier': TextTier}
+ITEM_CLASSES = {'Interval': IntervalTier.item, 'Point': TextTier.item}
+
+
+def records(textgrid, file=None):
+    """Yield JSON-serializable records for a TextGrid and its contents.
+
+    Times stored as ticks (see `TextGrid.to_ticks()`) are written in
+    seconds. Windows (see `TextGrid.window()`) and packed tiers are
+    written as the tiers of their base type, with the items of windows
+    cut off at the window's edges, so the records can be read back by
+    `from_records()`.
+
+    Parameters
+    ----------
+    textgrid : TextGrid
+
+    file : str, optional
+        Identifier for the TextGrid, such as its path. Default is None.
+
+    Yields
+    ------
+    dict
+
+    """
+
+    xmin, xmax = _seconds((textgrid.xmin, textgrid.xmax), textgrid.rate)
+
+    yield {'class': 'TextGrid', 'file': file, 'xmin': xmin, 'xmax': xmax}
+
+    for i, tier in enumerate(textgrid):
+        if isinstance(tier, (TierWindow, PackedTier)):
+            tier = tier._copy()
+
+        if tier.rate is not None:
+            tier = tier._seconds()
+
+        yield {'class': tier.__class__.__name__, 'file': file, 'tier': i,
+               'name': tier.name, 'xmin': tier.xmin, 'xmax': tier.xmax}
+
+        fields = tier.item.fields
+        values = operator.attrgetter(*fields)
+        base = {'class': tier.item.__name__, 'file': file, 'tier': i,
+                'tier_name': tier.name}
+
+        for item in tier:
+            record = base.copy()
+            record.update(zip(fields, values(item)))
+            yield record
+
+
+def from_records(records):
+    """Yield TextGrids rebuilt from a stream of records.
+
+    The records for each TextGrid should follow its TextGrid record,
+    as they do in the output of `records()`. Each TextGrid is yielded
+    as soon as the records for the next TextGrid begin, so only one
+    TextGrid is held in memory at a time.
+
+    Parameters
+    ----------
+    records : iterable of dict
+
+    Yields
+    ------
+    tuple of (str, TextGrid)
+        The 'file' identifier of each TextGrid, and the TextGrid.
+
+    Raises
+    ------
+    ValueError
+        If a record has an unknown class, or if a tier, interval, or
+        point record comes before the record it belongs to.
+
+    """
+
+    current = None
+
+    for record in records:
+        record_class = record['class']
+
+        if record_class == 'TextGrid':
+            if current is not None:
+                yield _build(*current)
+
+            current = (record['file'], record['xmin'], record['xmax'], [])
+            continue
+
+        if current is None:
+            raise ValueError('{} record found before TextGrid record'
+                             .format(record_class))
+
+        tiers = current[3]
+
+        if record_class in TIER_CLASSES:
+            if record['tier'] != len(tiers):
+                raise ValueError('Tier record {} out of order'
+                                 .format(record['tier']))
+
+            tiers.append((TIER_CLASSES[record_class], record['name'],
+                          record['xmin'], record['xmax'], []))
+
+        elif record_class in ITEM_CLASSES:
+            try:
+                items = tiers[record['tier']][4]
+
+            except IndexError:
+                raise ValueError('{} record found before tier record'
+                                 .format(record_class))
+
+            item = ITEM_CLASSES[record_class]
+            items.append(item(*[record[field] for field in item.fields]))
+
+        else:
+            raise ValueError('Record class "{}" not recognized'
+                             .format(record_class))
+
+    if current is not None:
+        yield _build(*current)
+
+
+def _build(file, xmin, xmax, tiers):
+    tiers = [tier_class(name, tier_xmin, tier_xmax, items)
+             for tier_class, name, tier_xmin, tier_xmax, items in tiers]
+
+    return file, TextGrid(xmin, xmax, tiers)
+
+
+def dump(textgrids, fp):
+    """Write TextGrids to a file as JSON Lines.
+
+    Parameters
+    ----------
+    textgrids : iterable of tuple of (str, TextGrid)
+        Pairs of identifiers and TextGrids, such as the pairs yielded
+        by `load()` or by `tgre.corpus.iter_archive()`.
+
+    fp : file object
+        File opened for writing text, with a UTF-8 encoding.
+
+    """
+
+    encode = json.JSONEncoder(ensure_ascii=False,
+                              separators=(',', ':')).encode
+
+    for file, textgrid in textgrids:
+        for record in records(textgrid, file):
+            fp.write(encode(record))
+            fp.write('\n')
+
+
+def load(fp):
+    """Yield TextGrids from a JSON Lines file written by `dump()`.
+
+    Parameters
+    ----------
+    fp : file object
+        File opened for reading text.
+
+    Yields
+    ------
+    tuple of (str, TextGrid)
+
+    """
+
+    return from_records(json.loads(line) for line in fp if line.strip())
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+"""Combine the intervals of several interval tiers into a new tier.
+
+The functions in this module sweep over the sorted boundaries of all of
+the tiers at once, merging the tiers' boundaries with `heapq.merge()`,
+so the boundaries of k tiers with N intervals in total are swept in
+O(N log k) time.
+Intervals with no text are treated as gaps.
+
+- `union()` makes an interval for each stretch of time that is covered
+  by an interval in any of the tiers, such as the turns in a
+  conversation with a tier for each speaker.
+- `intersection()` makes an interval for each stretch of time that is
+  covered by an interval in every tier, with a boundary wherever one of
+  the tiers has a boundary, such as each phone in each word.
+- `flatten()` makes an interval for each stretch of time that is covered
+  by an interval in any of the tiers, with a boundary wherever one of
+  the tiers has a boundary.
+
+The label of each new interval is made by a `combine` function, which
+is given a list of the labels of the intervals that it covers. By
+default, the labels are joined with spaces.
+
+>>> import tgre
+>>> from tgre.overlay import union
+>>> pat = tgre.IntervalTier('Pat', 0, 3, [tgre.Interval(0, 1, 'hi'),
+...                                       tgre.Interval(2, 3, 'bye')])
+>>> sam = tgre.IntervalTier('Sam', 0, 3, [tgre.Interval(0.5, 1.5, 'hello')])
+>>> for interval in union([pat, sam], name='turns'):
+...     print(interval)
+<Interval "hi hello" from 0 to 1.5>
+<Interval "bye" from 2 to 3>
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import heapq
+
+from .tgre import IntervalTier
+
+
+START = 1
+END = 0
+
+
+def _join(labels):
+    return ' '.join(labels)
+
+
+def union(tiers, name=None, combine=_join):
+    """Return a tier with the time covered by intervals in any tier.
+
+    Parameters
+    ----------
+    tiers : list of IntervalTier
+
+    name : str, optional
+        Name of the new tier. Default is the name of the first tier.
+
+    combine : function
+        Function that takes a list of the labels of the intervals that
+        make up each new interval, in the order that they start, and
+        returns a label for the new interval. Default is to join the
+        labels with spaces.
+
+    Returns
+    -------
+    IntervalTier
+
+    """
+
+    intervals = []
+    labels = []
+    xmin = xmax = None
+
+    for start, end, active, count, started in _sweep(tiers):
+        if start != xmax:
+            if labels:
+                intervals.append(IntervalTier.item(xmin, xmax,
+                                                   combine(labels)))
+
+            labels = []
+            xmin = start
+
+        labels.extend(started)
+        xmax = end
+
+    if labels:
+        intervals.append(IntervalTier.item(xmin, xmax, combine(labels)))
+
+    return _tier(tiers, name, intervals)
+
+
+def intersection(tiers, name=None, combine=_join):
+    """Return a tier with the time covered by intervals in every tier.
+
+    Parameters
+    ----------
+    tiers : list of IntervalTier
+
+    name : str, optional
+        Name of the new tier. Default is the name of the first tier.
+
+    combine : function
+        Function that takes a list of the labels of the intervals in
+        each tier at each new interval, in the order of the tiers, and
+        returns a label for the new interval. Default is to join the
+        labels with spaces.
+
+    Returns
+    -------
+    IntervalTier
+
+    """
+
+    intervals = [IntervalTier.item(start, end, combine(list(active)))
+                 for start, end, active, count, started in _sweep(tiers)
+                 if count == len(tiers)]
+
+    return _tier(tiers, name, intervals)
+
+
+def flatten(tiers, name=None, combine=_join):
+    """Return a tier with the boundaries of all of the tiers.
+
+    Parameters
+    ----------
+    tiers : list of IntervalTier
+
+    name : str, optional
+        Name of the new tier. Default is the name of the first tier.
+
+    combine : function
+        Function that takes a list of the labels of the intervals at
+        each new interval, in the order of the tiers (leaving out tiers
+        with no interval there), and returns a label for the new
+        interval. Default is to join the labels with spaces.
+
+    Returns
+    -------
+    IntervalTier
+
+    """
+
+    intervals = []
+
+    for start, end, active, count, started in _sweep(tiers):
+        labels = [label for label in active if label is not None]
+        intervals.append(IntervalTier.item(start, end, combine(labels)))
+
+    return _tier(tiers, name, intervals)
+
+
+def _events(tier, index):
+    """Yield the start and end of each labeled interval in a tier."""
+
+    for item in tier:
+        if item.text:
+            yield item.xmin, START, index, item.text
+            yield item.xmax, END, index, item.text
+
+
+def _sweep(tiers):
+    """Yield each stretch of time between boundaries that has intervals.
+
+    Yields
+    ------
+    tuple of (start, end, active, count, started)
+        The start and end times of the stretch; a list with the label
+        of the interval in each tier, or None for tiers with no
+        interval there; the number of tiers with an interval there; and
+        the labels of the intervals that begin at `start`. The `active`
+        list is updated in place as the sweep continues.
+
+    """
+
+    for tier in tiers:
+        if not isinstance(tier, IntervalTier):
+            raise TypeError('Cannot combine a {}'
+                            .format(tier.__class__.__name__))
+
+    events = heapq.merge(*[_events(tier, i) for i, tier in enumerate(tiers)])
+
+    active = [None] * len(tiers)
+    count = 0
+    started = []
+    prev = None
+
+    for time, kind, index, label in events:
+        if count and time > prev:
+            yield prev, time, active, count, started
+            started = []
+
+        if kind == START:
+            active[index] = label
+            count += 1
+            started.append(label)
+
+        else:
+            active[index] = None
+            count -= 1
+
+        prev = time
+
+
+def _tier(tiers, name, intervals):
+    if not tiers:
+        raise ValueError('No tiers to combine')
+
+    if name is None:
+        name = tiers[0].name
+
+    return IntervalTier(name, min(tier.xmin for tier in tiers),
+                        max(tier.xmax for tier in tiers), intervals)
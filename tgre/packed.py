@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+
+"""Read-only tiers backed by arrays of times and label codes.
+
+A packed tier stores its items as columns instead of as a list of
+`Interval` or `Point` objects: one column of times for each time field
+of the item (`xmin` and `xmax`, or `number`), a list of the distinct
+labels, and a column of codes giving the label of each item. The
+columns can be any sequence of numbers that supports indexing, such as
+an `array.array`, a `memoryview`, or a NumPy array, so a packed tier
+can refer to memory that it doesn't own.
+
+Items are only created when they are accessed. Packed tiers support
+indexing, iteration, `len()`, `where()`, `crop()`, `to_dict()`, and
+`to_praat()` like other tiers, but items can't be inserted or deleted,
+and times can't be changed. `to_dict()` and `to_praat()` write the
+packed tier as its base `IntervalTier` or `TextTier`, so that it can be
+read back by Praat and by `TextGrid.from_dict()`.
+
+>>> import tgre
+>>> from tgre.packed import PackedIntervalTier
+>>> tg = tgre.TextGrid.from_file('test/files/usage-example.TextGrid')
+>>> tier = PackedIntervalTier.from_tier(tg[1])
+>>> print(tier.where(1.2))
+<Interval "ciao" from 1.125 to 1.45>
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import array
+import bisect
+import operator
+
+from .tgre import IntervalTier, TextTier, Tier, _label_codes
+
+
+class PackedItems(object):
+    """Sequence of items created on demand from columns of values.
+
+    Parameters
+    ----------
+    item : class
+        Item class, such as `Interval` or `Point`.
+
+    columns : list of sequences of int or float
+        One column for each of the item's fields except the last.
+
+    vocabulary : list of str
+        Distinct labels of the items.
+
+    codes : sequence of int
+        Position in `vocabulary` of the label of each item.
+
+    """
+
+    def __init__(self, item, columns, vocabulary, codes):
+        self.item = item
+        self.columns = list(columns)
+        self.vocabulary = vocabulary
+        self.codes = codes
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+
+        values = [column[key] for column in self.columns]
+        values.append(self.vocabulary[self.codes[key]])
+
+        return self.item(*values)
+
+    def __iter__(self):
+        labels = map(self.vocabulary.__getitem__, self.codes)
+        return map(self.item, *(self.columns + [labels]))
+
+    def __reversed__(self):
+        for i in range(len(self) - 1, -1, -1):
+            yield self[i]
+
+
+class PackedTier(Tier):
+    """Base class for PackedIntervalTier and PackedTextTier.
+
+    Parameters
+    ----------
+    name : str
+        Name of the tier.
+
+    xmin : int or float
+        Start time of the tier, in seconds.
+
+    xmax : int or float
+        End time of the tier, in seconds.
+
+    columns : list of sequences of int or float
+        Times of the items, with one column for each of the item's
+        fields except the last (its label). Items should be sorted.
+
+    vocabulary : list of str
+        Distinct labels of the items.
+
+    codes : sequence of int
+        Position in `vocabulary` of the label of each item.
+
+    rate : int, optional
+        Number of ticks per second, if the times are stored as ticks
+        (see `TextGrid.to_ticks()`). Default is None (seconds).
+
+    Attributes
+    ----------
+    name
+    xmin
+    xmax
+    rate
+
+    """
+
+    def __init__(self, name, xmin, xmax, columns, vocabulary, codes,
+                 rate=None):
+        Tier.__init__(self, name, xmin, xmax)
+        self._items = PackedItems(self.item, columns, vocabulary, codes)
+        self.rate = rate
+
+    def __reduce__(self):
+        typecode = 'd' if self.rate is None else 'q'
+        columns = [array.array(typecode, column)
+                   for column in self._items.columns]
+        codes = array.array('i', self._items.codes)
+
+        return self.__class__, (self.name, self.xmin, self.xmax, columns,
+                                self._items.vocabulary, codes, self.rate)
+
+    def __delitem__(self, key):
+        raise TypeError('{} does not support item deletion'
+                        .format(self.__class__.__name__))
+
+    def insert(self, *args, **kwargs):
+        raise TypeError('{} does not support item insertion'
+                        .format(self.__class__.__name__))
+
+    def _check_times(self):
+        raise TypeError('{} does not support changing times'
+                        .format(self.__class__.__name__))
+
+    def _update_times(self, func):
+        self._check_times()
+
+    def _replace_items(self, items):
+        raise TypeError('{} does not support changing items'
+                        .format(self.__class__.__name__))
+
+    def _edit_items(self):
+        raise TypeError('{} does not support changing items'
+                        .format(self.__class__.__name__))
+
+    def _like(self, xmin, xmax, items):
+        return self._from_items(self.name, xmin, xmax, items, self.rate)
+
+    def _copy(self):
+        """Return a tier of the base type with the same items."""
+
+        tier = self.base(self.name, self.xmin, self.xmax, list(self._items))
+        tier.rate = self.rate
+
+        return tier
+
+    def to_dict(self):
+        """Return a dict representation of the base tier's type."""
+
+        return self._copy().to_dict()
+
+    def to_praat(self):
+        """Return the tier as text readable by Praat, like its base tier."""
+
+        return self._copy().to_praat()
+
+    def _label_index(self):
+        """Return the positions of each label, read from the label codes."""
+
+        if self._labels is None:
+            vocabulary = self._items.vocabulary
+            labels = {}
+
+            for i, code in enumerate(self._items.codes):
+                labels.setdefault(vocabulary[code], []).append(i)
+
+            self._labels = labels
+
+        return self._labels
+
+    @classmethod
+    def from_numpy(cls, name, xmin, xmax, *arrays, **kwargs):
+        """Return a packed tier from arrays like those of `to_numpy()`.
+
+        Arrays that are already contiguous float64 (or int64, for
+        ticks) times and int32 codes are used as the tier's columns
+        without copying, and no items are created until they are
+        accessed. Requires NumPy.
+
+        Parameters
+        ----------
+        name : str
+            Name of the tier.
+
+        xmin : int or float
+            Start time of the tier, in seconds.
+
+        xmax : int or float
+            End time of the tier, in seconds.
+
+        *arrays
+            One array of times for each time field of the item (`xmin`
+            and `xmax`, or `number`), then an array of label codes, then
+            the list of distinct labels.
+
+        rate : int, optional
+            Number of ticks per second, if the times are ticks, as
+            returned by `to_numpy()` for a tier with a `rate`. Default
+            is None (seconds). Must be given as a keyword.
+
+        Returns
+        -------
+        PackedTier
+
+        """
+
+        import numpy as np
+
+        rate = kwargs.pop('rate', None)
+
+        if kwargs:
+            raise TypeError('Unexpected keyword argument "{}"'
+                            .format(next(iter(kwargs))))
+
+        n_columns = len(cls.item.fields) - 1
+
+        if len(arrays) != n_columns + 2:
+            raise TypeError('{} expects {} arrays and a list of labels'
+                            .format(cls.__name__, n_columns + 1))
+
+        # Memoryviews share the arrays' memory, but give Python numbers
+        # rather than NumPy scalars when items are created.
+        dtype = np.float64 if rate is None else np.int64
+        columns = [memoryview(np.ascontiguousarray(column, dtype=dtype))
+                   for column in arrays[:n_columns]]
+        codes = memoryview(np.ascontiguousarray(arrays[n_columns],
+                                                dtype=np.int32))
+
+        return cls(name, xmin, xmax, columns, list(arrays[-1]), codes, rate)
+
+    def to_numpy(self):
+        """Return NumPy arrays of the times and labels in this tier.
+
+        See `Tier.to_numpy()`. Columns that are already float64 (or
+        int64, for ticks) and int32 buffers, such as arrays or shared
+        memory, are returned as views of the same memory rather than
+        copied.
+
+        """
+
+        import numpy as np
+
+        dtype = np.float64 if self.rate is None else np.int64
+        columns = tuple(np.asarray(column, dtype=dtype)
+                        for column in self._items.columns)
+        codes = np.asarray(self._items.codes, dtype=np.int32)
+
+        return columns + (codes, self._items.vocabulary)
+
+    @classmethod
+    def from_tier(cls, tier):
+        """Return a packed copy of a tier.
+
+        Times stored as ticks are packed as integers, and the packed
+        tier keeps the tier's `rate`.
+
+        Parameters
+        ----------
+        tier : IntervalTier or TextTier
+
+        Returns
+        -------
+        PackedTier
+
+        """
+
+        return cls._from_items(tier.name, tier.xmin, tier.xmax, tier,
+                               tier.rate)
+
+    @classmethod
+    def _from_items(cls, name, xmin, xmax, items, rate=None):
+        items = sorted(items)
+        fields = cls.item.fields
+        typecode = 'd' if rate is None else 'q'
+
+        columns = [array.array(typecode,
+                               map(operator.attrgetter(field), items))
+                   for field in fields[:-1]]
+        vocabulary, codes = _label_codes(
+            map(operator.attrgetter(fields[-1]), items))
+
+        return cls(name, xmin, xmax, columns, vocabulary, codes, rate)
+
+
+class PackedIntervalTier(PackedTier, IntervalTier):
+    """Read-only IntervalTier backed by `xmin` and `xmax` columns.
+
+    See `PackedTier` for parameters.
+
+    """
+
+    base = IntervalTier
+
+    def where(self, time):
+        """Return the interval in this tier at a given time.
+
+        See `IntervalTier.where()`. The interval is found by bisecting
+        the `xmax` column, without creating any other intervals.
+
+        """
+
+        xmin, xmax = self._items.columns
+        idx = bisect.bisect(xmax, time)
+
+        if idx < len(self._items) and xmin[idx] <= time:
+            return self._items[idx]
+
+        return None
+
+
+class PackedTextTier(PackedTier, TextTier):
+    """Read-only TextTier backed by a `number` column.
+
+    See `PackedTier` for parameters.
+
+    """
+
+    base = TextTier
+
+    def where(self, left, right=None):
+        """Return the point(s) in this tier at or between the given time(s).
+
+        See `TextTier.where()`. Points are found by bisecting the
+        `number` column, without creating any other points.
+
+        """
+
+        numbers, = self._items.columns
+        left_idx = bisect.bisect_left(numbers, left)
+
+        if right is not None:
+            right_idx = bisect.bisect(numbers, right)
+            return self._items[left_idx:right_idx]
+
+        if left_idx < len(self._items) and numbers[left_idx] == left:
+            return self._items[left_idx]
+
+        return None
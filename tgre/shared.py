@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+"""Share tiers between processes with `multiprocessing.shared_memory`.
+
+`share_tier()` copies a tier into a single shared memory block, and
+returns a small, picklable `SharedTier` handle. Other processes call
+`SharedTier.attach()` to get a read-only packed tier (see `tgre.packed`)
+whose times and labels refer directly to the shared block, so the tier
+is neither copied nor parsed again by each process.
+
+Requires Python 3.8 or later.
+
+>>> import multiprocessing
+>>> import tgre
+>>> from tgre.shared import share_tier
+>>> def label_at(args):
+...     handle, time = args
+...     tier = handle.attach()
+...     interval = tier.where(time)
+...     tier.close()
+...     return interval.text
+>>> tg = tgre.TextGrid.from_file('test/files/usage-example.TextGrid')
+>>> handle = share_tier(tg[1])
+>>> with multiprocessing.Pool(2) as pool:
+...     pool.map(label_at, [(handle, 0.5), (handle, 1.2)])
+['', 'ciao']
+>>> handle.unlink()
+
+The block layout is: one column of float64 times (or int64 ticks, for
+tiers with times stored as ticks) for each time field of the tier's
+items, the int64 end offsets of each distinct label in the label buffer,
+the int32 label code of each item, and finally the UTF-8 encoded labels.
+Times in seconds are read back as floats.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import array
+import operator
+
+from multiprocessing import resource_tracker, shared_memory
+
+from .tgre import IntervalTier, TextTier, _label_codes
+from .packed import PackedTier, PackedIntervalTier, PackedTextTier
+
+
+PACKED_CLASSES = {'IntervalTier': PackedIntervalTier,
+                  'TextTier': PackedTextTier}
+
+
+def share_tier(tier):
+    """Copy a tier into a new shared memory block.
+
+    The block stays allocated until `SharedTier.unlink()` is called on
+    the returned handle, which should be done by the process that
+    called this function once no other process needs the tier.
+
+    Parameters
+    ----------
+    tier : IntervalTier or TextTier
+
+    Returns
+    -------
+    SharedTier
+
+    """
+
+    if isinstance(tier, IntervalTier):
+        tier_class = 'IntervalTier'
+
+    elif isinstance(tier, TextTier):
+        tier_class = 'TextTier'
+
+    else:
+        raise TypeError('Cannot share a {}'.format(tier.__class__.__name__))
+
+    items = sorted(tier)
+    fields = PACKED_CLASSES[tier_class].item.fields
+
+    vocabulary, codes = _label_codes(
+        map(operator.attrgetter(fields[-1]), items))
+    encoded = [label.encode('utf_8') for label in vocabulary]
+
+    offsets = []
+    end = 0
+
+    for label in encoded:
+        end += len(label)
+        offsets.append(end)
+
+    handle = SharedTier(None, tier_class, tier.name, tier.xmin, tier.xmax,
+                        len(items), len(vocabulary), end, tier.rate)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(handle.size, 1))
+    handle.block = shm.name
+    handle._shm = shm
+
+    buf = shm.buf
+    position = 0
+
+    typecode = 'd' if tier.rate is None else 'q'
+    columns = [array.array(typecode, map(operator.attrgetter(field), items))
+               for field in fields[:-1]]
+    sections = columns + [array.array('q', offsets), codes]
+
+    for section in sections:
+        data = section.tobytes()
+        buf[position:position + len(data)] = data
+        position += len(data)
+
+    buf[position:position + end] = b''.join(encoded)
+
+    return handle
+
+
+class SharedTier(object):
+    """Picklable handle to a tier stored in shared memory.
+
+    Handles are created by `share_tier()`. Pass them to other processes
+    and call `attach()` there to use the tier.
+
+    Attributes
+    ----------
+    block : str
+        Name of the shared memory block.
+
+    tier_class : {'IntervalTier', 'TextTier'}
+
+    name : str
+        Name of the tier.
+
+    xmin : int or float
+
+    xmax : int or float
+
+    size
+        Size of the shared memory block, in bytes.
+
+    rate : int or None
+        Number of ticks per second, if the tier's times are stored as
+        ticks, or None.
+
+    """
+
+    def __init__(self, block, tier_class, name, xmin, xmax, n_items,
+                 n_labels, n_bytes, rate=None):
+        self.block = block
+        self.tier_class = tier_class
+        self.name = name
+        self.xmin = xmin
+        self.xmax = xmax
+        self.n_items = n_items
+        self.n_labels = n_labels
+        self.n_bytes = n_bytes
+        self.rate = rate
+        self._shm = None
+
+    def __reduce__(self):
+        return self.__class__, (self.block, self.tier_class, self.name,
+                                self.xmin, self.xmax, self.n_items,
+                                self.n_labels, self.n_bytes, self.rate)
+
+    def __repr__(self):
+        return ('<SharedTier {0.tier_class} "{0.name}" in block {0.block}>'
+                .format(self))
+
+    @property
+    def n_columns(self):
+        return len(PACKED_CLASSES[self.tier_class].item.fields) - 1
+
+    @property
+    def size(self):
+        return ((8 * self.n_columns + 4) * self.n_items
+                + 8 * self.n_labels + self.n_bytes)
+
+    def attach(self):
+        """Return a read-only tier that refers to the shared block.
+
+        Call `close()` on the tier when it is no longer needed.
+
+        Returns
+        -------
+        SharedIntervalTier or SharedTextTier
+
+        """
+
+        shm = _attach(self.block)
+        buf = shm.buf.toreadonly()
+        position = 0
+
+        columns = []
+        typecode = 'd' if self.rate is None else 'q'
+
+        for i in range(self.n_columns):
+            end = position + 8 * self.n_items
+            columns.append(buf[position:end].cast(typecode))
+            position = end
+
+        end = position + 8 * self.n_labels
+        offsets = buf[position:end].cast('q')
+        position = end
+
+        end = position + 4 * self.n_items
+        codes = buf[position:end].cast('i')
+        position = end
+
+        labels = bytes(buf[position:position + self.n_bytes])
+        starts = [0] + offsets.tolist()
+        vocabulary = [labels[a:b].decode('utf_8')
+                      for a, b in zip(starts, starts[1:])]
+
+        offsets.release()
+
+        cls = SHARED_CLASSES[self.tier_class]
+        tier = cls(self.name, self.xmin, self.xmax, columns, vocabulary, codes,
+                   self.rate)
+        tier._views = [buf] + columns + [codes]
+        tier._shm = shm
+
+        return tier
+
+    def close(self):
+        """Close this process's access to the block, if it created it."""
+
+        if self._shm is not None:
+            self._shm.close()
+
+    def unlink(self):
+        """Free the shared block. Only the creating process should do this."""
+
+        shm = self._shm
+
+        if shm is None:
+            shm = shared_memory.SharedMemory(name=self.block)
+
+        shm.close()
+        shm.unlink()
+        self._shm = None
+
+
+def _attach(block):
+    """Open an existing block without changing how it is cleaned up.
+
+    The block stays registered with the resource tracker of the process
+    that created it, which frees it if that process exits without
+    unlinking it. Processes started by the creating process, such as
+    `multiprocessing.Pool` workers, share its tracker. Other processes
+    have their own tracker, which would otherwise free the block when
+    they exit, even though the creating process still owns it.
+
+    """
+
+    try:
+        return shared_memory.SharedMemory(name=block, track=False)
+
+    except TypeError:
+        # Before Python 3.13, opening a block always registers it.
+        pass
+
+    # A tracker that is already running may be the creator's, where the
+    # block is already registered, and unregistering it would remove
+    # the creator's registration. Only a tracker started by opening
+    # this block belongs to this process alone.
+    own_tracker = resource_tracker._resource_tracker._fd is None
+    shm = shared_memory.SharedMemory(name=block)
+
+    if own_tracker:
+        resource_tracker.unregister(shm._name, 'shared_memory')
+
+    return shm
+
+
+class _SharedMixin(object):
+    def __reduce__(self):
+        args = PackedTier.__reduce__(self)[1]
+        return self.packed, args
+
+    def _like(self, xmin, xmax, items):
+        return self.packed._from_items(self.name, xmin, xmax, items,
+                                       self.rate)
+
+    def close(self):
+        """Release the shared block. The tier can't be used afterwards."""
+
+        self._items.columns = []
+        self._items.codes = ()
+
+        for view in reversed(self._views):
+            view.release()
+
+        self._views = []
+        self._shm.close()
+
+
+class SharedIntervalTier(_SharedMixin, PackedIntervalTier):
+    """PackedIntervalTier attached to a shared memory block.
+
+    Pickling this tier copies it into a PackedIntervalTier.
+
+    """
+
+    packed = PackedIntervalTier
+
+
+class SharedTextTier(_SharedMixin, PackedTextTier):
+    """PackedTextTier attached to a shared memory block.
+
+    Pickling this tier copies it into a PackedTextTier.
+
+    """
+
+    packed = PackedTextTier
+
+
+SHARED_CLASSES = {'IntervalTier': SharedIntervalTier,
+                  'TextTier': SharedTextTier}
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""Counts and durations of the labels in tiers.
+
+`Tier.stats()` returns a `TierStats` with the number of items with
+each label and their total duration. The first call counts every item
+in the tier, and after that the counts are kept up to date as items are
+inserted, deleted, split, merged, or have their boundaries moved, so
+later calls only copy the totals for each label. Changes that replace
+many items at once (such as `relabel()` or `shift()`) make the tier
+count its items again on the next call.
+
+`TextGrid.stats()` returns the stats for each tier name, and
+`merge_stats()` adds together stats made separately, such as for each
+file of a corpus in a pool of worker processes.
+
+>>> import tgre
+>>> from tgre.stats import merge_stats
+>>> tg = tgre.TextGrid.from_file('test/files/usage-example.TextGrid')
+>>> stats = tg[1].stats()
+>>> stats.counts
+{'': 2, 'ciao': 1}
+>>> round(stats.duration, 3)
+0.325
+>>> totals = merge_stats([tg.stats(), tg.stats()])
+>>> totals['Metronome'].counts
+{'click': 6}
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+
+class TierStats(object):
+    """Number of items and total duration for each label.
+
+    Durations are sums that are updated as items change, so after many
+    edits they can differ slightly from a new sum because of rounding.
+
+    Parameters
+    ----------
+    counts : dict, optional
+        Number of items with each label.
+
+    durations : dict, optional
+        Total duration of the items with each label.
+
+    Attributes
+    ----------
+    counts : dict
+        Number of items with each label.
+
+    durations : dict
+        Total duration, in seconds, of the items with each label. This
+        is 0 for the labels of points.
+
+    """
+
+    def __init__(self, counts=None, durations=None):
+        self.counts = {} if counts is None else dict(counts)
+        self.durations = {} if durations is None else dict(durations)
+
+    def __repr__(self):
+        return '<TierStats with {} items and {} labels>'.format(
+            self.count, len(self.counts))
+
+    @property
+    def count(self):
+        """Number of items."""
+
+        return sum(self.counts.values())
+
+    @property
+    def duration(self):
+        """Total duration of the items that have a label (not '')."""
+
+        return sum(duration for label, duration in self.durations.items()
+                   if label)
+
+    def mean_durations(self):
+        """Return a dict of the mean duration of the items with each label."""
+
+        return dict((label, self.durations[label] / count)
+                    for label, count in self.counts.items())
+
+    def add(self, label, duration, count=1):
+        """Count items with a label and their total duration."""
+
+        self.counts[label] = self.counts.get(label, 0) + count
+        self.durations[label] = self.durations.get(label, 0) + duration
+
+    def remove(self, label, duration, count=1):
+        """Stop counting items with a label and their total duration."""
+
+        remaining = self.counts[label] - count
+
+        if remaining:
+            self.counts[label] = remaining
+            self.durations[label] -= duration
+
+        else:
+            del self.counts[label]
+            del self.durations[label]
+
+    def update(self, other):
+        """Add the counts and durations of another TierStats to these."""
+
+        for label, count in other.counts.items():
+            self.add(label, other.durations[label], count)
+
+    def copy(self):
+        """Return a copy of these stats."""
+
+        return TierStats(self.counts, self.durations)
+
+
+def merge_stats(stats):
+    """Return the sum of several sets of stats.
+
+    Parameters
+    ----------
+    stats : iterable of TierStats, or iterable of dict of TierStats
+        Stats for single tiers, or dicts from tier names to stats like
+        those returned by `TextGrid.stats()`.
+
+    Returns
+    -------
+    TierStats or dict of TierStats
+        Stats for all of the tiers, or for all of the tiers with each
+        name.
+
+    """
+
+    total = None
+
+    for item in stats:
+        if isinstance(item, TierStats):
+            if total is None:
+                total = TierStats()
+
+            total.update(item)
+
+        else:
+            if total is None:
+                total = {}
+
+            for name, tier_stats in item.items():
+                total.setdefault(name, TierStats()).update(tier_stats)
+
+    return TierStats() if total is None else total
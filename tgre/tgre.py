@@ -125,6 +125,14 @@ Convert a TextGrid to a dict.
            }]
 }
 
+Convert a dict back to a TextGrid.
+
+>>> print(tgre.TextGrid.from_dict(tg_dict))
+<TextGrid from 0 to 2.5 seconds with 3 tiers>
+
+The `tgre.jsonl` module converts TextGrids to and from JSON Lines, with one
+record for each interval or point.
+
 Create new intervals.
 
 >>> hi = tgre.Interval(0.4, 0.55, 'hi')
@@ -165,6 +173,20 @@ Find the interval on a tier at a particular time with the `where()` method.
 >>> print(interval)
 <Interval "hi" from 0.4 to 0.55>
 
+Find intervals by their text with the `find()` method, or by a regular
+expression with the `search()` method.
+
+>>> tier.find('hi')
+[Interval(0.4, 0.55, 'hi')]
+>>> tier.search('^[ho]')
+[Interval(0.3, 0.4, 'oh'), Interval(0.4, 0.55, 'hi')]
+
+Find the point on a TextTier nearest to a particular time with the
+`nearest()` method.
+
+>>> print(tg[2].nearest(1.2))
+<Point "click" at 1.5>
+
 Add a tier to a TextGrid by modifying the list in the `tiers` attribute.
 
 >>> tg.tiers.append(tier)
@@ -185,16 +207,40 @@ Create a new TextGrid.
 >>> print(new_tg)
 <TextGrid from 0 to 5 seconds with 2 tiers>
 
+Extract part of a TextGrid with the `crop()` method, move or stretch its
+times with `shift()` and `scale()`, and join TextGrids end to end with
+`TextGrid.concatenate()`. The `window()` method returns a read-only view of
+part of a TextGrid without copying any intervals or points (see `tgre.window`).
+
+>>> part = new_tg.crop(1, 2.5)
+>>> print(part)
+<TextGrid from 1 to 2.5 seconds with 2 tiers>
+>>> print(tgre.TextGrid.concatenate([new_tg, part]))
+<TextGrid from 0 to 6.5 seconds with 2 tiers>
+
 Write a TextGrid to a file with the `to_praat()` method.
 
->>> new_tg.to_praat(path='mytextgrid.TextGrid')
+>>> import os
+>>> import tempfile
+>>> path = os.path.join(tempfile.mkdtemp(), 'mytextgrid.TextGrid')
+>>> new_tg.to_praat(path=path)
 
 This method creates a TextGrid file with a different format than the ones
 that Praat creates, but it will still be read normally by Praat (and also by
 this module, if you read it back in with the `TextGrid.from_file()` method).
 The `to_praat()` method will raise a ValueError if the result will
 not be read correctly by Praat (for example, if there are intervals with
-negative duration).
+negative duration). Tiers that were read from a file and haven't been
+modified are copied as they were written in that file, so saving a TextGrid
+after editing one tier leaves the text of the other tiers unchanged.
+
+Times can be stored as integer ticks, such as audio samples, so that they can
+be compared exactly. Times are converted back to seconds when the TextGrid is
+written.
+
+>>> new_tg.to_ticks(16000)
+>>> new_tg.xmax
+80000
 
 If a TextGrid is encoded in UTF-16, the `TextGrid.from_file()` and
 `TextGrid.to_praat()` methods should be called with an optional `encoding`
@@ -202,6 +248,13 @@ parameter.
 
 >>> tg = tgre.TextGrid.from_file('test/files/numbers.TextGrid', encoding='utf_16')
 
+TextGrids can also be read from open file objects with `TextGrid.from_file()`,
+and from the contents of a file with `TextGrid.from_bytes()` or
+`TextGrid.from_string()`. The `tgre.corpus` module reads TextGrids directly
+from zip and tar archives, and the `tgre.index` module stores the contents of
+many TextGrid files in an SQLite database that can be queried without reading
+the files again.
+
 """
 
 from __future__ import absolute_import
@@ -209,11 +262,23 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import array
 import bisect
+import bz2
 import functools
+import gzip
 import io
+import itertools
+import math
+import operator
+import os
 import re
 
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
 
 PRAAT_REGEX = re.compile(r"""(
 (^|\s)(
@@ -225,6 +290,16 @@ PRAAT_REGEX = re.compile(r"""(
 (!.*)
 )""", re.VERBOSE | re.UNICODE)
 
+COMPRESSION_EXTENSIONS = {'.gz': gzip, '.bz2': bz2}
+COMPRESSION_MAGIC = [(b'\x1f\x8b', gzip), (b'BZh', bz2)]
+
+if lzma is not None:
+    COMPRESSION_EXTENSIONS['.xz'] = lzma
+    COMPRESSION_MAGIC.append((b'\xfd7zXZ\x00', lzma))
+
+# The active `tgre.timing.PhaseTimer`, if any.
+_timer = None
+
 
 def praat_reader(text):
     """Yield strings and numbers from text files created by Praat.
@@ -234,9 +309,10 @@ def praat_reader(text):
 
     Parameters
     ----------
-    text : str
+    text : str or file object
         Contents of an ooTextFile text file written by Praat, such as
-        a TextGrid.
+        a TextGrid. If this is a file object opened in text mode, it is
+        read in blocks, so the whole file is never held in memory.
 
     Yields
     ------
@@ -245,7 +321,13 @@ def praat_reader(text):
 
     """
 
-    for match in re.finditer(PRAAT_REGEX, text):
+    if hasattr(text, 'read'):
+        matches = _stream_matches(text)
+
+    else:
+        matches = re.finditer(PRAAT_REGEX, text)
+
+    for match in matches:
         groupdict = match.groupdict()
 
         if groupdict['string'] is not None:
@@ -261,6 +343,189 @@ def praat_reader(text):
             pass
 
 
+def _stream_matches(stream, size=2 ** 16):
+    """Yield `PRAAT_REGEX` matches from a text file object, block by block.
+
+    Each block is only searched up to its last line break. Matching
+    stops early if a double-quote is skipped over, since that is the
+    start of a string that continues past the end of the block; the
+    rest of the block is searched again once more text has been read.
+
+    """
+
+    buf = ''
+
+    for data in iter(functools.partial(stream.read, size), ''):
+        buf += data
+        cut = buf.rfind('\n') + 1
+        keep = 0
+
+        for match in PRAAT_REGEX.finditer(buf, 0, cut):
+            if buf.find('"', keep, match.start()) != -1:
+                break
+
+            yield match
+            keep = match.end()
+
+        else:
+            if buf.find('"', keep, cut) == -1:
+                keep = cut
+
+        buf = buf[keep:]
+
+    for match in PRAAT_REGEX.finditer(buf):
+        yield match
+
+
+def _compression(magic):
+    """Return the compression module for data starting with `magic`."""
+
+    for prefix, module in COMPRESSION_MAGIC:
+        if magic.startswith(prefix):
+            return module
+
+    return None
+
+
+def _open(path, encoding='utf_8'):
+    """Open a text file for reading, decompressing it as needed.
+
+    Files are decompressed if they start with gzip, bz2, or xz magic
+    bytes.
+
+    """
+
+    with io.open(path, 'rb') as raw_file:
+        module = _compression(raw_file.read(6))
+
+    if module is None:
+        return io.open(path, encoding=encoding)
+
+    return io.TextIOWrapper(module.open(path, 'rb'), encoding=encoding)
+
+
+def _write(path, text, encoding='utf_8'):
+    """Write text to a file, compressing it as needed.
+
+    Files are compressed if their extension is '.gz', '.bz2', or '.xz'.
+    Compressed files are written from the encoded text, because text
+    wrappers around the bz2 and xz writers, which can't seek, leave out
+    the byte order mark of encodings like UTF-16.
+
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+    module = COMPRESSION_EXTENSIONS.get(extension)
+
+    if module is None:
+        with io.open(path, 'w', encoding=encoding) as text_file:
+            text_file.write(text)
+
+        return
+
+    with module.open(path, 'wb') as compressed_file:
+        compressed_file.write(text.encode(encoding))
+
+
+def _decompressed(stream):
+    """Return a binary file object that decompresses `stream` if needed."""
+
+    if hasattr(stream, 'peek'):
+        magic = stream.peek(6)[:6]
+
+    elif stream.seekable():
+        position = stream.tell()
+        magic = stream.read(6)
+        stream.seek(position)
+
+    else:
+        stream = io.BytesIO(stream.read())
+        magic = stream.getvalue()[:6]
+
+    module = _compression(magic)
+
+    if module is None:
+        return stream
+
+    return module.open(stream, 'rb')
+
+
+class _SourceReader(object):
+    """Iterator like `praat_reader()` that remembers where values came from.
+
+    After each value is yielded, `start` and `end` give the position of
+    that value in `text`. This lets tiers keep a reference to the span
+    of the file that they were read from.
+
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.start = self.end = 0
+        self._matches = re.finditer(PRAAT_REGEX, text)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        for match in self._matches:
+            groupdict = match.groupdict()
+
+            if groupdict['string'] is not None:
+                value = groupdict['string'].replace('""', '"')
+
+            elif groupdict['int'] is not None:
+                value = int(groupdict['int'])
+
+            elif groupdict['real'] is not None:
+                value = float(groupdict['real'])
+
+            else:
+                continue
+
+            self.start, self.end = match.span(3)
+            return value
+
+        raise StopIteration
+
+    next = __next__
+
+
+class _ReplayReader(object):
+    """Iterator over the values already read from `praat_reader()`.
+
+    This is used while phases are being timed, so that tokenizing can
+    be timed apart from making the TextGrid. If the values come from a
+    `_SourceReader`, their positions are replayed as well.
+
+    """
+
+    def __init__(self, elements):
+        self.text = getattr(elements, 'text', None)
+
+        if self.text is None:
+            self._values = [(value, None, None) for value in elements]
+
+        else:
+            self._values = [(value, elements.start, elements.end)
+                            for value in elements]
+
+        self._iter = iter(self._values)
+        self.start = self.end = None
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        value, self.start, self.end = next(self._iter)
+        return value
+
+    next = __next__
+
+
 def praat_string(text):
     """Return a string formatted to be recognized by Praat.
 
@@ -294,12 +559,131 @@ def tier_from_reader(stream):
     """
 
     tier_class = next(stream)
+    start = getattr(stream, 'start', None)
+
+    if tier_class == 'IntervalTier':
+        tier_type = IntervalTier
+
+    elif tier_class == 'TextTier':
+        tier_type = TextTier
+
+    else:
+        raise ValueError('Tier type "{}" not recognized'.format(tier_class))
+
+    if start is None:
+        return tier_type.from_reader(stream)
+
+    name, xmin, xmax, items = tier_type._read_values(stream)
+    tier = tier_type(name, xmin, xmax, items)
+    tier._keep_source(stream.text[start:stream.end], items)
+
+    return tier
+
+
+def _pack_numbers(values):
+    """Pack a list of numbers into an array of doubles, if possible.
+
+    Returns the array and the positions of values that were ints, so
+    that they can be restored by `_unpack_numbers()`. Lists of ints
+    that fit in 64 bits, such as ticks, are packed into an array of
+    ints instead. If any value is not an int or a float, the list is
+    returned unchanged, with None.
+
+    """
+
+    types = set(map(type, values))
+
+    if not types <= {int, float}:
+        return values, None
+
+    if types == {int}:
+        try:
+            return array.array('q', values), ()
+
+        except OverflowError:
+            pass
+
+    ints = ()
+
+    if int in types:
+        is_int = map(operator.is_, map(type, values), itertools.repeat(int))
+        ints = array.array('l', itertools.compress(itertools.count(), is_int))
+
+    return array.array('d', values), ints
+
+
+def _unpack_numbers(packed, ints):
+    """Return the list of numbers packed by `_pack_numbers()`."""
+
+    if ints is None:
+        return packed
+
+    values = packed.tolist()
+
+    for i in ints:
+        values[i] = int(values[i])
+
+    return values
+
+
+def _seconds(times, rate):
+    """Return times in ticks at `rate` (or None for seconds) in seconds."""
+
+    if rate is None:
+        return tuple(times)
+
+    return tuple(time / rate for time in times)
+
+
+def _label_codes(labels):
+    """Return the distinct labels, and an array of codes into that list."""
+
+    codes = {}
+    packed = array.array('i', [codes.setdefault(label, len(codes))
+                               for label in labels])
+
+    vocabulary = [None] * len(codes)
+
+    for label, code in codes.items():
+        vocabulary[code] = label
+
+    return vocabulary, packed
+
+
+def _unpickle_tier(cls, name, xmin, xmax, columns, vocabulary, codes,
+                   rate=None):
+    tier = cls(name, xmin, xmax)
+    tier.rate = rate
+
+    values = [_unpack_numbers(*column) for column in columns]
+    values.append(map(vocabulary.__getitem__, codes))
+    tier._items = list(map(cls.item, *values))
+
+    return tier
+
+
+def tier_from_dict(tier_dict):
+    """Return a tier object from its dict representation.
+
+    Parameters
+    ----------
+    tier_dict : dict
+        Dict in the format returned by `IntervalTier.to_dict()` or
+        `TextTier.to_dict()`.
+
+    Returns
+    -------
+    IntervalTier or TextTier
+
+    """
+
+    tier_class = tier_dict['class']
 
     if tier_class == 'IntervalTier':
-        return IntervalTier.from_reader(stream)
+        return IntervalTier.from_dict(tier_dict)
 
     elif tier_class == 'TextTier':
-        return TextTier.from_reader(stream)
+        return TextTier.from_dict(tier_dict)
 
     else:
         raise ValueError('Tier type "{}" not recognized'.format(tier_class))
@@ -324,6 +708,9 @@ class TextGrid(object):
     xmin
     xmax
     tiers
+    rate : int or None
+        Number of ticks per second, if times are stored as integer
+        ticks (see `to_ticks()`), or None if times are in seconds.
 
     """
 
@@ -331,6 +718,11 @@ class TextGrid(object):
         self.xmin = xmin
         self.xmax = xmax
         self.tiers = tiers
+        self.rate = None
+
+    def __reduce__(self):
+        return (self.__class__, (self.xmin, self.xmax, self.tiers),
+                {'rate': self.rate})
 
     def __repr__(self):
         rep = repr(self.xmin), repr(self.xmax), repr(self.tiers)
@@ -390,16 +782,27 @@ class TextGrid(object):
         return cls(xmin, xmax, tiers)
 
     @classmethod
-    def from_file(cls, path, encoding='utf_8'):
+    def from_file(cls, path, encoding='utf_8', keep_source=True):
         """Return a TextGrid parsed from a text file created by Praat.
 
+        Files compressed with gzip, bz2, or xz are decompressed while
+        they are read.
+
         Parameters
         ----------
-        path : str
-            Path to a TextGrid file created by Praat.
+        path : str or file object
+            Path to a TextGrid file created by Praat, or a file object
+            opened in text or binary mode. File objects are read from
+            their current position, and are not closed.
 
         encoding : {'utf_8', 'utf_16'}
             Text encoding of the TextGrid file. Default is 'utf_8'.
+            Ignored if `path` is a file object opened in text mode.
+
+        keep_source : bool
+            If True, each tier keeps the text that it was read from
+            (see Notes). If False, the file is parsed as it is read,
+            without holding all of its text in memory. Default is True.
 
         Returns
         -------
@@ -410,136 +813,818 @@ class TextGrid(object):
         See http://www.fon.hum.uva.nl/praat/manual/TextGrid_file_formats.html
         for documentation on the Praat text file format.
 
+        Each valid tier keeps a reference to the text that it was read
+        from. If a tier and its items haven't been modified when it is
+        written out again with `to_praat()`, that text is copied instead
+        of being reformatted. Tiers that `to_praat()` would change or
+        reject, such as tiers with gaps or overlapping intervals, are
+        always checked and reformatted.
+
         """
 
-        with io.open(path, encoding=encoding) as textgrid_file:
-            elements = praat_reader(textgrid_file.read())
+        timer = _timer
 
-        if next(elements) != 'ooTextFile':
-            raise ValueError('Header string "ooTextFile" missing')
+        if timer is None:
+            return cls._from_file(path, encoding, keep_source)
 
-        if next(elements) != 'TextGrid':
-            raise ValueError('Header string "TextGrid" missing')
+        previous = timer._begin_file(getattr(path, 'name', path))
 
-        return cls.from_reader(elements)
+        try:
+            return cls._from_file(path, encoding, keep_source)
 
-    def to_dict(self):
-        """Return a dict representation of this TextGrid and its tiers.
+        finally:
+            timer._end_file(previous)
 
-        Unlike `to_praat()`, this method doesn't verify that the
-        TextGrid and its tiers conform to the TextGrid standard. For
-        example, it doesn't check that all intervals have positive
-        duration, and it doesn't add empty intervals to ensure that an
-        IntervalTier has no gaps.
+    @classmethod
+    def _from_file(cls, path, encoding, keep_source):
+        if not hasattr(path, 'read'):
+            with _open(path, encoding=encoding) as textgrid_file:
+                return cls._from_text_file(textgrid_file, keep_source)
 
-        Returns
-        -------
-        dict
+        if not isinstance(path.read(0), bytes):
+            return cls._from_text_file(path, keep_source)
 
-        """
+        if keep_source:
+            return cls.from_bytes(path.read(), encoding)
+
+        textgrid_file = io.TextIOWrapper(_decompressed(path),
+                                         encoding=encoding)
 
-        tg_dict = vars(self).copy()
-        tg_dict['tiers'] = [tier.to_dict() for tier in self.tiers]
+        try:
+            return cls._from_text_file(textgrid_file, keep_source)
 
-        return tg_dict
+        finally:
+            textgrid_file.detach()
 
-    def to_praat(self, path=None, encoding='utf_8'):
-        """Write this TextGrid to a file readable by Praat.
+    @classmethod
+    def from_bytes(cls, data, encoding='utf_8'):
+        """Return a TextGrid parsed from the bytes of a TextGrid file.
+
+        Data compressed with gzip, bz2, or xz is decompressed first.
 
         Parameters
         ----------
-        path : str
-            Path to the file where this TextGrid should be written. If
-            None, this method returns the TextGrid as a string in a
-            format readable by Praat. Default is None.
+        data : bytes
+            Contents of a TextGrid file created by Praat.
 
         encoding : {'utf_8', 'utf_16'}
-            Text encoding to use for the file. Default is 'utf_8'.
+            Text encoding of the TextGrid file. Default is 'utf_8'.
 
         Returns
         -------
-        None or str
-            If `path` is None, return this TextGrid object as a string.
-
-        Raises
-        ------
-        ValueError
-            If the TextGrid doesn't conform to the TextGrid standard.
+        TextGrid
 
         """
 
-        for tier in self.tiers:
-            if tier.xmin < self.xmin:
-                raise ValueError('Tier "{}" starts before TextGrid begins'
-                                 .format(tier.name))
+        timer = _timer
 
-            if tier.xmin > self.xmin:
-                raise ValueError('Tier "{}" starts after TextGrid begins'
-                                 .format(tier.name))
+        if timer is not None:
+            timer._start('decode')
 
-            if tier.xmax > self.xmax:
-                raise ValueError('Tier "{}" continues past end of TextGrid'
-                                 .format(tier.name))
+        module = _compression(data[:6])
 
-            if tier.xmax < self.xmax:
-                raise ValueError('Tier "{}" ends before end of TextGrid'
-                                 .format(tier.name))
+        if module is not None:
+            data = module.decompress(data)
 
-        output = ('"ooTextFile"\n"TextGrid"\n'
-                  '{0.xmin:.16g} to {0.xmax:.16g} seconds <exists>\n'
-                  '{1} tiers\n\n'
-                  .format(self, len(self.tiers)))
+        text = data.decode(encoding)
 
-        output += '\n\n'.join(tier.to_praat() for tier in self.tiers)
+        if timer is not None:
+            timer._stop(size=len(text))
 
-        if path is None:
-            return output
+        return cls.from_string(text)
 
-        with io.open(path, 'w', encoding=encoding) as textgrid_file:
-            textgrid_file.write(output)
+    @classmethod
+    def from_string(cls, text):
+        """Return a TextGrid parsed from the text of a TextGrid file.
 
+        Like `TextGrid.from_file()`, each tier keeps a reference to the
+        text that it was read from.
 
-@functools.total_ordering
-class Interval(object):
-    """An interval in a TextGrid IntervalTier.
+        Parameters
+        ----------
+        text : str
+            Contents of a TextGrid file created by Praat.
 
-    An interval is a sound file annotation with a duration. For
-    example, there might be an interval that marks an [i] vowel
-    from 0.35 seconds to 0.42 seconds of the sound file that is
-    associated with this TextGrid.
+        Returns
+        -------
+        TextGrid
 
-    Parameters
-    ----------
-    xmin : int or float
-        Start time of the interval, in seconds.
+        """
 
-    xmax : int or float
-        End time of the interval, in seconds.
+        return cls._from_elements(_SourceReader(text))
 
-    text : str
-        Label for the interval, possibly an empty string.
+    @classmethod
+    def from_dict(cls, tg_dict):
+        """Return a TextGrid from its dict representation.
 
-    Attributes
-    ----------
-    xmin
-    xmax
-    text
+        Parameters
+        ----------
+        tg_dict : dict
+            Dict in the format returned by `TextGrid.to_dict()`.
 
-    """
+        Returns
+        -------
+        TextGrid
 
-    plural = 'intervals'
+        """
 
-    def __init__(self, xmin, xmax, text):
-        self.xmin = xmin
-        self.xmax = xmax
-        self.text = text
+        tiers = [tier_from_dict(tier) for tier in tg_dict['tiers']]
 
-    def __repr__(self):
-        rep = repr(self.xmin), repr(self.xmax), repr(self.text)
+        return cls(tg_dict['xmin'], tg_dict['xmax'], tiers)
 
-        return 'Interval({0}, {1}, {2})'.format(*rep)
+    @classmethod
+    def _from_text_file(cls, textgrid_file, keep_source):
+        if not keep_source:
+            return cls._from_elements(praat_reader(textgrid_file))
 
-    def __str__(self):
+        timer = _timer
+
+        if timer is None:
+            return cls.from_string(textgrid_file.read())
+
+        timer._start('decode')
+        text = textgrid_file.read()
+        timer._stop(size=len(text))
+
+        return cls.from_string(text)
+
+    @classmethod
+    def _from_elements(cls, elements):
+        timer = _timer
+
+        if timer is not None:
+            # Files read without keeping their source are also read
+            # and decoded here, as they are tokenized.
+            timer._start('tokenize')
+            elements = _ReplayReader(elements)
+            timer._stop(len(elements), len(elements.text or ''))
+
+        if next(elements) != 'ooTextFile':
+            raise ValueError('Header string "ooTextFile" missing')
+
+        if next(elements) != 'TextGrid':
+            raise ValueError('Header string "TextGrid" missing')
+
+        if timer is None:
+            return cls.from_reader(elements)
+
+        timer._start('construct')
+        textgrid = cls.from_reader(elements)
+        timer._stop(sum(len(tier) for tier in textgrid))
+
+        return textgrid
+
+    def to_dict(self):
+        """Return a dict representation of this TextGrid and its tiers.
+
+        Unlike `to_praat()`, this method doesn't verify that the
+        TextGrid and its tiers conform to the TextGrid standard. For
+        example, it doesn't check that all intervals have positive
+        duration, and it doesn't add empty intervals to ensure that an
+        IntervalTier has no gaps.
+
+        Returns
+        -------
+        dict
+
+        """
+
+        xmin, xmax = _seconds((self.xmin, self.xmax), self.rate)
+
+        return {'xmin': xmin,
+                'xmax': xmax,
+                'tiers': [tier.to_dict() for tier in self.tiers]}
+
+    def to_numpy(self):
+        """Return NumPy arrays of the times and labels of each tier.
+
+        Requires NumPy.
+
+        Returns
+        -------
+        list of tuple
+            The result of `to_numpy()` for each tier in the TextGrid.
+
+        """
+
+        return [tier.to_numpy() for tier in self.tiers]
+
+    def stats(self):
+        """Return the number and total duration of the items in each tier.
+
+        See `Tier.stats()`. Use `tgre.stats.merge_stats()` to add
+        together the stats of several TextGrids.
+
+        Returns
+        -------
+        dict
+            The `tgre.stats.TierStats` for each tier name. If there are
+            several tiers with the same name, their stats are added
+            together.
+
+        """
+
+        from .stats import merge_stats
+
+        return merge_stats([{tier.name: tier.stats()} for tier in self.tiers])
+
+    def _tier(self, key):
+        """Return the tier at a position, or the first tier with a name."""
+
+        if not isinstance(key, str):
+            return self.tiers[key]
+
+        for tier in self.tiers:
+            if tier.name == key:
+                return tier
+
+        raise KeyError('No tier named "{}"'.format(key))
+
+    def remove_where(self, predicate, tiers=None):
+        """Remove the items for which a function returns True from tiers.
+
+        See `Tier.remove_where()`.
+
+        Parameters
+        ----------
+        predicate : function
+
+        tiers : list of str or int, optional
+            Names or positions of the tiers to change. Default is None
+            (every tier).
+
+        """
+
+        for tier in self._tiers(tiers):
+            tier.remove_where(predicate)
+
+    def relabel(self, labels, tiers=None):
+        """Change the labels of the items in tiers with a mapping or function.
+
+        See `Tier.relabel()`.
+
+        Parameters
+        ----------
+        labels : dict or function
+
+        tiers : list of str or int, optional
+            Names or positions of the tiers to change. Default is None
+            (every tier).
+
+        """
+
+        for tier in self._tiers(tiers):
+            tier.relabel(labels)
+
+    def merge_runs(self, tiers=None):
+        """Merge adjacent intervals with the same text in interval tiers.
+
+        See `IntervalTier.merge_runs()`.
+
+        Parameters
+        ----------
+        tiers : list of str or int, optional
+            Names or positions of the tiers to change. Default is None
+            (every IntervalTier).
+
+        """
+
+        for tier in self._tiers(tiers):
+            if tiers is not None or isinstance(tier, IntervalTier):
+                tier.merge_runs()
+
+    def _tiers(self, keys):
+        if keys is None:
+            return list(self.tiers)
+
+        return [self._tier(key) for key in keys]
+
+    def join(self, parent, child, mode='contain', tolerance=0):
+        """Return the range of child intervals for each parent interval.
+
+        See `IntervalTier.join()`.
+
+        Parameters
+        ----------
+        parent : str or int
+            Name or position of the tier with the parent intervals,
+            such as words.
+
+        child : str or int
+            Name or position of the tier with the child intervals,
+            such as phones.
+
+        mode : {'contain', 'overlap'}
+
+        tolerance : int or float
+
+        Returns
+        -------
+        tuple of tuple of (int, int)
+
+        Raises
+        ------
+        KeyError
+            If there is no tier with the given name.
+
+        """
+
+        return self._tier(parent).join(self._tier(child), mode, tolerance)
+
+    def frame_labels(self, hop, offset=None, n_frames=None, indices=False):
+        """Return the label of each tier at evenly spaced frame times.
+
+        Frame `k` is at time `offset + k * hop`. For an IntervalTier,
+        the frame gets the label of the interval at that time (see
+        `IntervalTier.where()`). For a TextTier, the frame gets the
+        label of a point between its time and the next frame's time.
+
+        Each tier is converted in a single pass over its sorted
+        boundaries, rather than looking up the label of every frame.
+        Requires NumPy.
+
+        If the times are stored as ticks (see `to_ticks()`), `hop` and
+        `offset` are in ticks too, and frame times are compared with
+        the tiers' ticks exactly.
+
+        Parameters
+        ----------
+        hop : int or float
+            Time between frames, in seconds (or ticks).
+
+        offset : int or float, optional
+            Time of the first frame. Default is the start time of the
+            TextGrid.
+
+        n_frames : int, optional
+            Number of frames. Default is the number of frames before
+            the end time of the TextGrid.
+
+        indices : bool
+            If True, also return the position in the tier of the
+            interval or point of each frame. Default is False.
+
+        Returns
+        -------
+        codes : array of int32, shape (n_frames, n_tiers)
+            Label codes, as positions in the vocabulary of each tier,
+            or -1 for frames that have no interval or point.
+
+        indices : array of int64, shape (n_frames, n_tiers)
+            Only returned if `indices` is True. Positions of intervals
+            or points in each tier, or -1.
+
+        vocabularies : list of list of str
+            Distinct labels of each tier.
+
+        Raises
+        ------
+        ValueError
+            If `hop` is not positive.
+
+        """
+
+        import numpy as np
+
+        if hop <= 0:
+            raise ValueError('Frame hop must be positive')
+
+        if offset is None:
+            offset = self.xmin
+
+        if n_frames is None:
+            # Round first so that float error doesn't add a frame
+            n_frames = max(int(math.ceil(round((self.xmax - offset) / hop,
+                                               9))), 0)
+
+        times = offset + np.arange(n_frames) * hop
+        codes = np.full((n_frames, len(self.tiers)), -1, dtype=np.int32)
+        positions = np.full((n_frames, len(self.tiers)), -1, dtype=np.int64)
+        vocabularies = []
+
+        for column, tier in enumerate(self.tiers):
+            arrays = tier.to_numpy()
+            item_codes = arrays[-2]
+            vocabularies.append(arrays[-1])
+
+            if len(arrays) == 4:
+                starts = np.searchsorted(times, arrays[0], 'left')
+                stops = np.searchsorted(times, arrays[1], 'left')
+                lengths = np.maximum(stops - starts, 0)
+
+                items = np.repeat(np.arange(len(lengths)), lengths)
+                frames = (np.arange(lengths.sum())
+                          - np.repeat(np.cumsum(lengths) - lengths, lengths)
+                          + np.repeat(starts, lengths))
+
+            else:
+                frames = np.searchsorted(times, arrays[0], 'right') - 1
+                keep = frames >= 0
+                keep[keep] = arrays[0][keep] < times[frames[keep]] + hop
+
+                items = np.flatnonzero(keep)
+                frames = frames[keep]
+
+            codes[frames, column] = item_codes[items]
+            positions[frames, column] = items
+
+        if indices:
+            return codes, positions, vocabularies
+
+        return codes, vocabularies
+
+    def crop(self, start, end, preserve_times=True):
+        """Return a new TextGrid with the part of this one between two times.
+
+        See `IntervalTier.crop()` and `TextTier.crop()`.
+
+        Parameters
+        ----------
+        start : int or float
+            Start time of the part to keep, in seconds.
+
+        end : int or float
+            End time of the part to keep, in seconds.
+
+        preserve_times : bool
+            If False, the new TextGrid starts at 0 rather than at
+            `start`. Default is True.
+
+        Returns
+        -------
+        TextGrid
+
+        Raises
+        ------
+        ValueError
+            If `end` is not after `start`.
+
+        """
+
+        tiers = [tier.crop(start, end, preserve_times) for tier in self.tiers]
+        offset = 0 if preserve_times else start
+
+        res = self.__class__(max(start, self.xmin) - offset,
+                             min(end, self.xmax) - offset, tiers)
+        res.rate = self.rate
+
+        return res
+
+    def window(self, start, end):
+        """Return a read-only view of this TextGrid between two times.
+
+        Unlike `crop()`, no items are copied. Each tier of the returned
+        TextGrid is a view of the range of items in this TextGrid's
+        tier that are between `start` and `end`, found by bisection.
+        See `tgre.window`.
+
+        Parameters
+        ----------
+        start : int or float
+            Start time of the window, in seconds.
+
+        end : int or float
+            End time of the window, in seconds.
+
+        Returns
+        -------
+        TextGrid
+
+        Raises
+        ------
+        ValueError
+            If `end` is not after `start`.
+
+        """
+
+        tiers = [tier.window(start, end) for tier in self.tiers]
+
+        res = self.__class__(max(start, self.xmin), min(end, self.xmax),
+                             tiers)
+        res.rate = self.rate
+
+        return res
+
+    def shift(self, offset):
+        """Add an offset to every time in the TextGrid.
+
+        Parameters
+        ----------
+        offset : int or float
+            Time to add, in seconds. Can be negative.
+
+        Raises
+        ------
+        TypeError
+            If a tier's times can't be changed, such as a packed tier
+            or a window. The TextGrid is left unchanged.
+
+        """
+
+        self._check_times()
+
+        self.xmin += offset
+        self.xmax += offset
+
+        for tier in self.tiers:
+            tier.shift(offset)
+
+    def scale(self, factor):
+        """Multiply every time in the TextGrid by a factor.
+
+        Parameters
+        ----------
+        factor : int or float
+            Positive number to multiply times by.
+
+        Raises
+        ------
+        ValueError
+            If `factor` is not positive.
+
+        TypeError
+            If a tier's times can't be changed, such as a packed tier
+            or a window. The TextGrid is left unchanged.
+
+        """
+
+        if factor <= 0:
+            raise ValueError('Scale factor must be positive')
+
+        self._check_times()
+
+        self.xmin *= factor
+        self.xmax *= factor
+
+        for tier in self.tiers:
+            tier.scale(factor)
+
+    def _check_times(self, ticks_only=False):
+        """Raise TypeError if the times of any tier can't be changed.
+
+        This is checked before any times are changed, so that the
+        TextGrid is never left partly changed. If `ticks_only` is
+        True, only tiers with times stored as ticks are checked.
+
+        """
+
+        for tier in self.tiers:
+            if not ticks_only or tier.rate is not None:
+                tier._check_times()
+
+    @classmethod
+    def concatenate(cls, grids):
+        """Return a new TextGrid with a sequence of TextGrids end to end.
+
+        Each TextGrid is moved to start where the previous one ends,
+        like Praat's "Concatenate" command. The TextGrids should all
+        have the same number of tiers, with the same types, and tiers
+        are combined by their position. The new tiers are named after
+        the tiers in the first TextGrid. Items are copied, in a single
+        pass over each tier.
+
+        Parameters
+        ----------
+        grids : iterable of TextGrid
+
+        Returns
+        -------
+        TextGrid
+
+        Raises
+        ------
+        ValueError
+            If `grids` is empty, or if the TextGrids have different
+            numbers or types of tiers, or different tick rates.
+
+        """
+
+        grids = list(grids)
+
+        if not grids:
+            raise ValueError('No TextGrids to concatenate')
+
+        if len(set(grid.rate for grid in grids)) > 1:
+            raise ValueError('TextGrids have different tick rates')
+
+        first = grids[0]
+        tier_classes = [tier.__class__ for tier in first.tiers]
+        items = [[] for tier in first.tiers]
+        xmax = first.xmin
+
+        for grid in grids:
+            if [tier.__class__ for tier in grid.tiers] != tier_classes:
+                raise ValueError('TextGrids have different tiers')
+
+            offset = xmax - grid.xmin
+
+            for tier, tier_items in zip(grid.tiers, items):
+                tier_items.extend(tier._copy_items(tier, offset))
+
+            xmax = grid.xmax + offset
+
+        tiers = [tier._like(tier.xmin, xmax, tier_items)
+                 for tier, tier_items in zip(first.tiers, items)]
+
+        res = cls(first.xmin, xmax, tiers)
+        res.rate = first.rate
+
+        return res
+
+    def to_ticks(self, rate):
+        """Store the times in this TextGrid as integer ticks.
+
+        Each time is rounded to the nearest tick. Ticks can be compared
+        exactly, so boundaries that are shared between intervals or
+        between tiers are always equal. Once times are stored as ticks,
+        all of the times given to and returned by methods of the
+        TextGrid and its tiers (such as `where()` and `crop()`) are in
+        ticks. Times are converted back to seconds when the TextGrid is
+        written with `to_praat()` or `to_dict()`.
+
+        Parameters
+        ----------
+        rate : int
+            Number of ticks per second, such as the sampling rate of
+            the sound file that the TextGrid annotates. If times are
+            already stored as ticks, they are converted to this rate.
+
+        Raises
+        ------
+        TypeError
+            If a tier's times can't be changed, such as a packed tier
+            or a window. The TextGrid is left unchanged.
+
+        """
+
+        self._check_times()
+
+        factor = rate if self.rate is None else rate / self.rate
+
+        self.xmin = int(round(self.xmin * factor))
+        self.xmax = int(round(self.xmax * factor))
+        self.rate = rate
+
+        for tier in self.tiers:
+            tier.to_ticks(rate)
+
+    def to_seconds(self):
+        """Store the times in this TextGrid in seconds again.
+
+        This reverses `to_ticks()`. Ticks are divided by the rate, so
+        times that were already a whole number of ticks are restored.
+
+        Raises
+        ------
+        TypeError
+            If a tier's times can't be changed, such as a packed tier
+            or a window. The TextGrid is left unchanged.
+
+        """
+
+        self._check_times(ticks_only=True)
+
+        self.xmin, self.xmax = _seconds((self.xmin, self.xmax), self.rate)
+        self.rate = None
+
+        for tier in self.tiers:
+            tier.to_seconds()
+
+    def to_praat(self, path=None, encoding='utf_8'):
+        """Write this TextGrid to a file readable by Praat.
+
+        Parameters
+        ----------
+        path : str
+            Path to the file where this TextGrid should be written. If
+            None, this method returns the TextGrid as a string in a
+            format readable by Praat. If the path ends in '.gz', '.bz2',
+            or '.xz', the file is compressed. Default is None.
+
+        encoding : {'utf_8', 'utf_16'}
+            Text encoding to use for the file. Default is 'utf_8'.
+
+        Returns
+        -------
+        None or str
+            If `path` is None, return this TextGrid object as a string.
+
+        Raises
+        ------
+        ValueError
+            If the TextGrid doesn't conform to the TextGrid standard.
+
+        Notes
+        -----
+        Valid tiers that were read with `TextGrid.from_file()` and
+        haven't been modified since are written exactly as they
+        appeared in the original file (see `Tier.to_praat()`).
+
+        """
+
+        for tier in self.tiers:
+            if tier.xmin < self.xmin:
+                raise ValueError('Tier "{}" starts before TextGrid begins'
+                                 .format(tier.name))
+
+            if tier.xmin > self.xmin:
+                raise ValueError('Tier "{}" starts after TextGrid begins'
+                                 .format(tier.name))
+
+            if tier.xmax > self.xmax:
+                raise ValueError('Tier "{}" continues past end of TextGrid'
+                                 .format(tier.name))
+
+            if tier.xmax < self.xmax:
+                raise ValueError('Tier "{}" ends before end of TextGrid'
+                                 .format(tier.name))
+
+        timer = _timer
+
+        if timer is None:
+            return self._to_praat(path, encoding)
+
+        previous = timer._begin_file(path)
+
+        try:
+            return self._to_praat(path, encoding, timer)
+
+        finally:
+            timer._end_file(previous)
+
+    def _to_praat(self, path, encoding, timer=None):
+        if timer is not None:
+            timer._start('format')
+
+        xmin, xmax = _seconds((self.xmin, self.xmax), self.rate)
+
+        output = ('"ooTextFile"\n"TextGrid"\n'
+                  '{0:.16g} to {1:.16g} seconds <exists>\n'
+                  '{2} tiers\n\n'
+                  .format(xmin, xmax, len(self.tiers)))
+
+        output += '\n\n'.join(tier.to_praat() for tier in self.tiers)
+
+        if timer is not None:
+            timer._stop(size=len(output))
+
+        if path is None:
+            return output
+
+        if timer is not None:
+            timer._start('write')
+
+        _write(path, output, encoding)
+
+        if timer is not None:
+            timer._stop(size=len(output))
+
+
+@functools.total_ordering
+class Interval(object):
+    """An interval in a TextGrid IntervalTier.
+
+    An interval is a sound file annotation with a duration. For
+    example, there might be an interval that marks an [i] vowel
+    from 0.35 seconds to 0.42 seconds of the sound file that is
+    associated with this TextGrid.
+
+    Parameters
+    ----------
+    xmin : int or float
+        Start time of the interval, in seconds.
+
+    xmax : int or float
+        End time of the interval, in seconds.
+
+    text : str
+        Label for the interval, possibly an empty string.
+
+    Attributes
+    ----------
+    xmin
+    xmax
+    text
+
+    """
+
+    plural = 'intervals'
+    fields = ('xmin', 'xmax', 'text')
+
+    def __init__(self, xmin, xmax, text):
+        self.xmin = xmin
+        self.xmax = xmax
+        self.text = text
+
+    def __reduce__(self):
+        return self.__class__, (self.xmin, self.xmax, self.text)
+
+    def __repr__(self):
+        rep = repr(self.xmin), repr(self.xmax), repr(self.text)
+
+        return 'Interval({0}, {1}, {2})'.format(*rep)
+
+    def __str__(self):
         return '<Interval "{0.text}" from {0.xmin} to {0.xmax}>'.format(self)
 
     def __lt__(self, other):
@@ -605,11 +1690,15 @@ class Point(object):
     """
 
     plural = 'points'
+    fields = ('number', 'mark')
 
     def __init__(self, number, mark):
         self.number = number
         self.mark = mark
 
+    def __reduce__(self):
+        return self.__class__, (self.number, self.mark)
+
     def __repr__(self):
         rep = repr(self.number), repr(self.mark)
 
@@ -672,17 +1761,53 @@ class Tier(object):
         self.name = name
         self.xmin = xmin
         self.xmax = xmax
+        self._source = None
+        self._version = 0
+        self._joins = {}
+        self._labels = None
+        self._stats = None
+        self.rate = None
 
         if items is not None:
+            timer = _timer
+
+            if timer is not None:
+                timer._start('sort')
+
             try:
                 self._items = sorted(items)
 
             except AttributeError:
                 raise TypeError('Items cannot be sorted together')
 
+            if timer is not None:
+                timer._stop(len(self._items))
+
         else:
             self._items = []
 
+    def __reduce__(self):
+        """Pickle the tier's items as packed arrays of times and labels.
+
+        The last of the item's `fields` is treated as its label, and
+        the others as times. Labels are stored once each, with an array
+        of codes giving the label of each item. The source text kept by
+        tiers read with `TextGrid.from_file()` is not pickled.
+
+        """
+
+        fields = self.item.fields
+        columns = [_pack_numbers(list(map(operator.attrgetter(field),
+                                          self._items)))
+                   for field in fields[:-1]]
+
+        labels = map(operator.attrgetter(fields[-1]), self._items)
+        vocabulary, codes = _label_codes(labels)
+
+        return _unpickle_tier, (self.__class__, self.name, self.xmin,
+                                self.xmax, columns, vocabulary, codes,
+                                self.rate)
+
     def __repr__(self):
         rep = (self.__class__.__name__, repr(self.name), repr(self.xmin),
                repr(self.xmax), repr(self._items))
@@ -699,7 +1824,23 @@ class Tier(object):
         return self._items[key]
 
     def __delitem__(self, key):
+        size = len(self._items)
+        removed = self._items[key]
         del self._items[key]
+        self._version += 1
+
+        if self._stats is not None:
+            self._stats_remove(removed if isinstance(key, slice)
+                               else [removed])
+
+        if self._labels is None:
+            return
+
+        if isinstance(key, slice):
+            self._labels = None
+            return
+
+        self._index_replace(key + size if key < 0 else key, [removed], [])
 
     def __reversed__(self):
         return reversed(self._items)
@@ -726,6 +1867,12 @@ class Tier(object):
 
         """
 
+        return cls(*cls._read_values(stream))
+
+    @classmethod
+    def _read_values(cls, stream):
+        """Return the name, times, and list of items read from a stream."""
+
         name = next(stream)
         xmin = next(stream)
         xmax = next(stream)
@@ -736,7 +1883,29 @@ class Tier(object):
         for i in range(size):
             items.append(cls.item.from_reader(stream))
 
-        return cls(name, xmin, xmax, items)
+        return name, xmin, xmax, items
+
+    @classmethod
+    def from_dict(cls, tier_dict):
+        """Return a TextGrid tier from its dict representation.
+
+        Parameters
+        ----------
+        tier_dict : dict
+            Dict in the format returned by `to_dict()`. Each item dict
+            is passed as keyword arguments to `cls.item`.
+
+        Returns
+        -------
+        Tier
+
+        """
+
+        item = cls.item
+        items = [item(**values) for values in tier_dict[item.plural]]
+
+        return cls(tier_dict['name'], tier_dict['xmin'], tier_dict['xmax'],
+                   items)
 
     def insert(self, *args, **kwargs):
         """Add a new item (Interval or Point, as appropriate) to the tier.
@@ -746,7 +1915,354 @@ class Tier(object):
 
         """
 
-        bisect.insort(self._items, self.item(*args, **kwargs))
+        item = self.item(*args, **kwargs)
+        idx = bisect.bisect(self._items, item)
+        self._items.insert(idx, item)
+        self._version += 1
+
+        if self._labels is not None:
+            self._index_replace(idx, [], [item])
+
+        if self._stats is not None:
+            self._stats_add([item])
+
+    def _index_replace(self, idx, removed, added):
+        """Update the label index after items are replaced at `idx`.
+
+        `removed` are the items that were at `idx`, and `added` are the
+        items that are there now. Only the labels of those items are
+        looked up, and the later positions of each label are shifted
+        once, however many items were replaced.
+
+        """
+
+        labels = self._labels
+        label = operator.attrgetter(self.item.fields[-1])
+        stop = idx + len(removed)
+        shift = len(added) - len(removed)
+
+        for old in set(map(label, removed)):
+            positions = labels[old]
+            del positions[bisect.bisect_left(positions, idx):
+                          bisect.bisect_left(positions, stop)]
+
+            if not positions:
+                del labels[old]
+
+        if shift:
+            for positions in labels.values():
+                start = bisect.bisect_left(positions, stop)
+
+                if start < len(positions):
+                    positions[start:] = [i + shift
+                                         for i in positions[start:]]
+
+        for i, item in enumerate(added, idx):
+            bisect.insort(labels.setdefault(label(item), []), i)
+
+    def _copy_items(self, items, offset=0):
+        """Return copies of items, with an offset added to their times."""
+
+        fields = self.item.fields
+        values = operator.attrgetter(*fields)
+        copies = []
+
+        for row in map(values, items):
+            args = [time + offset for time in row[:-1]]
+            args.append(row[-1])
+            copies.append(self.item(*args))
+
+        return copies
+
+    def _like(self, xmin, xmax, items):
+        """Return a new tier of the same type and name with other items."""
+
+        tier = self.__class__(self.name, xmin, xmax, items)
+        tier.rate = self.rate
+
+        return tier
+
+    def shift(self, offset):
+        """Add an offset to the times of the tier and all of its items.
+
+        Parameters
+        ----------
+        offset : int or float
+            Time to add, in seconds. Can be negative.
+
+        """
+
+        self._update_times(lambda time: time + offset)
+
+    def scale(self, factor):
+        """Multiply the times of the tier and all of its items by a factor.
+
+        Parameters
+        ----------
+        factor : int or float
+            Positive number to multiply times by.
+
+        Raises
+        ------
+        ValueError
+            If `factor` is not positive.
+
+        """
+
+        if factor <= 0:
+            raise ValueError('Scale factor must be positive')
+
+        self._update_times(lambda time: time * factor)
+
+    def to_ticks(self, rate):
+        """Store the times of the tier and its items as integer ticks.
+
+        See `TextGrid.to_ticks()`.
+
+        Parameters
+        ----------
+        rate : int
+            Number of ticks per second.
+
+        """
+
+        factor = rate if self.rate is None else rate / self.rate
+
+        self._update_times(lambda time: int(round(time * factor)))
+        self.rate = rate
+
+    def to_seconds(self):
+        """Store the times of the tier and its items in seconds again.
+
+        See `TextGrid.to_seconds()`.
+
+        """
+
+        rate = self.rate
+
+        if rate is None:
+            return
+
+        self._update_times(lambda time: time / rate)
+        self.rate = None
+
+    def _seconds(self):
+        """Return a copy of this tier with its times in seconds."""
+
+        tier = self._like(self.xmin, self.xmax, self._copy_items(self._items))
+        tier.to_seconds()
+
+        return tier
+
+    def _replace_items(self, items):
+        """Replace the items of the tier with a new sorted list."""
+
+        self._items = items
+        self._labels = None
+        self._stats = None
+        self._version += 1
+
+    def _edit_items(self):
+        """Return the list of items, to be changed in place."""
+
+        return self._items
+
+    def remove_where(self, predicate):
+        """Remove every item for which a function returns True.
+
+        The items are filtered in a single pass, rather than deleted
+        one at a time.
+
+        Parameters
+        ----------
+        predicate : function
+            Function that takes an item and returns True if it should
+            be removed, such as `lambda item: item.xmax - item.xmin < 0.01`.
+
+        """
+
+        self._replace_items([item for item in self._items
+                             if not predicate(item)])
+
+    def relabel(self, labels):
+        """Change the label of every item with a mapping or function.
+
+        The new label is looked up once for each distinct label. Items
+        whose label changes are replaced with new items, so items shared
+        with other tiers (such as windows) are not changed.
+
+        Parameters
+        ----------
+        labels : dict or function
+            Dict from old labels to new labels, where labels not in the
+            dict are left unchanged, or a function that takes an old
+            label and returns a new label.
+
+        """
+
+        lookup = labels if callable(labels) else (
+            lambda label: labels.get(label, label))
+
+        fields = self.item.fields
+        values = operator.attrgetter(*fields)
+        new_labels = {}
+        items = []
+
+        for item in self._items:
+            row = values(item)
+            label = row[-1]
+
+            try:
+                new_label = new_labels[label]
+
+            except KeyError:
+                new_label = new_labels[label] = lookup(label)
+
+            if new_label != label:
+                args = list(row[:-1])
+                args.append(new_label)
+                item = self.item(*args)
+
+            items.append(item)
+
+        self._replace_items(items)
+
+    def _check_times(self):
+        """Raise TypeError if the times of this tier can't be changed."""
+
+    def _update_times(self, func):
+        self.xmin = func(self.xmin)
+        self.xmax = func(self.xmax)
+
+        for field in self.item.fields[:-1]:
+            for item in self._items:
+                setattr(item, field, func(getattr(item, field)))
+
+        self._stats = None
+        self._version += 1
+
+    def _label_index(self):
+        """Return a dict of the sorted positions of the items with each label.
+
+        The index is built the first time it is needed, and then kept
+        up to date as items are inserted and deleted.
+
+        """
+
+        if self._labels is None:
+            labels = {}
+            label = operator.attrgetter(self.item.fields[-1])
+
+            for i, item in enumerate(self._items):
+                labels.setdefault(label(item), []).append(i)
+
+            self._labels = labels
+
+        return self._labels
+
+    def _duration(self, item):
+        """Return the duration of an item, which is 0 for points."""
+
+        return 0
+
+    def _stats_add(self, items):
+        label = operator.attrgetter(self.item.fields[-1])
+
+        for item in items:
+            self._stats.add(label(item), self._duration(item))
+
+    def _stats_remove(self, items):
+        label = operator.attrgetter(self.item.fields[-1])
+
+        for item in items:
+            self._stats.remove(label(item), self._duration(item))
+
+    def stats(self):
+        """Return the number and total duration of the items with each label.
+
+        The items are counted on the first call, and the counts are then
+        kept up to date as items are inserted and deleted (and, for
+        interval tiers, split, merged, or have their boundaries moved),
+        so later calls take time proportional to the number of distinct
+        labels. Changing an item's times or label directly does not
+        update the counts.
+
+        Returns
+        -------
+        tgre.stats.TierStats
+            A copy of the counts, with durations in seconds.
+
+        """
+
+        from .stats import TierStats
+
+        if self._stats is None:
+            self._stats = TierStats()
+            self._stats_add(self._items)
+
+        stats = self._stats.copy()
+
+        if self.rate is not None:
+            stats.durations = dict((label, duration / self.rate)
+                                   for label, duration
+                                   in stats.durations.items())
+
+        return stats
+
+    def find(self, label):
+        """Return the items in this tier with a given label.
+
+        Items are looked up in an index of the tier's labels, which is
+        built on the first call to `find()` or `search()` and updated
+        when items are inserted or deleted. Changing the label of an
+        item directly does not update the index.
+
+        Parameters
+        ----------
+        label : str
+            Text of the intervals, or mark of the points, to return.
+
+        Returns
+        -------
+        list of Interval or list of Point
+            Matching items, in chronological order.
+
+        """
+
+        positions = self._label_index().get(label, ())
+
+        return [self._items[i] for i in positions]
+
+    def search(self, pattern, flags=0):
+        """Return the items in this tier with labels matching a regex.
+
+        The regex is matched once against each distinct label in the
+        tier, rather than once for each item. See `find()`.
+
+        Parameters
+        ----------
+        pattern : str or compiled regex
+            Pattern to search for in each label, with `re.search()`.
+
+        flags : int
+            Flags for compiling `pattern`, such as `re.IGNORECASE`.
+            Default is 0.
+
+        Returns
+        -------
+        list of Interval or list of Point
+            Matching items, in chronological order.
+
+        """
+
+        regex = re.compile(pattern, flags)
+        matches = [positions
+                   for label, positions in self._label_index().items()
+                   if regex.search(label)]
+
+        positions = sorted(itertools.chain.from_iterable(matches))
+
+        return [self._items[i] for i in positions]
 
     def to_dict(self):
         """Return a dict representation of this Tier.
@@ -757,25 +2273,123 @@ class Tier(object):
 
         """
 
-        res = vars(self).copy()
-        res['class'] = self.__class__.__name__
+        if self.rate is not None:
+            return self._seconds().to_dict()
 
-        items = [vars(item).copy() for item in sorted(res.pop('_items'))]
+        res = {'name': self.name,
+               'xmin': self.xmin,
+               'xmax': self.xmax,
+               'class': self.__class__.__name__}
+
+        items = [vars(item).copy() for item in sorted(self._items)]
         res[self.item.plural] = items
 
         return res
 
+    def to_numpy(self):
+        """Return NumPy arrays of the times and labels in this tier.
+
+        Labels are returned as integer codes into a list of the
+        distinct labels. Values are in the same order as the tier's
+        items, so `tier[i]` corresponds to position `i` in each array.
+        Requires NumPy.
+
+        Use `tgre.packed.PackedIntervalTier.from_numpy()` or
+        `tgre.packed.PackedTextTier.from_numpy()` to make a tier from
+        these arrays, passing the tier's `rate` if it has one.
+
+        Returns
+        -------
+        tuple
+            One float64 array for each time field of the tier's items
+            (`xmin` and `xmax`, or `number`), or int64 arrays if the
+            times are stored as ticks, then an int32 array of label
+            codes, then the list of distinct labels.
+
+        """
+
+        import numpy as np
+
+        fields = self.item.fields
+        dtype = np.float64 if self.rate is None else np.int64
+        columns = tuple(np.fromiter(map(operator.attrgetter(field),
+                                        self._items),
+                                    dtype=dtype, count=len(self._items))
+                        for field in fields[:-1])
+
+        vocabulary, codes = _label_codes(
+            map(operator.attrgetter(fields[-1]), self._items))
+
+        return columns + (np.asarray(codes, dtype=np.int32), vocabulary)
+
+    def _keep_source(self, text, items):
+        """Keep the text that the tier was read from, if it can be copied.
+
+        The text is only kept if `items` (in the order that they were
+        read) is already a valid list of items that `check_items()`
+        would return unchanged, so that copying the text never writes a
+        tier that Praat can't read.
+
+        """
+
+        if self._items != items:
+            return
+
+        try:
+            checked = self.check_items()
+
+        except ValueError:
+            return
+
+        if len(checked) == len(items):
+            self._source = text, self._version, self._state()
+
+    def _state(self):
+        """Return the tier's name, times, and a list of each item field.
+
+        This is compared against the state recorded when the tier was
+        read from a file, to check whether the tier or any of its items
+        has been modified.
+
+        """
+
+        state = [self.name, self.xmin, self.xmax]
+        state.extend(list(map(operator.attrgetter(field), self._items))
+                     for field in self.item.fields)
+
+        return state
+
     def to_praat(self):
         """Return the Tier as text readable by Praat.
 
-        Returns
-        -------
-        str
+        If the tier was read from a file and hasn't been modified since,
+        the text that it was read from is returned unchanged.
+
+        Returns
+        -------
+        str
+
+        """
+
+        if self.rate is not None:
+            return self._seconds().to_praat()
+
+        if self._source is not None:
+            text, version, state = self._source
+
+            if version == self._version and state == self._state():
+                return text
+
+        timer = _timer
 
-        """
+        if timer is not None:
+            timer._start('check_items')
 
         items = self.check_items()
 
+        if timer is not None:
+            timer._stop(len(items))
+
         header = ['{0} named {1} '
                   .format(praat_string(self.__class__.__name__),
                           praat_string(self.name)),
@@ -871,6 +2485,420 @@ class IntervalTier(Tier):
 
         return intervals
 
+    def merge_runs(self):
+        """Merge each run of adjacent intervals that have the same text.
+
+        Intervals are adjacent if one ends at the time when the next
+        one starts. The first interval of each run is kept, and extended
+        to the end of the run. The tier is rebuilt in a single pass.
+
+        """
+
+        items = []
+        prev = None
+
+        for item in self._items:
+            if (prev is not None and prev.text == item.text
+                    and prev.xmax == item.xmin):
+                prev = items[-1] = self.item(prev.xmin, item.xmax, prev.text)
+
+            else:
+                prev = item
+                items.append(item)
+
+        self._replace_items(items)
+
+    def _duration(self, item):
+        return item.xmax - item.xmin
+
+    def move_boundary(self, time, new_time):
+        """Move the boundary at a time, changing the intervals on each side.
+
+        The interval that ends at `time` and the interval that starts
+        at `time` (if either exists) are found by bisection, and both
+        are changed together. The boundary can't be moved past the other
+        boundary of either interval, or into another interval.
+
+        Parameters
+        ----------
+        time : int or float
+            Time of the boundary. This must be equal to the `xmax` or
+            `xmin` of an interval.
+
+        new_time : int or float
+            New time of the boundary.
+
+        Raises
+        ------
+        ValueError
+            If there is no boundary at `time`, or if moving it to
+            `new_time` would make intervals overlap or have no duration.
+
+        """
+
+        items = self._edit_items()
+        idx = bisect.bisect_left(items, self.item(time, time, ''))
+
+        left = items[idx - 1] if idx > 0 else None
+        right = items[idx] if idx < len(items) else None
+
+        if left is not None and left.xmax != time:
+            left = None
+
+        if right is not None and right.xmin != time:
+            right = None
+
+        if left is None and right is None:
+            raise ValueError('No boundary at time {}'.format(time))
+
+        if left is not None:
+            lower = left.xmin
+        elif idx > 0:
+            lower = items[idx - 1].xmax
+        else:
+            lower = self.xmin
+
+        if right is not None:
+            upper = right.xmax
+        elif idx < len(items):
+            upper = items[idx].xmin
+        else:
+            upper = self.xmax
+
+        if not (lower < new_time < upper
+                or left is None and new_time == lower
+                or right is None and new_time == upper):
+            raise ValueError('Cannot move boundary at {} to {}'
+                             .format(time, new_time))
+
+        edited = [item for item in (left, right) if item is not None]
+
+        if self._stats is not None:
+            self._stats_remove(edited)
+
+        if left is not None:
+            left.xmax = new_time
+
+        if right is not None:
+            right.xmin = new_time
+
+        if self._stats is not None:
+            self._stats_add(edited)
+
+        self._version += 1
+
+    def split(self, time, left_text=None, right_text=None):
+        """Split the interval at a time into two intervals.
+
+        Parameters
+        ----------
+        time : int or float
+            Time of the new boundary, which must be inside an interval.
+
+        left_text : str, optional
+            Text of the interval before `time`. Default is None (the
+            text of the interval being split).
+
+        right_text : str, optional
+            Text of the interval after `time`. Default is None (the
+            text of the interval being split).
+
+        Returns
+        -------
+        tuple of (Interval, Interval)
+            The two new intervals.
+
+        Raises
+        ------
+        ValueError
+            If `time` is not inside an interval.
+
+        """
+
+        items = self._edit_items()
+        idx = bisect.bisect(items, self.item(time, time, '')) - 1
+
+        if idx < 0 or not items[idx].xmin < time < items[idx].xmax:
+            raise ValueError('No interval to split at time {}'.format(time))
+
+        old = items[idx]
+        left = self.item(old.xmin, time,
+                         old.text if left_text is None else left_text)
+        right = self.item(time, old.xmax,
+                          old.text if right_text is None else right_text)
+
+        items[idx] = left
+        items.insert(idx + 1, right)
+        self._version += 1
+
+        if self._labels is not None:
+            self._index_replace(idx, [old], [left, right])
+
+        if self._stats is not None:
+            self._stats_remove([old])
+            self._stats_add([left, right])
+
+        return left, right
+
+    def merge(self, i, j, text=None, separator=' '):
+        """Merge the intervals from position `i` to `j` into one interval.
+
+        Parameters
+        ----------
+        i : int
+            Position of the first interval to merge.
+
+        j : int
+            Position of the last interval to merge, after `i`.
+
+        text : str, optional
+            Text of the merged interval. Default is None (the texts of
+            the merged intervals that are not empty, joined by
+            `separator`).
+
+        separator : str
+            String between the texts of the merged intervals, if `text`
+            is None. Default is a single space.
+
+        Returns
+        -------
+        Interval
+            The merged interval.
+
+        Raises
+        ------
+        IndexError
+            If `i` or `j` is not the position of an interval.
+
+        ValueError
+            If `j` is not after `i`.
+
+        """
+
+        items = self._edit_items()
+        i, j = [k + len(items) if k < 0 else k for k in (i, j)]
+
+        if not 0 <= i < len(items) or not 0 <= j < len(items):
+            raise IndexError('Interval position out of range')
+
+        if j <= i:
+            raise ValueError('Cannot merge interval {} into {}'.format(j, i))
+
+        removed = items[i:j + 1]
+
+        if text is None:
+            text = separator.join(item.text for item in removed if item.text)
+
+        merged = self.item(items[i].xmin, items[j].xmax, text)
+
+        if self._stats is not None:
+            self._stats_remove(removed)
+            self._stats_add([merged])
+
+        items[i:j + 1] = [merged]
+        self._version += 1
+
+        if self._labels is not None:
+            self._index_replace(i, removed, [merged])
+
+        return merged
+
+    def _range(self, start, end):
+        """Return the positions of the intervals that overlap two times.
+
+        The intervals are found by bisecting the items with intervals
+        at `start` and `end`, which compare by their `xmin`.
+
+        """
+
+        items = self._items
+        left = bisect.bisect_left(items, self.item(start, start, ''))
+        right = bisect.bisect_left(items, self.item(end, end, ''))
+
+        if left > 0 and items[left - 1].xmax > start:
+            left -= 1
+
+        return left, right
+
+    def window(self, start, end):
+        """Return a read-only view of the intervals between two times.
+
+        See `tgre.window.IntervalTierWindow`.
+
+        Parameters
+        ----------
+        start : int or float
+
+        end : int or float
+
+        Returns
+        -------
+        IntervalTierWindow
+
+        """
+
+        from .window import IntervalTierWindow
+
+        return IntervalTierWindow(self, start, end)
+
+    def crop(self, start, end, preserve_times=True):
+        """Return a new tier with the part of this one between two times.
+
+        The intervals are found by bisection, so this takes time
+        proportional to the log of the number of intervals in the tier
+        plus the number of intervals returned. Intervals that extend
+        past `start` or `end` are cut off at those times. The returned
+        intervals are copies.
+
+        Parameters
+        ----------
+        start : int or float
+            Start time of the part to keep, in seconds.
+
+        end : int or float
+            End time of the part to keep, in seconds.
+
+        preserve_times : bool
+            If False, the new tier starts at 0 rather than at `start`.
+            Default is True.
+
+        Returns
+        -------
+        IntervalTier
+
+        Raises
+        ------
+        ValueError
+            If `end` is not after `start`.
+
+        """
+
+        if end <= start:
+            raise ValueError('Crop end time must be after start time')
+
+        left, right = self._range(start, end)
+        offset = 0 if preserve_times else start
+        intervals = self._copy_items(self._items[left:right], -offset)
+
+        if intervals:
+            intervals[0].xmin = max(intervals[0].xmin, start - offset)
+            intervals[-1].xmax = min(intervals[-1].xmax, end - offset)
+
+        return self._like(max(start, self.xmin) - offset,
+                          min(end, self.xmax) - offset, intervals)
+
+    def join(self, other, mode='contain', tolerance=0):
+        """Return the range of intervals in another tier for each interval.
+
+        For example, if this tier has word intervals and `other` has
+        phone intervals, the result gives the phones in each word.
+        Both tiers are scanned once, together, so this takes time
+        proportional to the total number of intervals. Intervals in
+        each tier should not overlap.
+
+        The result is cached, and reused until either tier has
+        intervals inserted or deleted. Changing the times of intervals
+        directly does not clear the cache.
+
+        Parameters
+        ----------
+        other : IntervalTier
+            Tier with the intervals to match to this tier's intervals.
+
+        mode : {'contain', 'overlap'}
+            If 'contain', match intervals in `other` that are within
+            each interval in this tier. If 'overlap', match intervals
+            in `other` that overlap with each interval in this tier.
+            Default is 'contain'.
+
+        tolerance : int or float
+            In 'contain' mode, intervals in `other` may extend this far
+            past the boundaries of an interval in this tier. In
+            'overlap' mode, intervals must overlap by more than this,
+            so that `min(xmax, other_xmax) - max(xmin, other_xmin)` is
+            greater than `tolerance`, unless they lie entirely within
+            the interval in this tier. Those are always matched, so the
+            matches form a single range. Default is 0.
+
+        Returns
+        -------
+        tuple of tuple of (int, int)
+            For each interval in this tier, the start and stop position
+            of the matching intervals in `other`, so that
+            `other[start:stop]` gives the matching intervals.
+
+        Raises
+        ------
+        ValueError
+            If `mode` is not recognized.
+
+        """
+
+        if mode not in ('contain', 'overlap'):
+            raise ValueError('Join mode "{}" not recognized'.format(mode))
+
+        key = (id(other), mode, tolerance)
+        cached = self._joins.get(key)
+
+        if cached is not None and cached[:3] == (other, self._version,
+                                                 other._version):
+            return cached[3]
+
+        child_xmin = list(map(operator.attrgetter('xmin'), other))
+        child_xmax = list(map(operator.attrgetter('xmax'), other))
+        size = len(child_xmin)
+
+        ranges = []
+        start = stop = 0
+
+        for item in self._items:
+            if mode == 'contain':
+                xmin = item.xmin - tolerance
+                xmax = item.xmax + tolerance
+
+                while start < size and child_xmin[start] < xmin:
+                    start += 1
+
+                stop = max(stop, start)
+
+                while stop < size and child_xmax[stop] <= xmax:
+                    stop += 1
+
+                ranges.append((start, stop))
+
+            else:
+                xmin = item.xmin
+                xmax = item.xmax
+
+                # children skipped here cannot match any later interval
+                while (start < size and child_xmin[start] < xmin and
+                       child_xmax[start] - xmin <= tolerance):
+                    start += 1
+
+                first = None
+                stop = pos = start
+
+                while pos < size and (child_xmin[pos] < xmax or
+                                      child_xmin[pos] == xmax ==
+                                      child_xmax[pos]):
+                    within = (child_xmin[pos] >= xmin and
+                              child_xmax[pos] <= xmax)
+
+                    if within or (min(child_xmax[pos], xmax) -
+                                  max(child_xmin[pos], xmin) > tolerance):
+                        if first is None:
+                            first = pos
+                        stop = pos + 1
+
+                    pos += 1
+
+                ranges.append((start if first is None else first, stop))
+
+        ranges = tuple(ranges)
+        self._joins[key] = (other, self._version, other._version, ranges)
+
+        return ranges
+
     def where(self, time):
         """Return the interval in this tier at a given time.
 
@@ -972,6 +3000,77 @@ class TextTier(Tier):
 
         return sorted(self._items)
 
+    def _range(self, start, end):
+        """Return the positions of the points between two times."""
+
+        items = self._items
+        left = bisect.bisect_left(items, self.item(start, ''))
+        right = bisect.bisect(items, self.item(end, ''))
+
+        return left, right
+
+    def window(self, start, end):
+        """Return a read-only view of the points between two times.
+
+        See `tgre.window.TextTierWindow`.
+
+        Parameters
+        ----------
+        start : int or float
+
+        end : int or float
+
+        Returns
+        -------
+        TextTierWindow
+
+        """
+
+        from .window import TextTierWindow
+
+        return TextTierWindow(self, start, end)
+
+    def crop(self, start, end, preserve_times=True):
+        """Return a new tier with the points between two times (inclusive).
+
+        The points are found by bisection, so this takes time
+        proportional to the log of the number of points in the tier
+        plus the number of points returned. The returned points are
+        copies.
+
+        Parameters
+        ----------
+        start : int or float
+            Start time of the part to keep, in seconds.
+
+        end : int or float
+            End time of the part to keep, in seconds.
+
+        preserve_times : bool
+            If False, the new tier starts at 0 rather than at `start`.
+            Default is True.
+
+        Returns
+        -------
+        TextTier
+
+        Raises
+        ------
+        ValueError
+            If `end` is not after `start`.
+
+        """
+
+        if end <= start:
+            raise ValueError('Crop end time must be after start time')
+
+        left, right = self._range(start, end)
+        offset = 0 if preserve_times else start
+        points = self._copy_items(self._items[left:right], -offset)
+
+        return self._like(max(start, self.xmin) - offset,
+                          min(end, self.xmax) - offset, points)
+
     def where(self, left, right=None):
         """Return the point(s) in this tier at or between the given time(s).
 
@@ -1013,3 +3112,111 @@ class TextTier(Tier):
             return self._items[left_idx]
 
         return None
+
+    def nearest(self, time):
+        """Return the point in this tier nearest to a given time.
+
+        The point is found by bisection, so this takes time proportional
+        to the log of the number of points in the tier. If two points
+        are equally near, the earlier one is returned.
+
+        Parameters
+        ----------
+        time : int or float
+
+        Returns
+        -------
+        Point or None
+            None if the tier has no points.
+
+        """
+
+        points = self.nearest_k(time, 1)
+
+        if points:
+            return points[0]
+
+        return None
+
+    def nearest_k(self, time, k):
+        """Return the `k` points in this tier nearest to a given time.
+
+        Points are found by bisecting to `time` and then moving outwards
+        one point at a time, so this takes time proportional to the log
+        of the number of points in the tier plus `k`.
+
+        Parameters
+        ----------
+        time : int or float
+
+        k : int
+            Number of points to return. If the tier has fewer than `k`
+            points, all of them are returned.
+
+        Returns
+        -------
+        list of Point
+            Points in order of their distance from `time`, nearest
+            first. If two points are equally near, the earlier one is
+            first.
+
+        """
+
+        items = self._items
+        right = bisect.bisect_left(items, self.item(time, ''))
+        left = right - 1
+        points = []
+
+        while len(points) < k:
+            if left < 0 and right >= len(items):
+                break
+
+            if (right >= len(items) or left >= 0
+                    and time - items[left].number
+                    <= items[right].number - time):
+                points.append(items[left])
+                left -= 1
+
+            else:
+                points.append(items[right])
+                right += 1
+
+        return points
+
+    def nearest_positions(self, times):
+        """Return the positions of the points nearest to each of some times.
+
+        The times are matched to the points all at once with
+        `numpy.searchsorted()`, after reading the points' times with
+        `to_numpy()`. If two points are equally near a time, the
+        earlier one is used. Requires NumPy.
+
+        Parameters
+        ----------
+        times : array_like of int or float
+
+        Returns
+        -------
+        array of int64
+            Position in the tier of the point nearest to each time, so
+            `tier[i]` is the point for position `i`. Every position is
+            -1 if the tier has no points.
+
+        """
+
+        import numpy as np
+
+        numbers = self.to_numpy()[0]
+        times = np.asarray(times)
+
+        if not len(numbers):
+            return np.full(times.shape, -1, dtype=np.int64)
+
+        right = np.searchsorted(numbers, times, side='left')
+        right = np.minimum(right, len(numbers) - 1).astype(np.int64)
+        left = np.maximum(right - 1, 0)
+
+        use_left = (np.abs(times - numbers[left])
+                    <= np.abs(numbers[right] - times))
+
+        return np.where(use_left, left, right)
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+"""Time the phases of reading and writing TextGrids.
+
+Inside a `PhaseTimer` context, reading and writing TextGrids records
+the time spent in each phase of the work, with the number of items
+handled and the size of the text, for each file:
+
+- 'decode': reading and decoding the file (or decompressing and
+  decoding bytes), with the number of characters decoded, so that it
+  can be compared with the size of the 'tokenize' phase.
+- 'tokenize': splitting the text into strings and numbers with
+  `praat_reader()`, with the number of values and characters. Files
+  read with `keep_source=False` are also read and decoded in this
+  phase, and their size is not counted.
+- 'construct': making the TextGrid, tiers, and items from the values,
+  with the number of items.
+- 'sort': sorting items when a tier is made, with the number of items.
+- 'check_items': checking the items of each tier before it is written
+  with `to_praat()`, with the number of items.
+- 'format': making the text of `to_praat()`, with its length.
+- 'write': encoding the text and writing it to a file, with its length.
+
+Times are exclusive: the time spent sorting while the tiers are made is
+counted in 'sort' and not in 'construct'. While a timer is active, the
+values of each file are tokenized all at once before the TextGrid is
+made, so that the two phases can be timed apart; this holds all of the
+values in memory at once. Outside of a timer, the only cost is a check
+at the start of each phase. Timers record the work of the thread that
+is using them, and should not be used by several threads at once.
+
+>>> import tgre
+>>> from tgre.timing import PhaseTimer
+>>> with PhaseTimer() as timer:
+...     tg = tgre.TextGrid.from_file('test/files/usage-example.TextGrid')
+...     text = tg.to_praat()
+>>> sorted(timer.totals())
+['construct', 'decode', 'format', 'sort', 'tokenize']
+>>> timer.totals()['construct']['items']
+8
+
+A `callback` can also be given, which is called with each record as it
+is made, such as to send timings to a monitoring system.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import timeit
+
+from . import tgre
+
+
+PHASES = ['decode', 'tokenize', 'construct', 'sort', 'check_items',
+          'format', 'write']
+
+
+PhaseRecord = collections.namedtuple('PhaseRecord', ['file', 'phase',
+                                                     'seconds', 'items',
+                                                     'size'])
+
+
+class PhaseTimer(object):
+    """Context manager that records the time spent in each phase.
+
+    Parameters
+    ----------
+    callback : function, optional
+        Function called with each `PhaseRecord` as it is recorded.
+
+    Attributes
+    ----------
+    records : list of PhaseRecord
+        Each phase that was timed, in order, with the file that it
+        belongs to (or None, for TextGrids that aren't read from or
+        written to a named file), its exclusive time in seconds, the
+        number of items or values handled, and the size of the text
+        or data.
+
+    """
+
+    def __init__(self, callback=None):
+        self.records = []
+        self.callback = callback
+        self._previous = None
+        self._file = None
+        self._stack = []
+
+    def __enter__(self):
+        self._previous = tgre._timer
+        tgre._timer = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        tgre._timer = self._previous
+        self._previous = None
+
+    def _begin_file(self, name):
+        """Set the file that following phases belong to."""
+
+        previous = self._file, self._stack
+        self._file = name
+        self._stack = []
+
+        return previous
+
+    def _end_file(self, previous):
+        """Restore the file (and phases) from before `_begin_file()`."""
+
+        self._file, self._stack = previous
+
+    def _start(self, phase):
+        self._stack.append([phase, timeit.default_timer(), 0])
+
+    def _stop(self, items=0, size=0):
+        end = timeit.default_timer()
+        phase, start, nested = self._stack.pop()
+        elapsed = end - start
+
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+        record = PhaseRecord(self._file, phase, elapsed - nested, items, size)
+        self.records.append(record)
+
+        if self.callback is not None:
+            self.callback(record)
+
+    def totals(self):
+        """Return the total time, items, and size of each phase.
+
+        Returns
+        -------
+        dict
+            For each phase that was timed, a dict with the number of
+            times it was timed ('calls'), and the total 'seconds',
+            'items', and 'size'.
+
+        """
+
+        totals = {}
+
+        for record in self.records:
+            total = totals.setdefault(record.phase, {'calls': 0,
+                                                     'seconds': 0,
+                                                     'items': 0,
+                                                     'size': 0})
+            total['calls'] += 1
+            total['seconds'] += record.seconds
+            total['items'] += record.items
+            total['size'] += record.size
+
+        return totals
+
+    def files(self):
+        """Return the total time spent in each phase for each file.
+
+        Returns
+        -------
+        dict
+            Dict from each file name (or None) to a dict of the total
+            seconds for each phase.
+
+        """
+
+        files = {}
+
+        for record in self.records:
+            phases = files.setdefault(record.file, {})
+            phases[record.phase] = phases.get(record.phase, 0) + record.seconds
+
+        return files
+
+    def report(self):
+        """Return a table of the totals for each phase, as a string."""
+
+        totals = self.totals()
+        seconds = sum(total['seconds'] for total in totals.values())
+        lines = ['{:<12} {:>8} {:>10} {:>6} {:>10} {:>12} {:>12}'
+                 .format('phase', 'calls', 'ms', '%', 'items', 'size',
+                         'items/s')]
+
+        for phase in PHASES:
+            if phase not in totals:
+                continue
+
+            total = totals[phase]
+            rate = (total['items'] / total['seconds']
+                    if total['seconds'] else 0)
+
+            lines.append('{:<12} {:>8} {:>10.2f} {:>6.1f} {:>10} {:>12} '
+                         '{:>12.0f}'
+                         .format(phase, total['calls'],
+                                 total['seconds'] * 1000,
+                                 100 * total['seconds'] / (seconds or 1),
+                                 total['items'], total['size'], rate))
+
+        return '\n'.join(lines)
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+
+"""Read-only views of the items in a tier between two times.
+
+A window refers to a range of positions in another tier's items, found
+by bisection when the window is created, so making a window takes time
+proportional to the log of the number of items in the tier, and no
+items are copied. Windows support indexing, iteration, `len()`,
+`where()`, `find()`, `to_dict()`, and `to_praat()` like other tiers,
+but items can't be inserted or deleted, and times can't be changed.
+
+Items in a window are the same objects as in the tier it views, so
+intervals at the edges of an interval tier window may start before or
+end after the window. They are only cut off at the window's edges when
+the window is written with `to_praat()` or `to_dict()`, or pickled.
+Windows should not be used after items are inserted into or deleted from
+the tier they view.
+
+>>> import tgre
+>>> tg = tgre.TextGrid.from_file('test/files/usage-example.TextGrid')
+>>> window = tg.window(1, 1.25)
+>>> print(window[1])
+<IntervalTierWindow "Sam" from 1 to 1.25 seconds with 2 intervals>
+>>> print(window[1].where(1.2))
+<Interval "ciao" from 1.125 to 1.45>
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import bisect
+
+from .tgre import IntervalTier, TextTier, Tier
+
+
+class ItemRange(object):
+    """Sequence of the items between two positions in another sequence.
+
+    Parameters
+    ----------
+    items : sequence
+        Items of the tier being viewed.
+
+    start : int
+        Position of the first item in the range.
+
+    stop : int
+        Position after the last item in the range.
+
+    """
+
+    def __init__(self, items, start, stop):
+        self.items = items
+        self.start = start
+        self.stop = stop
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+
+        if key < 0:
+            key += len(self)
+
+        if not 0 <= key < len(self):
+            raise IndexError('Item position out of range')
+
+        return self.items[self.start + key]
+
+    def __iter__(self):
+        return map(self.items.__getitem__, range(self.start, self.stop))
+
+    def __reversed__(self):
+        for i in range(self.stop - 1, self.start - 1, -1):
+            yield self.items[i]
+
+
+class TierWindow(Tier):
+    """Base class for IntervalTierWindow and TextTierWindow.
+
+    Parameters
+    ----------
+    tier : IntervalTier or TextTier
+        Tier to view. If this is also a window, the new window views
+        the same tier as it does.
+
+    start : int or float
+        Start time of the window, in seconds.
+
+    end : int or float
+        End time of the window, in seconds.
+
+    Attributes
+    ----------
+    name
+    xmin
+    xmax
+    tier
+        The tier being viewed.
+
+    """
+
+    def __init__(self, tier, start, end):
+        if end <= start:
+            raise ValueError('Window end time must be after start time')
+
+        if isinstance(tier, TierWindow):
+            start = max(start, tier.xmin)
+            end = min(end, tier.xmax)
+            tier = tier.tier
+
+        Tier.__init__(self, tier.name, max(start, tier.xmin),
+                      min(end, tier.xmax))
+
+        self.tier = tier
+        self.rate = tier.rate
+        self._items = ItemRange(tier._items, *tier._range(start, end))
+
+    def __reduce__(self):
+        return self._copy().__reduce__()
+
+    def __delitem__(self, key):
+        raise TypeError('{} does not support item deletion'
+                        .format(self.__class__.__name__))
+
+    def insert(self, *args, **kwargs):
+        raise TypeError('{} does not support item insertion'
+                        .format(self.__class__.__name__))
+
+    def _check_times(self):
+        raise TypeError('{} does not support changing times'
+                        .format(self.__class__.__name__))
+
+    def _update_times(self, func):
+        self._check_times()
+
+    def _replace_items(self, items):
+        raise TypeError('{} does not support changing items'
+                        .format(self.__class__.__name__))
+
+    def _edit_items(self):
+        raise TypeError('{} does not support changing items'
+                        .format(self.__class__.__name__))
+
+    def _like(self, xmin, xmax, items):
+        tier = self.base(self.name, xmin, xmax, items)
+        tier.rate = self.rate
+
+        return tier
+
+    def _clipped(self):
+        """Return a list of the items, cut off at the window's edges."""
+
+        return list(self._items)
+
+    def _copy(self):
+        """Return a tier of the viewed type with the clipped items."""
+
+        return self._like(self.xmin, self.xmax, self._clipped())
+
+    def check_items(self):
+        return self._copy().check_items()
+
+    def stats(self):
+        return self._copy().stats()
+
+    def to_dict(self):
+        """Return a dict representation of the viewed tier's type."""
+
+        return self._copy().to_dict()
+
+    def to_praat(self):
+        """Return the window as text readable by Praat, like its tier."""
+
+        return self._copy().to_praat()
+
+
+class IntervalTierWindow(TierWindow, IntervalTier):
+    """Read-only view of the intervals in a tier between two times.
+
+    See `TierWindow` for parameters.
+
+    """
+
+    base = IntervalTier
+
+    def _clipped(self):
+        items = list(self._items)
+
+        if items and items[0].xmin < self.xmin:
+            items[0] = self.item(self.xmin, items[0].xmax, items[0].text)
+
+        if items and items[-1].xmax > self.xmax:
+            items[-1] = self.item(items[-1].xmin, self.xmax, items[-1].text)
+
+        return items
+
+    def where(self, time):
+        """Return the interval in this window at a given time.
+
+        See `IntervalTier.where()`. The interval is found by bisecting
+        the window's range of the viewed tier's items.
+
+        """
+
+        if not self.xmin <= time < self.xmax:
+            return None
+
+        items = self._items
+        idx = bisect.bisect(items.items, self.item(time, time, ''),
+                            items.start, items.stop)
+
+        if idx > items.start and items.items[idx - 1].xmax > time:
+            return items.items[idx - 1]
+
+        return None
+
+
+class TextTierWindow(TierWindow, TextTier):
+    """Read-only view of the points in a tier between two times.
+
+    See `TierWindow` for parameters.
+
+    """
+
+    base = TextTier
+
+    def where(self, left, right=None):
+        """Return the point(s) in this window at or between the given time(s).
+
+        See `TextTier.where()`. Points are found by bisecting the
+        window's range of the viewed tier's items.
+
+        """
+
+        items = self._items
+        left_idx = bisect.bisect_left(items.items, self.item(left, ''),
+                                      items.start, items.stop)
+
+        if right is not None:
+            right_idx = bisect.bisect(items.items, self.item(right, ''),
+                                      items.start, items.stop)
+            return items.items[left_idx:right_idx]
+
+        if left_idx < items.stop and items.items[left_idx].number == left:
+            return items.items[left_idx]
+
+        return None